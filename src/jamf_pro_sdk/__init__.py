@@ -1,7 +1,9 @@
 from .__about__ import __title__, __version__
 from .clients import JamfProClient
+from .clients.aio import AsyncJamfProClient
 from .clients.auth import (
     ApiClientCredentialsProvider,
+    PooledCredentialsProvider,
     UserCredentialsProvider,
     load_from_aws_secrets_manager,
     load_from_keychain,
@@ -14,7 +16,9 @@ __all__ = [
     "__title__",
     "__version__",
     "JamfProClient",
+    "AsyncJamfProClient",
     "ApiClientCredentialsProvider",
+    "PooledCredentialsProvider",
     "UserCredentialsProvider",
     "load_from_aws_secrets_manager",
     "load_from_keychain",
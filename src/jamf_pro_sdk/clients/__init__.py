@@ -1,8 +1,24 @@
+import collections
 import concurrent.futures
+import functools
 import logging
 import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, Optional, Type, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Type,
+    Union,
+)
 from urllib.parse import urlunparse
 
 import certifi
@@ -17,6 +33,11 @@ from ..clients.pro_api import ProApi
 from ..models.classic import ClassicApiModel
 from ..models.client import SessionConfig
 from .auth import CredentialsProvider
+from .cache import ResponseCache
+from .concurrency import AdaptiveConcurrencyLimiter, RequestCoalescer
+from .decoders import JsonDecoder
+from .ratelimit import FileTokenBucketRateLimiter, RateLimiter, TokenBucketRateLimiter
+from .retry import RetryHandler
 
 logger = logging.getLogger("jamf_pro_sdk")
 
@@ -67,14 +88,67 @@ class JamfProClient:
 
         self.session = self._setup_session()
 
-        self.classic_api = ClassicApi(self.classic_api_request, self.concurrent_api_requests)
-        self.pro_api = ProApi(self.pro_api_request, self.concurrent_api_requests)
+        self.rate_limiter: Optional[RateLimiter] = self._setup_rate_limiter(self.session_config)
+
+        self.response_cache: Optional[ResponseCache] = (
+            ResponseCache(
+                self.session_config.response_cache,
+                server=self.base_server_url,
+                identity=self._credentials.identity,
+            )
+            if self.session_config.response_cache
+            else None
+        )
+
+        self.request_coalescer: Optional[RequestCoalescer] = (
+            RequestCoalescer() if self.session_config.coalesce_requests else None
+        )
+
+        self.retry_handler: Optional[RetryHandler] = (
+            RetryHandler(self.session_config.retry_policy)
+            if self.session_config.retry_policy
+            else None
+        )
+
+        self.concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = (
+            AdaptiveConcurrencyLimiter(max_limit=self.session_config.max_concurrency)
+            if self.session_config.adaptive_concurrency
+            else None
+        )
+
+        # Counts the attempts reported to the concurrency limiter by the running limited handler
+        self._limited_attempts = threading.local()
+
+        self.json_decoder = JsonDecoder(self.session_config.json_backend)
+
+        self.classic_api = ClassicApi(
+            self.classic_api_request, self.concurrent_api_requests, self.json_decoder
+        )
+        self.pro_api = ProApi(self.pro_api_request, self.concurrent_api_requests, self.json_decoder)
 
         try:
-            self.jcds2 = JCDS2(self.classic_api, self.pro_api, self.concurrent_api_requests)
+            self.jcds2 = JCDS2(
+                self.classic_api,
+                self.pro_api,
+                self.concurrent_api_requests,
+                retry_handler=self.retry_handler,
+            )
         except ImportError:
             pass
 
+    def __enter__(self) -> "JamfProClient":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the client's HTTP session and release the resources of the credentials provider
+        (e.g. stop a background token refresh thread).
+        """
+        self._credentials.close()
+        self.session.close()
+
     @staticmethod
     def _parse_cookie_file(cookie_file: Union[str, Path]) -> dict[str, str]:
         """Parse a cookies file and return a dictionary of key value pairs."""
@@ -133,6 +207,21 @@ class JamfProClient:
 
         return session
 
+    @staticmethod
+    def _setup_rate_limiter(session_config: SessionConfig) -> Optional[RateLimiter]:
+        if not session_config.rate_limit:
+            return None
+        elif session_config.rate_limit_file:
+            return FileTokenBucketRateLimiter(
+                path=session_config.rate_limit_file,
+                rate=session_config.rate_limit,
+                burst=session_config.rate_limit_burst,
+            )
+        else:
+            return TokenBucketRateLimiter(
+                rate=session_config.rate_limit, burst=session_config.rate_limit_burst
+            )
+
     def classic_api_request(
         self,
         method: str,
@@ -167,7 +256,7 @@ class JamfProClient:
         capi_req = {
             "method": method,
             "url": f"{self.base_server_url}/JSSResource/{resource_path}",
-            "headers": {"Authorization": f"Bearer {self._credentials.get_access_token()}"},
+            "headers": {},
             "timeout": self.session_config.timeout,
         }
 
@@ -178,16 +267,16 @@ class JamfProClient:
             capi_req["headers"]["Content-Type"] = "text/xml"
             capi_req["data"] = data if isinstance(data, str) else data.xml(exclude_read_only=True)
 
-        with self.session.request(**capi_req) as capi_resp:
-            logger.info("ClassicAPIRequest %s %s", method.upper(), resource_path)
-            try:
-                capi_resp.raise_for_status()
-            except requests.HTTPError:
-                # TODO: XML error response parser
-                logger.error(capi_resp.text)
-                raise
+        capi_resp = self._send_request(capi_req)
+        logger.info("ClassicAPIRequest %s %s", method.upper(), resource_path)
+        try:
+            capi_resp.raise_for_status()
+        except requests.HTTPError:
+            # TODO: XML error response parser
+            logger.error(capi_resp.text)
+            raise
 
-            return capi_resp
+        return capi_resp
 
     def pro_api_request(
         self,
@@ -232,7 +321,7 @@ class JamfProClient:
         pro_req = {
             "method": method,
             "url": f"{self.base_server_url}/api/{resource_path}",
-            "headers": {"Authorization": f"Bearer {self._credentials.get_access_token()}"},
+            "headers": {},
             "timeout": self.session_config.timeout,
         }
 
@@ -254,15 +343,88 @@ class JamfProClient:
         if files and (method.lower() == "post"):
             pro_req["files"] = files
 
-        with self.session.request(**pro_req) as pro_resp:
-            logger.info("ProAPIRequest %s %s", method.upper(), resource_path)
+        pro_resp = self._send_request(pro_req)
+        logger.info("ProAPIRequest %s %s", method.upper(), resource_path)
+        try:
+            pro_resp.raise_for_status()
+        except requests.HTTPError:
+            logger.error(pro_resp.text)
+            raise
+
+        return pro_resp
+
+    def _send_request(self, request: Dict[str, Any]) -> requests.Response:
+        """Send a request with the client session. If the client has a ``response_cache``,
+        ``GET`` requests are served from it and other requests remove the cached responses of the
+        resource they change. If the client has a ``request_coalescer``, identical ``GET``
+        requests that are in flight at the same time are sent once.
+        """
+        if request["method"].upper() != "GET":
+            if not self.response_cache:
+                return self._send_uncached_request(request)
             try:
-                pro_resp.raise_for_status()
-            except requests.HTTPError:
-                logger.error(pro_resp.text)
+                return self._send_uncached_request(request)
+            finally:
+                self.response_cache.invalidate(request["url"])
+
+        send = self._send_uncached_request
+        if self.response_cache:
+            send = functools.partial(self.response_cache.fetch, send=self._send_uncached_request)
+
+        if self.request_coalescer:
+            return self.request_coalescer.call(self._request_key(request), lambda: send(request))
+        return send(request)
+
+    @staticmethod
+    def _request_key(request: Dict[str, Any]) -> tuple:
+        url = requests.Request("GET", request["url"], params=request.get("params")).prepare().url
+        return url, tuple(sorted(request["headers"].items()))
+
+    def _send_uncached_request(self, request: Dict[str, Any]) -> requests.Response:
+        """Send a request with the client session. A current access token is set on every attempt.
+        If the session config has a ``retry_policy`` failed attempts are retried. Every attempt
+        waits on the client's ``rate_limiter`` if one is set, and is reported to the client's
+        ``concurrency_limiter`` when sent from a concurrent operation.
+        """
+
+        def send() -> requests.Response:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            access_token = self._credentials.get_access_token()
+            request["headers"]["Authorization"] = f"Bearer {access_token}"
+            started = time.monotonic()
+            try:
+                with self.session.request(**request) as resp:
+                    if resp.status_code == 429:
+                        self._credentials.report_throttled(access_token)
+                    elif resp.status_code == 401:
+                        self._credentials.report_unauthorized(access_token)
+            except Exception:
+                self._observe_attempt(started, None)
                 raise
+            self._observe_attempt(started, resp)
+            return resp
+
+        if not self.retry_handler:
+            return send()
+
+        file_positions = [
+            (f[1], f[1].tell()) for f in request.get("files", {}).values() if f[1].seekable()
+        ]
+
+        def rewind_files():
+            for file_obj, position in file_positions:
+                file_obj.seek(position)
+
+        return self.retry_handler.call(send, method=request["method"], before_retry=rewind_files)
 
-            return pro_resp
+    def _observe_attempt(self, started: float, response: Optional[requests.Response]):
+        """Report one attempt of a request sent by a limited handler to the concurrency limiter."""
+        if getattr(self._limited_attempts, "count", None) is None:
+            return
+        self._limited_attempts.count += 1
+        if response is not None:
+            self.concurrency_limiter.observe(started, response, release=False)
 
     def concurrent_api_requests(
         self,
@@ -271,9 +433,16 @@ class JamfProClient:
         return_model: Optional[Type[BaseModel]] = None,
         max_concurrency: Optional[int] = None,
         return_exceptions: Optional[bool] = None,
+        ordered: bool = True,
+        max_in_flight: Optional[int] = None,
     ) -> Iterator[Union[Any, Exception]]:
         """An interface for performing concurrent API operations.
 
+        Results are streamed: each result is yielded as soon as it is available instead of after
+        all operations have finished. The ``arguments`` are read lazily and at most
+        ``max_concurrency * session_config.max_in_flight_factor`` operations (or ``max_in_flight``)
+        are pending at once.
+
         :param handler: The method that will be called.
         :type handler: Callable
 
@@ -298,6 +467,15 @@ class JamfProClient:
             used.
         :type return_exceptions: bool
 
+        :param ordered: If ``True`` (the default) results are yielded in the same order as the
+            ``arguments``. Set to ``False`` to yield each result the moment its operation completes.
+        :type ordered: bool
+
+        :param max_in_flight: (optional) An override for the number of operations that may be
+            pending at once. In ordered mode this is how far ahead of the consumer operations run.
+            Must be at least ``1``.
+        :type max_in_flight: int
+
         :return: An iterator that will yield the result for each operation.
         :rtype: Iterator
 
@@ -310,34 +488,121 @@ class JamfProClient:
         else:
             max_concurrency = self.session_config.max_concurrency
 
+        # Arguments are consumed lazily and only a bounded number of operations are submitted to
+        # the executor at any time, so large or unbounded iterables do not materialize as futures
+        if max_in_flight is None:
+            max_in_flight = max_concurrency * self.session_config.max_in_flight_factor
+        elif max_in_flight < 1:
+            raise ValueError("'max_in_flight' must be at least 1")
+
+        if self.concurrency_limiter:
+            handler = self._limit_concurrency(handler)
+        arguments = iter(arguments)
+        in_flight: Union[Deque[concurrent.futures.Future], Set[concurrent.futures.Future]]
+        in_flight = collections.deque() if ordered else set()
+
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
             logger.info("ConcurrentAPIRequest %s ", handler.__name__)
-            executor_results = list()
-            for i in arguments:
+
+            def submit_next() -> bool:
+                try:
+                    i = next(arguments)
+                except StopIteration:
+                    return False
+
                 if isinstance(i, dict):
-                    executor_results.append(executor.submit(handler, **i))
+                    future = executor.submit(handler, **i)
                 else:
-                    executor_results.append(executor.submit(handler, i))
+                    future = executor.submit(handler, i)
 
-            concurrent.futures.wait(executor_results)
+                if ordered:
+                    in_flight.append(future)
+                else:
+                    in_flight.add(future)
+                return True
 
-        for result in executor_results:
             try:
-                response = result.result()
-                if isinstance(response, BaseModel):
-                    yield response
-                elif isinstance(response, requests.Response) and return_model:
-                    response_data = (
-                        response.json()[return_model._xml_root_name]
-                        if hasattr(return_model, "_xml_root_name")
-                        else response.json()
-                    )
-                    yield return_model.model_validate(response_data)
-                else:
-                    yield response
-            except Exception as err:
-                logger.warning(err)
-                if return_exceptions:
-                    yield err
+                arguments_exhausted = False
+                while True:
+                    while not arguments_exhausted and len(in_flight) < max_in_flight:
+                        arguments_exhausted = not submit_next()
+
+                    if not in_flight:
+                        break
+
+                    if ordered:
+                        completed = [in_flight.popleft()]
+                    else:
+                        completed, _ = concurrent.futures.wait(
+                            in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                        )
+                        in_flight.difference_update(completed)
+
+                    for result in completed:
+                        try:
+                            yield self._parse_concurrent_result(result, return_model)
+                        except Exception as err:
+                            logger.warning(err)
+                            if return_exceptions:
+                                yield err
+            except GeneratorExit:
+                # The consumer stopped iterating: do not wait on operations that have not started
+                for result in in_flight:
+                    result.cancel()
+                raise
+
+    def _limit_concurrency(self, handler: Callable) -> Callable:
+        """Wrap a handler so each call holds a slot from the adaptive concurrency limiter and
+        reports its latency and throttling back to it. Requests the handler sends through the
+        client report every attempt (see ``_send_uncached_request``), so throttled attempts that
+        are retried still lower the limit and the wait between attempts is not counted as
+        latency. The outcome of a handler that sent no requests through the client is reported
+        when it returns.
+        """
+        limiter = self.concurrency_limiter
+        attempts = self._limited_attempts
+
+        @functools.wraps(handler)
+        def limited_handler(*args, **kwargs):
+            response = None
+            failed = False
+            attempts.count = 0
+            started = limiter.acquire()
+            try:
+                response = handler(*args, **kwargs)
+                return response
+            except requests.HTTPError as err:
+                response = err.response
+                raise
+            except Exception:
+                failed = True
+                raise
+            finally:
+                reported, attempts.count = attempts.count, None
+                if failed or reported:
+                    # Failures without a response are not a useful latency sample
+                    limiter.release(started, record=False)
                 else:
-                    continue
+                    limiter.observe(
+                        started, response if isinstance(response, requests.Response) else None
+                    )
+
+        return limited_handler
+
+    def _parse_concurrent_result(
+        self, result: concurrent.futures.Future, return_model: Optional[Type[BaseModel]] = None
+    ) -> Any:
+        """Return the result of a completed operation, parsed into the ``return_model`` if the
+        handler returned a response object.
+        """
+        response = result.result()
+        if isinstance(response, BaseModel):
+            return response
+        elif isinstance(response, requests.Response) and return_model:
+            # Classic API models are nested under their root name (a private model attribute)
+            root = return_model.__private_attributes__.get("_xml_root_name")
+            return self.json_decoder.validate(
+                return_model, response.content, root=root.default if root else None
+            )
+        else:
+            return response
@@ -0,0 +1,438 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+import ssl
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Optional,
+    Set,
+    Type,
+    Union,
+)
+from urllib.parse import urlunparse
+
+import certifi
+import requests
+import requests.adapters
+from pydantic import BaseModel
+from requests.utils import cookiejar_from_dict
+
+try:
+    import httpx
+except ImportError:
+    HTTPX_IS_INSTALLED = False
+    httpx = None
+else:
+    HTTPX_IS_INSTALLED = True
+
+from ...models.classic import ClassicApiModel
+from ...models.client import AccessToken, SessionConfig
+from .. import JamfProClient
+from ..auth import CredentialsProvider
+from ..decoders import JsonDecoder
+from ..ratelimit import RateLimiter
+from ..retry import RetryHandler
+from .classic_api import AsyncClassicApi
+from .pro_api import AsyncProApi
+
+logger = logging.getLogger("jamf_pro_sdk")
+
+
+class AsyncJamfProClient:
+    def __init__(
+        self,
+        server: str,
+        credentials: CredentialsProvider,
+        port: int = 443,
+        session_config: Optional[SessionConfig] = None,
+    ):
+        """The ``asyncio`` counterpart of :class:`~jamf_pro_sdk.clients.JamfProClient`.
+
+        Async Classic API and Pro API clients are instantiated with the base client. Requests are
+        sent with an ``httpx.AsyncClient`` so concurrent operations run as coroutines instead of
+        threads. The client should be closed with :meth:`aclose`, or used as an async context
+        manager.
+
+        Access tokens are managed by the same credentials providers as the synchronous client.
+
+        The ``retry_policy`` and rate limit options of the ``session_config`` are applied to every
+        request. The ``adaptive_concurrency``, ``response_cache`` and ``coalesce_requests``
+        options are only supported by the synchronous client and are ignored with a warning.
+
+        .. important::
+
+            This client requires the ``async`` extra dependency.
+
+        :param server: The hostname of the Jamf Pro server to connect to.
+        :type server: str
+
+        :param credentials: Accepts any credentials provider object to provide the
+            username and password for initial authentication.
+        :type credentials: CredentialsProvider
+
+        :param port: The server port to connect over (defaults to `443`).
+        :type port: int
+
+        :param session_config: Pass a `SessionConfig` to configure session options.
+        :type session_config: SessionConfig
+        """
+        if not HTTPX_IS_INSTALLED:
+            raise ImportError("The 'async' extra dependency is required.")
+
+        self.session_config = SessionConfig() if not session_config else session_config
+
+        self.base_server_url = urlunparse(
+            (
+                self.session_config.scheme,
+                f"{server}:{port}",
+                "",
+                None,
+                None,
+                None,
+            )
+        )
+
+        # Credentials providers request access tokens with a ``requests`` session
+        self.session = self._setup_token_session()
+        self.async_session = self._setup_async_session()
+
+        self._credentials = credentials
+        self._credentials.attach_client(self)
+        self._token_lock: Optional[asyncio.Lock] = None
+
+        self.rate_limiter: Optional[RateLimiter] = JamfProClient._setup_rate_limiter(
+            self.session_config
+        )
+
+        self.retry_handler: Optional[RetryHandler] = (
+            RetryHandler(self.session_config.retry_policy)
+            if self.session_config.retry_policy
+            else None
+        )
+
+        for option in ("adaptive_concurrency", "response_cache", "coalesce_requests"):
+            if getattr(self.session_config, option):
+                logger.warning("The '%s' option is not supported by AsyncJamfProClient", option)
+
+        self.json_decoder = JsonDecoder(self.session_config.json_backend)
+
+        self.classic_api = AsyncClassicApi(
+            self.classic_api_request, self.concurrent_api_requests, self.json_decoder
+        )
+        self.pro_api = AsyncProApi(
+            self.pro_api_request, self.concurrent_api_requests, self.json_decoder
+        )
+
+    async def __aenter__(self) -> AsyncJamfProClient:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the client's HTTP sessions and release the resources of the credentials
+        provider.
+        """
+        await asyncio.to_thread(self._credentials.close)
+        await self.async_session.aclose()
+        self.session.close()
+
+    def _cookies(self) -> Dict[str, str]:
+        if self.session_config.cookie:
+            return JamfProClient._parse_cookie_file(self.session_config.cookie)
+        return {}
+
+    def _setup_token_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update({"User-Agent": self.session_config.user_agent})
+        cookiejar_from_dict(cookie_dict=self._cookies(), cookiejar=session.cookies)
+
+        if self.session_config.verify and self.session_config.ca_cert_bundle is not None:
+            session.verify = JamfProClient._load_ca_cert_bundle(self.session_config.ca_cert_bundle)
+        else:
+            session.verify = self.session_config.verify
+
+        adapter = requests.adapters.HTTPAdapter(max_retries=self.session_config.max_retries)
+        session.mount(prefix="http://", adapter=adapter)
+        session.mount(prefix="https://", adapter=adapter)
+
+        return session
+
+    def _setup_async_session(self) -> httpx.AsyncClient:
+        verify: Union[bool, ssl.SSLContext] = self.session_config.verify
+        if self.session_config.verify and self.session_config.ca_cert_bundle is not None:
+            verify = ssl.create_default_context(cafile=certifi.where())
+            verify.load_verify_locations(cafile=str(self.session_config.ca_cert_bundle))
+
+        limits = httpx.Limits(
+            max_connections=self.session_config.max_concurrency,
+            max_keepalive_connections=self.session_config.max_concurrency,
+        )
+
+        return httpx.AsyncClient(
+            headers={"Accept": "application/json", "User-Agent": self.session_config.user_agent},
+            cookies=self._cookies(),
+            timeout=self.session_config.timeout,
+            transport=httpx.AsyncHTTPTransport(
+                verify=verify, limits=limits, retries=self.session_config.max_retries
+            ),
+        )
+
+    async def get_access_token(self) -> AccessToken:
+        """Obtain the current API access token from the credentials provider. A token request,
+        when one is needed, is run in a worker thread so the event loop is not blocked.
+
+        :return: An ``AccessToken`` object.
+        :rtype: AccessToken
+        """
+        # Select once so a pool of providers is only advanced once per request
+        credentials = self._credentials._select_provider()
+        if access_token := credentials._get_cached_access_token():
+            return access_token
+
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+
+        async with self._token_lock:
+            return await asyncio.to_thread(credentials.get_access_token)
+
+    async def classic_api_request(
+        self,
+        method: str,
+        resource_path: str,
+        data: Optional[Union[str, ClassicApiModel]] = None,
+        override_headers: Optional[dict] = None,
+    ) -> httpx.Response:
+        """Perform a request to the Classic API.
+
+        See :meth:`~jamf_pro_sdk.clients.JamfProClient.classic_api_request` for a description of
+        the arguments.
+
+        :return: `HTTPX Response <https://www.python-httpx.org/api/#response>`_ object
+        :rtype: httpx.Response
+        """
+        capi_req: Dict[str, Any]
+
+        capi_req = {
+            "method": method,
+            "url": f"{self.base_server_url}/JSSResource/{resource_path}",
+            "headers": {},
+        }
+
+        if override_headers:
+            capi_req["headers"].update(override_headers)
+
+        if data and (method.lower() in ("post", "put")):
+            capi_req["headers"]["Content-Type"] = "text/xml"
+            capi_req["content"] = (
+                data if isinstance(data, str) else data.xml(exclude_read_only=True)
+            )
+
+        capi_resp = await self._send_request(capi_req)
+        logger.info("ClassicAPIRequest %s %s", method.upper(), resource_path)
+        try:
+            capi_resp.raise_for_status()
+        except httpx.HTTPStatusError:
+            logger.error(capi_resp.text)
+            raise
+
+        return capi_resp
+
+    async def pro_api_request(
+        self,
+        method: str,
+        resource_path: str,
+        query_params: Optional[Dict[str, str]] = None,
+        data: Optional[Union[dict, BaseModel]] = None,
+        files: Optional[dict[str, tuple[str, BinaryIO, str]]] = None,
+        override_headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """Perform a request to the Pro API.
+
+        See :meth:`~jamf_pro_sdk.clients.JamfProClient.pro_api_request` for a description of the
+        arguments.
+
+        :return: `HTTPX Response <https://www.python-httpx.org/api/#response>`_ object
+        :rtype: httpx.Response
+        """
+        pro_req: Dict[str, Any]
+
+        pro_req = {
+            "method": method,
+            "url": f"{self.base_server_url}/api/{resource_path}",
+            "headers": {},
+        }
+
+        if override_headers:
+            pro_req["headers"].update(override_headers)
+
+        if query_params:
+            pro_req["params"] = query_params
+
+        if data and (method.lower() in ("post", "put", "patch")):
+            pro_req["headers"]["Content-Type"] = "application/json"
+            if isinstance(data, dict):
+                pro_req["json"] = data
+            elif isinstance(data, BaseModel):
+                pro_req["content"] = data.model_dump_json(exclude_none=True)
+            else:
+                raise ValueError("'data' must be one of 'dict' or 'BaseModel'")
+
+        if files and (method.lower() == "post"):
+            pro_req["files"] = files
+
+        pro_resp = await self._send_request(pro_req)
+        logger.info("ProAPIRequest %s %s", method.upper(), resource_path)
+        try:
+            pro_resp.raise_for_status()
+        except httpx.HTTPStatusError:
+            logger.error(pro_resp.text)
+            raise
+
+        return pro_resp
+
+    async def _send_request(self, request: Dict[str, Any]) -> httpx.Response:
+        """Send a request with the async session. A current access token is set on every attempt.
+        If the session config has a ``retry_policy`` failed attempts are retried. Every attempt
+        waits on the client's ``rate_limiter`` if one is set.
+        """
+
+        async def send() -> httpx.Response:
+            if self.rate_limiter:
+                # Rate limiters block: wait in a worker thread so the event loop keeps running
+                await asyncio.to_thread(self.rate_limiter.acquire)
+            access_token = await self.get_access_token()
+            request["headers"]["Authorization"] = f"Bearer {access_token}"
+            resp = await self.async_session.request(**request)
+            if resp.status_code == 429:
+                self._credentials.report_throttled(access_token)
+            elif resp.status_code == 401:
+                # Waits on the provider's token lock: keep the event loop running
+                await asyncio.to_thread(self._credentials.report_unauthorized, access_token)
+            return resp
+
+        if not self.retry_handler:
+            return await send()
+
+        file_positions = [
+            (f[1], f[1].tell()) for f in request.get("files", {}).values() if f[1].seekable()
+        ]
+
+        def rewind_files():
+            for file_obj, position in file_positions:
+                file_obj.seek(position)
+
+        return await self.retry_handler.call_async(
+            send, method=request["method"], before_retry=rewind_files
+        )
+
+    async def concurrent_api_requests(
+        self,
+        handler: Callable,
+        arguments: Iterable[Any],
+        return_model: Optional[Type[BaseModel]] = None,
+        max_concurrency: Optional[int] = None,
+        return_exceptions: Optional[bool] = None,
+        ordered: bool = True,
+        max_in_flight: Optional[int] = None,
+    ) -> AsyncIterator[Union[Any, Exception]]:
+        """An interface for performing concurrent API operations as coroutines.
+
+        See :meth:`~jamf_pro_sdk.clients.JamfProClient.concurrent_api_requests` for a description
+        of the arguments. The ``handler`` must be a coroutine function.
+
+        :return: An async iterator that will yield the result for each operation.
+        :rtype: AsyncIterator
+        """
+        if return_exceptions is None:
+            return_exceptions = self.session_config.return_exceptions
+
+        if max_concurrency:
+            max_concurrency = min(max_concurrency, self.session_config.max_concurrency)
+        else:
+            max_concurrency = self.session_config.max_concurrency
+
+        if max_in_flight is None:
+            max_in_flight = max_concurrency * self.session_config.max_in_flight_factor
+        elif max_in_flight < 1:
+            raise ValueError("'max_in_flight' must be at least 1")
+        semaphore = asyncio.Semaphore(max_concurrency)
+        arguments = iter(arguments)
+        in_flight: Union[Deque[asyncio.Task], Set[asyncio.Task]]
+        in_flight = collections.deque() if ordered else set()
+
+        async def run(i: Any) -> Any:
+            async with semaphore:
+                if isinstance(i, dict):
+                    return await handler(**i)
+                else:
+                    return await handler(i)
+
+        def submit_next() -> bool:
+            try:
+                i = next(arguments)
+            except StopIteration:
+                return False
+
+            task = asyncio.ensure_future(run(i))
+            if ordered:
+                in_flight.append(task)
+            else:
+                in_flight.add(task)
+            return True
+
+        logger.info("ConcurrentAPIRequest %s ", handler.__name__)
+        try:
+            arguments_exhausted = False
+            while True:
+                while not arguments_exhausted and len(in_flight) < max_in_flight:
+                    arguments_exhausted = not submit_next()
+
+                if not in_flight:
+                    break
+
+                if ordered:
+                    completed = [in_flight.popleft()]
+                    await asyncio.wait(completed)
+                else:
+                    completed, _ = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    in_flight.difference_update(completed)
+
+                for result in completed:
+                    try:
+                        yield self._parse_concurrent_result(result, return_model)
+                    except Exception as err:
+                        logger.warning(err)
+                        if return_exceptions:
+                            yield err
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    def _parse_concurrent_result(
+        self, result: asyncio.Task, return_model: Optional[Type[BaseModel]] = None
+    ) -> Any:
+        """Return the result of a completed operation, parsed into the ``return_model`` if the
+        handler returned a response object.
+        """
+        response = result.result()
+        if isinstance(response, BaseModel):
+            return response
+        elif isinstance(response, httpx.Response) and return_model:
+            # Classic API models are nested under their root name (a private model attribute)
+            root = return_model.__private_attributes__.get("_xml_root_name")
+            return self.json_decoder.validate(
+                return_model, response.content, root=root.default if root else None
+            )
+        else:
+            return response
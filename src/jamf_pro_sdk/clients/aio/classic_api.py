@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+from typing import AsyncIterator, Iterable, List, TypeVar, Union
+
+from ...models.classic.advanced_computer_searches import (
+    ClassicAdvancedComputerSearch,
+    ClassicAdvancedComputerSearchesItem,
+)
+from ...models.classic.categories import ClassicCategoriesItem, ClassicCategory
+from ...models.classic.computer_groups import ClassicComputerGroup, ClassicComputerGroupMember
+from ...models.classic.computers import (
+    ClassicComputer,
+    ClassicComputersItem,
+)
+from ...models.classic.packages import ClassicPackage, ClassicPackageItem
+from ..classic_api import (
+    AdvancedComputerSearchId,
+    CategoryId,
+    ClassicApiOperations,
+    ComputerId,
+    PackageId,
+)
+from ..operations import Operation, run_operation_async
+
+T = TypeVar("T")
+
+
+class AsyncClassicApi(ClassicApiOperations):
+    """Provides a curated ``asyncio`` interface to the Jamf Pro Classic API.
+
+    Every operation is the async counterpart of the method of the same name on
+    :class:`~jamf_pro_sdk.clients.classic_api.ClassicApi` and accepts the same arguments. Both
+    classes run the same :class:`~jamf_pro_sdk.clients.classic_api.ClassicApiOperations`.
+    """
+
+    async def _run(self, operation: Operation[T]) -> T:
+        return await run_operation_async(operation, self.api_request)
+
+    # /categories APIs
+
+    async def list_all_categories(self) -> List[ClassicCategoriesItem]:
+        """Returns a list of all categories.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.list_all_categories`.
+        """
+        return await self._run(self._list_all_categories())
+
+    async def get_category_by_id(self, category: CategoryId) -> ClassicCategory:
+        """Returns a single category record using the ID.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.get_category_by_id`.
+        """
+        return await self._run(self._get_category_by_id(category))
+
+    async def update_category_by_id(
+        self, category: CategoryId, data: Union[str, ClassicCategory]
+    ) -> None:
+        """Update a single category record using the ID.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.update_category_by_id`.
+        """
+        await self._run(self._update_category_by_id(category, data))
+
+    async def delete_category_by_id(self, category: CategoryId) -> None:
+        """Delete a single category record using the ID.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.delete_category_by_id`.
+        """
+        await self._run(self._delete_category_by_id(category))
+
+    async def create_category(self, data: Union[str, ClassicCategory]) -> int:
+        """Create a new category.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.create_category`.
+        """
+        return await self._run(self._create_category(data))
+
+    # /computers APIs
+
+    async def list_all_computers(self, subsets: Iterable[str] = None) -> List[ClassicComputersItem]:
+        """Returns a list of all computers.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.list_all_computers`.
+        """
+        return await self._run(self._list_all_computers(subsets))
+
+    async def get_computer_by_id(
+        self, computer: ComputerId, subsets: Iterable[str] = None
+    ) -> ClassicComputer:
+        """Returns a single computer record using the ID.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.get_computer_by_id`.
+        """
+        return await self._run(self._get_computer_by_id(computer, subsets))
+
+    async def get_computers(
+        self, computers: List[ComputerId] = None, subsets: Iterable[str] = None
+    ) -> AsyncIterator[ClassicComputer]:
+        """Yields all requested computer records by their IDs.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.get_computers`. This operation is
+        an async generator:
+
+        .. code-block:: python
+
+            async for computer in client.classic_api.get_computers():
+                ...
+
+        """
+        if not computers:
+            computers = await self.list_all_computers()
+
+        async for computer in self.concurrent_api_requests(
+            self.get_computer_by_id, [{"computer": i, "subsets": subsets} for i in computers]
+        ):
+            yield computer
+
+    async def update_computer_by_id(
+        self, computer: ComputerId, data: Union[str, ClassicComputer]
+    ) -> None:
+        """Update a single computer record using the ID.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.update_computer_by_id`.
+        """
+        await self._run(self._update_computer_by_id(computer, data))
+
+    async def delete_computer_by_id(self, computer: ComputerId) -> None:
+        """Delete a single computer record using the ID.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.delete_computer_by_id`.
+        """
+        await self._run(self._delete_computer_by_id(computer))
+
+    async def set_computer_unmanaged_by_id(self, computer: ComputerId) -> None:
+        """Sets the management status to `unmanaged` for a single computer using the ID.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.set_computer_unmanaged_by_id`.
+        """
+        await self._run(self._set_computer_unmanaged_by_id(computer))
+
+    async def set_computer_managed_by_id(
+        self, computer: ComputerId, management_user: str = "admin", management_password: str = None
+    ) -> None:
+        """Sets the management status to `managed` for a single computer using the ID.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.set_computer_managed_by_id`.
+        """
+        await self._run(
+            self._set_computer_managed_by_id(computer, management_user, management_password)
+        )
+
+    # /computergroups APIs
+
+    async def create_computer_group(self, data: Union[str, ClassicComputerGroup]) -> int:
+        """Create a new computer group.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.create_computer_group`.
+        """
+        return await self._run(self._create_computer_group(data))
+
+    async def list_all_computer_groups(self) -> List[ClassicComputerGroup]:
+        """Returns a list of all computer groups.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.list_all_computer_groups`.
+        """
+        return await self._run(self._list_all_computer_groups())
+
+    async def get_computer_group_by_id(self, computer_group_id: int) -> ClassicComputerGroup:
+        """Returns a single computer group record using the ID.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.get_computer_group_by_id`.
+        """
+        return await self._run(self._get_computer_group_by_id(computer_group_id))
+
+    async def update_smart_computer_group_by_id(
+        self, computer_group_id: int, data: Union[str, ClassicComputerGroup]
+    ):
+        """Update a smart computer group.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.update_smart_computer_group_by_id`.
+        """
+        return await self._run(self._update_smart_computer_group_by_id(computer_group_id, data))
+
+    async def update_static_computer_group_membership_by_id(
+        self,
+        computer_group_id: int,
+        computers_to_add: Iterable[Union[int, ClassicComputerGroupMember]] = None,
+        computers_to_remove: Iterable[Union[int, ClassicComputerGroupMember]] = None,
+    ) -> None:
+        """Update the membership of a static computer group.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.update_static_computer_group_membership_by_id`.
+        """
+        await self._run(
+            self._update_static_computer_group_membership_by_id(
+                computer_group_id, computers_to_add, computers_to_remove
+            )
+        )
+
+    # /advancedcomputersearches APIs
+
+    async def create_advanced_computer_search(
+        self, data: Union[str, ClassicAdvancedComputerSearch]
+    ) -> int:
+        """Create a new advanced computer search.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.create_advanced_computer_search`.
+        """
+        return await self._run(self._create_advanced_computer_search(data))
+
+    async def list_all_advanced_computer_searches(
+        self,
+    ) -> List[ClassicAdvancedComputerSearchesItem]:
+        """Returns a list of all advanced computer searches.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.list_all_advanced_computer_searches`.
+        """
+        return await self._run(self._list_all_advanced_computer_searches())
+
+    async def get_advanced_computer_search_by_id(self, advanced_search: AdvancedComputerSearchId):
+        """Returns a single advanced computer search using the ID.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.get_advanced_computer_search_by_id`.
+        """
+        return await self._run(self._get_advanced_computer_search_by_id(advanced_search))
+
+    async def update_advanced_computer_search_by_id(
+        self,
+        advanced_search: AdvancedComputerSearchId,
+        data: Union[str, ClassicAdvancedComputerSearch],
+        return_updated: bool = False,
+    ):
+        """Update an advanced computer search using the ID.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.update_advanced_computer_search_by_id`.
+        """
+        return await self._run(
+            self._update_advanced_computer_search_by_id(advanced_search, data, return_updated)
+        )
+
+    async def delete_advanced_computer_search_by_id(
+        self, advanced_search: AdvancedComputerSearchId
+    ):
+        """Delete an advanced computer search using the ID.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.delete_advanced_computer_search_by_id`.
+        """
+        return await self._run(self._delete_advanced_computer_search_by_id(advanced_search))
+
+    # /packages APIs
+
+    async def create_package(self, data: Union[str, ClassicPackage]) -> int:
+        """Create a new package.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.create_package`.
+        """
+        return await self._run(self._create_package(data))
+
+    async def list_all_packages(self) -> List[ClassicPackageItem]:
+        """Returns a list of all packages.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.list_all_packages`.
+        """
+        return await self._run(self._list_all_packages())
+
+    async def get_package_by_id(self, package: PackageId) -> ClassicPackage:
+        """Returns a single package record using the ID.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.get_package_by_id`.
+        """
+        return await self._run(self._get_package_by_id(package))
+
+    async def delete_package_by_id(self, package: PackageId) -> None:
+        """Delete a single package record using the ID.
+
+        See :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.delete_package_by_id`.
+        """
+        await self._run(self._delete_package_by_id(package))
@@ -0,0 +1,394 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    TypeVar,
+    Union,
+    overload,
+)
+from uuid import UUID
+
+from ...models.pro.computers import Computer
+from ...models.pro.jcds2 import DownloadUrl, File, NewFile
+from ...models.pro.mdm import (
+    CustomCommand,
+    EnableLostModeCommand,
+    EraseDeviceCommand,
+    LogOutUserCommand,
+    MdmCommandStatus,
+    RenewMdmProfileResponse,
+    RestartDeviceCommand,
+    SendMdmCommandResponse,
+    SetRecoveryLockCommand,
+    ShutDownDeviceCommand,
+)
+from ...models.pro.mobile_devices import MobileDevice
+from ...models.pro.packages import Package
+from ..operations import Operation, run_operation_async
+from ..pro_api import ProApiOperations
+from ..pro_api.pagination import AsyncPaginator
+
+if TYPE_CHECKING:
+    from ..pro_api.pagination import FilterExpression, Page, SortExpression
+
+T = TypeVar("T")
+
+
+class AsyncProApi(ProApiOperations):
+    """Provides an ``asyncio`` interface to the Jamf Pro API.
+
+    Every operation is the async counterpart of the method of the same name on
+    :class:`~jamf_pro_sdk.clients.pro_api.ProApi` and accepts the same arguments. Both classes
+    run the same :class:`~jamf_pro_sdk.clients.pro_api.ProApiOperations`. Paginated operations
+    return an async iterator of pages when ``return_generator`` is ``True``.
+    """
+
+    async def _run(self, operation: Operation[T]) -> T:
+        return await run_operation_async(operation, self.api_request)
+
+    async def _paginate(
+        self, paginator_args: Dict[str, Any], return_generator: bool, stream_records: bool
+    ) -> Union[list, AsyncIterator]:
+        paginator = AsyncPaginator(api_client=self, **paginator_args)
+        return await paginator(return_generator=return_generator, stream_records=stream_records)
+
+    # Computer Inventory APIs
+
+    @overload
+    async def get_computer_inventory_v1(
+        self,
+        sections: Optional[List[str]] = ...,
+        start_page: int = ...,
+        end_page: Optional[int] = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
+        sort_expression: Optional[SortExpression] = ...,
+        filter_expression: Optional[FilterExpression] = ...,
+        return_generator: Literal[False] = False,
+        stream_records: Literal[False] = False,
+        lazy_validation: bool = ...,
+        validation_executor: Optional[Executor] = ...,
+    ) -> List[Computer]: ...
+
+    @overload
+    async def get_computer_inventory_v1(
+        self,
+        sections: Optional[List[str]] = ...,
+        start_page: int = ...,
+        end_page: Optional[int] = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
+        sort_expression: Optional[SortExpression] = ...,
+        filter_expression: Optional[FilterExpression] = ...,
+        return_generator: Literal[True] = True,
+        stream_records: Literal[False] = False,
+        lazy_validation: bool = ...,
+        validation_executor: Optional[Executor] = ...,
+    ) -> AsyncIterator[Page]: ...
+
+    @overload
+    async def get_computer_inventory_v1(
+        self,
+        sections: Optional[List[str]] = ...,
+        start_page: int = ...,
+        end_page: Optional[int] = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
+        sort_expression: Optional[SortExpression] = ...,
+        filter_expression: Optional[FilterExpression] = ...,
+        return_generator: bool = ...,
+        stream_records: Literal[True] = True,
+        lazy_validation: bool = ...,
+        validation_executor: Optional[Executor] = ...,
+    ) -> AsyncIterator[Computer]: ...
+
+    async def get_computer_inventory_v1(
+        self,
+        sections: Optional[List[str]] = None,
+        start_page: int = 0,
+        end_page: Optional[int] = None,
+        page_size: Union[int, Literal["auto"]] = 100,
+        sort_expression: Optional[SortExpression] = None,
+        filter_expression: Optional[FilterExpression] = None,
+        return_generator: bool = False,
+        stream_records: bool = False,
+        lazy_validation: bool = False,
+        validation_executor: Optional[Executor] = None,
+    ) -> Union[List[Computer], AsyncIterator[Page], AsyncIterator[Computer]]:
+        """Returns a list of computer inventory records.
+
+        See :meth:`~jamf_pro_sdk.clients.pro_api.ProApi.get_computer_inventory_v1`.
+        """
+        return await self._paginate(
+            self._get_computer_inventory_v1(
+                sections,
+                start_page,
+                end_page,
+                page_size,
+                sort_expression,
+                filter_expression,
+                lazy_validation,
+                validation_executor,
+            ),
+            return_generator,
+            stream_records,
+        )
+
+    # Package APIs
+
+    @overload
+    async def get_packages_v1(
+        self,
+        start_page: int = ...,
+        end_page: Optional[int] = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
+        sort_expression: Optional[SortExpression] = ...,
+        filter_expression: Optional[FilterExpression] = ...,
+        return_generator: Literal[False] = False,
+        stream_records: Literal[False] = False,
+    ) -> List[Package]: ...
+
+    @overload
+    async def get_packages_v1(
+        self,
+        start_page: int = ...,
+        end_page: Optional[int] = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
+        sort_expression: Optional[SortExpression] = ...,
+        filter_expression: Optional[FilterExpression] = ...,
+        return_generator: Literal[True] = True,
+        stream_records: Literal[False] = False,
+    ) -> AsyncIterator[Page]: ...
+
+    @overload
+    async def get_packages_v1(
+        self,
+        start_page: int = ...,
+        end_page: Optional[int] = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
+        sort_expression: Optional[SortExpression] = ...,
+        filter_expression: Optional[FilterExpression] = ...,
+        return_generator: bool = ...,
+        stream_records: Literal[True] = True,
+    ) -> AsyncIterator[Package]: ...
+
+    async def get_packages_v1(
+        self,
+        start_page: int = 0,
+        end_page: Optional[int] = None,
+        page_size: Union[int, Literal["auto"]] = 100,
+        sort_expression: Optional[SortExpression] = None,
+        filter_expression: Optional[FilterExpression] = None,
+        return_generator: bool = False,
+        stream_records: bool = False,
+    ) -> Union[List[Package], AsyncIterator[Page], AsyncIterator[Package]]:
+        """Returns a list of package records.
+
+        See :meth:`~jamf_pro_sdk.clients.pro_api.ProApi.get_packages_v1`.
+        """
+        return await self._paginate(
+            self._get_packages_v1(
+                start_page, end_page, page_size, sort_expression, filter_expression
+            ),
+            return_generator,
+            stream_records,
+        )
+
+    # JCDS APIs
+
+    async def get_jcds_files_v1(self) -> List[File]:
+        """Return a list of files in the JCDS.
+
+        See :meth:`~jamf_pro_sdk.clients.pro_api.ProApi.get_jcds_files_v1`.
+        """
+        return await self._run(self._get_jcds_files_v1())
+
+    async def create_jcds_file_v1(self) -> NewFile:
+        """Create a new file in the JCDS.
+
+        See :meth:`~jamf_pro_sdk.clients.pro_api.ProApi.create_jcds_file_v1`.
+        """
+        return await self._run(self._create_jcds_file_v1())
+
+    async def get_jcds_file_v1(self, file_name: str) -> DownloadUrl:
+        """Read a JCDS file record by its filename.
+
+        See :meth:`~jamf_pro_sdk.clients.pro_api.ProApi.get_jcds_file_v1`.
+        """
+        return await self._run(self._get_jcds_file_v1(file_name))
+
+    async def delete_jcds_file_v1(self, file_name: str) -> None:
+        """Delete a file from the JCDS.
+
+        See :meth:`~jamf_pro_sdk.clients.pro_api.ProApi.delete_jcds_file_v1`.
+        """
+        await self._run(self._delete_jcds_file_v1(file_name))
+
+    # MDM APIs
+
+    async def renew_mdm_profile_v1(self, udids: List[Union[str, UUID]]) -> RenewMdmProfileResponse:
+        """Renews device MDM Profiles, including the device identity certificate within the MDM Profile.
+
+        See :meth:`~jamf_pro_sdk.clients.pro_api.ProApi.renew_mdm_profile_v1`.
+        """
+        return await self._run(self._renew_mdm_profile_v1(udids))
+
+    async def send_mdm_command_preview(
+        self,
+        management_ids: List[Union[str, UUID]],
+        command: Union[
+            EnableLostModeCommand,
+            EraseDeviceCommand,
+            LogOutUserCommand,
+            RestartDeviceCommand,
+            SetRecoveryLockCommand,
+            ShutDownDeviceCommand,
+            CustomCommand,
+        ],
+    ) -> List[SendMdmCommandResponse]:
+        """Send an MDM command to one or more devices.
+
+        See :meth:`~jamf_pro_sdk.clients.pro_api.ProApi.send_mdm_command_preview`.
+        """
+        return await self._run(self._send_mdm_command_preview(management_ids, command))
+
+    @overload
+    async def get_mdm_commands_v2(
+        self,
+        filter_expression: FilterExpression,
+        start_page: int = ...,
+        end_page: Optional[int] = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
+        sort_expression: Optional[SortExpression] = ...,
+        return_generator: Literal[False] = False,
+        stream_records: Literal[False] = False,
+    ) -> List[MdmCommandStatus]: ...
+
+    @overload
+    async def get_mdm_commands_v2(
+        self,
+        filter_expression: FilterExpression,
+        start_page: int = ...,
+        end_page: Optional[int] = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
+        sort_expression: Optional[SortExpression] = ...,
+        return_generator: Literal[True] = True,
+        stream_records: Literal[False] = False,
+    ) -> AsyncIterator[Page]: ...
+
+    @overload
+    async def get_mdm_commands_v2(
+        self,
+        filter_expression: FilterExpression,
+        start_page: int = ...,
+        end_page: Optional[int] = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
+        sort_expression: Optional[SortExpression] = ...,
+        return_generator: bool = ...,
+        stream_records: Literal[True] = True,
+    ) -> AsyncIterator[MdmCommandStatus]: ...
+
+    async def get_mdm_commands_v2(
+        self,
+        filter_expression: FilterExpression,
+        start_page: int = 0,
+        end_page: Optional[int] = None,
+        page_size: Union[int, Literal["auto"]] = 100,
+        sort_expression: Optional[SortExpression] = None,
+        return_generator: bool = False,
+        stream_records: bool = False,
+    ) -> Union[List[MdmCommandStatus], AsyncIterator[Page], AsyncIterator[MdmCommandStatus]]:
+        """Returns a list of MDM commands.
+
+        See :meth:`~jamf_pro_sdk.clients.pro_api.ProApi.get_mdm_commands_v2`.
+        """
+        return await self._paginate(
+            self._get_mdm_commands_v2(
+                filter_expression, start_page, end_page, page_size, sort_expression
+            ),
+            return_generator,
+            stream_records,
+        )
+
+    # Mobile Device Inventory APIs
+
+    @overload
+    async def get_mobile_device_inventory_v2(
+        self,
+        sections: Optional[List[str]] = ...,
+        start_page: int = ...,
+        end_page: Optional[int] = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
+        sort_expression: Optional[SortExpression] = ...,
+        filter_expression: Optional[FilterExpression] = ...,
+        return_generator: Literal[False] = False,
+        stream_records: Literal[False] = False,
+        lazy_validation: bool = ...,
+        validation_executor: Optional[Executor] = ...,
+    ) -> List[MobileDevice]: ...
+
+    @overload
+    async def get_mobile_device_inventory_v2(
+        self,
+        sections: Optional[List[str]] = ...,
+        start_page: int = ...,
+        end_page: Optional[int] = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
+        sort_expression: Optional[SortExpression] = ...,
+        filter_expression: Optional[FilterExpression] = ...,
+        return_generator: Literal[True] = True,
+        stream_records: Literal[False] = False,
+        lazy_validation: bool = ...,
+        validation_executor: Optional[Executor] = ...,
+    ) -> AsyncIterator[Page]: ...
+
+    @overload
+    async def get_mobile_device_inventory_v2(
+        self,
+        sections: Optional[List[str]] = ...,
+        start_page: int = ...,
+        end_page: Optional[int] = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
+        sort_expression: Optional[SortExpression] = ...,
+        filter_expression: Optional[FilterExpression] = ...,
+        return_generator: bool = ...,
+        stream_records: Literal[True] = True,
+        lazy_validation: bool = ...,
+        validation_executor: Optional[Executor] = ...,
+    ) -> AsyncIterator[MobileDevice]: ...
+
+    async def get_mobile_device_inventory_v2(
+        self,
+        sections: Optional[List[str]] = None,
+        start_page: int = 0,
+        end_page: Optional[int] = None,
+        page_size: Union[int, Literal["auto"]] = 100,
+        sort_expression: Optional[SortExpression] = None,
+        filter_expression: Optional[FilterExpression] = None,
+        return_generator: bool = False,
+        stream_records: bool = False,
+        lazy_validation: bool = False,
+        validation_executor: Optional[Executor] = None,
+    ) -> Union[List[MobileDevice], AsyncIterator[Page], AsyncIterator[MobileDevice]]:
+        """Returns a list of mobile device (iOS and tvOS) inventory records.
+
+        See :meth:`~jamf_pro_sdk.clients.pro_api.ProApi.get_mobile_device_inventory_v2`.
+        """
+        return await self._paginate(
+            self._get_mobile_device_inventory_v2(
+                sections,
+                start_page,
+                end_page,
+                page_size,
+                sort_expression,
+                filter_expression,
+                lazy_validation,
+                validation_executor,
+            ),
+            return_generator,
+            stream_records,
+        )
@@ -1,9 +1,23 @@
 import json
 import logging
+import time
+import uuid
+import weakref
 from datetime import datetime, timedelta, timezone
 from getpass import getpass
-from threading import Lock
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type, overload
+from threading import Event, Lock, Thread
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    overload,
+)
 
 try:
     import boto3
@@ -25,37 +39,179 @@ import requests
 
 if TYPE_CHECKING:
     from . import JamfProClient
+    from .token_cache import TokenCache
 
 from ..exceptions import CredentialsError
 from ..models.client import AccessToken
 
 logger = logging.getLogger("jamf_pro_sdk")
 
+# Cached tokens are returned without locking until this many seconds before the refresh TTL
+FAST_PATH_MARGIN = 5
+
+# Seconds the background refresher waits before trying again after a failed token request
+BACKGROUND_REFRESH_RETRY_DELAY = 10
+
 
 class CredentialsProvider:
     """The base credentials provider class all other providers should inherit from."""
 
     def __init__(self):
         self._client: Optional["JamfProClient"] = None
+        self.token_cache: Optional["TokenCache"] = None
         self._global_lock = Lock()
         self._access_token = AccessToken()
+        # The cached token and the time (epoch seconds) it can be returned without locking until.
+        # Stored as one tuple so a reader never sees a token paired with another token's time.
+        self._cached_access_token: Tuple[AccessToken, float] = (self._access_token, 0.0)
+        self._identity = uuid.uuid4().hex
 
     def attach_client(self, client: "JamfProClient"):
         self._client = client
+        if self.token_cache is not None and self._token_cache_credentials() is None:
+            logger.warning(
+                "%s does not provide credentials to encrypt cached tokens with: the token cache "
+                "will not be used",
+                type(self).__name__,
+            )
+
+    def close(self) -> None:
+        """Release resources held by the provider, such as a background refresh thread. Called
+        when the client the provider is attached to is closed. The base implementation does
+        nothing.
+        """
+        pass
+
+    @property
+    def identity(self) -> str:
+        """Identifies the credentials tokens are obtained with. Responses persisted by the
+        client's ``response_cache`` are only shared by clients with the same server and identity.
+
+        The base implementation is unique to the provider object, so persisted responses are not
+        reused by other processes. Custom providers can override this to return a stable value
+        such as the username.
+        """
+        return self._identity
+
+    def _select_provider(self) -> "CredentialsProvider":
+        """The provider that obtains the access token for the next request. This is the provider
+        itself unless it hands out tokens from other providers, e.g. a pool. Callers that check
+        the lock-free cache before requesting a token must select the provider once and use it
+        for both.
+        """
+        return self
 
     def get_access_token(self, thread_lock: Lock = None) -> AccessToken:
         """Thread safe method for obtaining the current API access token.
 
+        While the cached token is well within its lifetime it is returned without acquiring the
+        lock. The lock is only taken when the token may need to be refreshed.
+
         :return: An ``AccessToken`` object.
         :rtype: AccessToken
         """
+        if access_token := self._get_cached_access_token():
+            return access_token
+
         if not thread_lock:
             thread_lock = self._global_lock
 
         with thread_lock:
             self._refresh_access_token()
+            self._update_cached_access_token()
             return self._access_token
 
+    def _update_cached_access_token(self) -> None:
+        """Publish the current access token to the lock-free fast path of
+        :meth:`get_access_token`. Must be called while holding the lock.
+        """
+        access_token = self._access_token
+        self._cached_access_token = (
+            access_token,
+            access_token.expires.timestamp()
+            - self._token_cache_ttl(access_token)
+            - FAST_PATH_MARGIN,
+        )
+
+    def report_throttled(self, access_token: AccessToken) -> None:
+        """Called by the client when a request made with the given access token was throttled
+        (HTTP ``429``). The base implementation does nothing.
+
+        :param access_token: The access token that was sent with the throttled request.
+        :type access_token: AccessToken
+        """
+        pass
+
+    def report_unauthorized(self, access_token: AccessToken) -> None:
+        """Called by the client when the server rejected the given access token (HTTP ``401``),
+        e.g. because it was revoked or a token loaded from the ``token_cache`` was invalidated.
+        If it is the current token it is discarded and removed from the ``token_cache`` so the
+        next request obtains a new token.
+
+        :param access_token: The access token that was sent with the rejected request.
+        :type access_token: AccessToken
+        """
+        with self._global_lock:
+            if not access_token.token or access_token.token != self._access_token.token:
+                return
+            logger.debug("Access token was rejected by the server: discarding it")
+            self._access_token = AccessToken()
+            self._update_cached_access_token()
+            if token_cache_key := self._token_cache_key():
+                server, identity, _ = token_cache_key
+                self.token_cache.clear(server, identity)
+
+    def _get_cached_access_token(self) -> Optional[AccessToken]:
+        """Return the cached access token if it can be used without a refresh check, otherwise
+        ``None``. This does not acquire the lock.
+        """
+        access_token, fresh_until = self._cached_access_token
+        if access_token.token and time.time() < fresh_until:
+            return access_token
+        return None
+
+    @staticmethod
+    def _token_cache_ttl(access_token: AccessToken) -> int:
+        """The remaining lifetime (in seconds) below which a cached token will be refreshed."""
+        # TODO: Future OAuth flows may need to set different TTL values for refresh behavior
+        return 60 if access_token.type == "user" else 3
+
+    def _token_cache_credentials(self) -> Optional[Tuple[str, str]]:
+        """Return the identity and secret used to key and encrypt this provider's tokens in the
+        ``token_cache``, or ``None`` if there is no secret to encrypt them with.
+
+        The base implementation returns ``None`` and the ``token_cache`` is not used. Custom
+        providers that authenticate with a secret can override this to return e.g.
+        ``(self.identity, secret)``.
+        """
+        return None
+
+    def _token_cache_key(self) -> Optional[Tuple[str, str, str]]:
+        """The server, identity and secret of this provider's tokens in the ``token_cache``, or
+        ``None`` if tokens are not cached.
+        """
+        if self.token_cache is None:
+            return None
+        if (credentials := self._token_cache_credentials()) is None:
+            return None
+        return (self._client.base_server_url, *credentials)
+
+    def _load_cached_access_token(self) -> Optional[AccessToken]:
+        """Load an access token from the ``token_cache`` if it is set and holds a token that does
+        not need to be refreshed.
+        """
+        if not (token_cache_key := self._token_cache_key()):
+            return None
+        access_token = self.token_cache.load(*token_cache_key)
+        if access_token and access_token.seconds_remaining >= self._token_cache_ttl(access_token):
+            return access_token
+        return None
+
+    def _save_cached_access_token(self) -> None:
+        """Write the current access token to the ``token_cache`` if it is set."""
+        if token_cache_key := self._token_cache_key():
+            self.token_cache.save(*token_cache_key, access_token=self._access_token)
+
     def _request_access_token(self) -> AccessToken:
         """This internal method requests a new Jamf Pro access token.
 
@@ -107,14 +263,14 @@ class CredentialsProvider:
         For OAuth tokens, if the cached token's remaining time is greater than or equal to 3 seconds
         it will be returned.
 
-        If the above conditions are not met a new token will be requested.
+        If the above conditions are not met a token is loaded from the ``token_cache`` (if set), or
+        a new token will be requested.
         """
         if self._client is None:
             raise CredentialsError("A Jamf Pro client is not attached to this credentials provider")
         kwargs: Dict[str, Any]
 
-        # TODO: Future OAuth flows may need to set different TTL values for refresh behavior
-        token_cache_ttl = 60 if self._access_token.type == "user" else 3
+        token_cache_ttl = self._token_cache_ttl(self._access_token)
 
         # Return the cached token if expiration is below the cache TTL
         if (
@@ -135,13 +291,24 @@ class CredentialsProvider:
             and 5 < self._access_token.seconds_remaining < token_cache_ttl
         ):
             self._access_token = self._keep_alive()
-        # Request a new token
+            self._save_cached_access_token()
+        # Use a token from the token cache or request a new token
+        elif access_token := self._load_cached_access_token():
+            self._access_token = access_token
         else:
             self._access_token = self._request_access_token()
+            self._save_cached_access_token()
 
 
 class ApiClientCredentialsProvider(CredentialsProvider):
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        background_refresh: bool = False,
+        refresh_fraction: float = 0.75,
+        token_cache: Optional["TokenCache"] = None,
+    ):
         """A credentials provider that uses OAuth2 client credentials flow using an API client.
 
         :param client_id: The client ID.
@@ -149,10 +316,135 @@ class ApiClientCredentialsProvider(CredentialsProvider):
 
         :param client_secret: The client secret.
         :type client_secret: str
+
+        :param background_refresh: Request new tokens from a background thread before the current
+            token expires so requests never wait on a token request. The thread is started once
+            the first token has been obtained. It stops when :meth:`stop_background_refresh` is
+            called, when the client is closed, or when the provider is garbage collected.
+        :type background_refresh: bool
+
+        :param refresh_fraction: The fraction of a token's lifetime after which the background
+            thread requests a new token (defaults to ``0.75``).
+        :type refresh_fraction: float
+
+        :param token_cache: (optional) A :class:`~jamf_pro_sdk.clients.token_cache.TokenCache` to
+            share unexpired tokens with other processes using the same credentials.
+        :type token_cache: TokenCache
         """
+        if not 0 < refresh_fraction < 1:
+            raise ValueError("'refresh_fraction' must be between 0 and 1")
+
         self.client_id = client_id
         self.client_secret = client_secret
+        self.background_refresh = background_refresh
+        self.refresh_fraction = refresh_fraction
+        # The token last requested by this provider and the time it was issued
+        self._access_token_issued: Optional[Tuple[str, datetime]] = None
+        self._refresh_thread: Optional[Thread] = None
+        self._refresh_thread_lock = Lock()
+        self._stop_refresh = Event()
         super().__init__()
+        self.token_cache = token_cache
+
+    def get_access_token(self, thread_lock: Lock = None) -> AccessToken:
+        access_token = super().get_access_token(thread_lock)
+        if self.background_refresh and self._refresh_thread is None:
+            self.start_background_refresh()
+        return access_token
+
+    def start_background_refresh(self) -> None:
+        """Start the background token refresh thread if it is not already running. A client
+        must be attached to the provider.
+
+        When ``background_refresh`` is enabled this is called after the first token is obtained.
+        """
+        if self._client is None:
+            raise CredentialsError("A Jamf Pro client is not attached to this credentials provider")
+
+        with self._refresh_thread_lock:
+            if self._refresh_thread and self._refresh_thread.is_alive():
+                return
+            # The thread only holds a weak reference so it does not keep the provider alive
+            self._stop_refresh = Event()
+            weakref.finalize(self, self._stop_refresh.set)
+            self._refresh_thread = Thread(
+                target=self._run_background_refresh,
+                args=(weakref.ref(self), self._stop_refresh),
+                name="jamf-pro-sdk-token-refresh",
+                daemon=True,
+            )
+            self._refresh_thread.start()
+
+    def stop_background_refresh(self, timeout: Optional[float] = None) -> None:
+        """Stop the background token refresh thread.
+
+        :param timeout: (optional) The number of seconds to wait for the thread to exit.
+        :type timeout: float
+        """
+        self.background_refresh = False
+        self._stop_refresh.set()
+        with self._refresh_thread_lock:
+            refresh_thread, self._refresh_thread = self._refresh_thread, None
+        if refresh_thread:
+            refresh_thread.join(timeout)
+
+    def close(self) -> None:
+        self.stop_background_refresh()
+
+    def _background_refresh_delay(self) -> float:
+        """The number of seconds until the current token should be replaced."""
+        access_token = self._access_token
+        if not access_token.token:
+            return 0.0
+        remaining = (access_token.expires - datetime.now(timezone.utc)).total_seconds()
+        if self._access_token_issued and self._access_token_issued[0] == access_token.token:
+            lifetime = (access_token.expires - self._access_token_issued[1]).total_seconds()
+        else:
+            # The lifetime of a token loaded from the token cache is unknown: it is at least the
+            # time remaining
+            lifetime = remaining
+        return max(0.0, remaining - lifetime * (1 - self.refresh_fraction))
+
+    def _refresh_in_background(self) -> float:
+        """Replace the current token and return the number of seconds until the next refresh."""
+        try:
+            # Requests keep using the current token while the new one is requested: the lock is
+            # only held to replace it
+            access_token = self._request_access_token()
+            with self._global_lock:
+                # A request may have refreshed the token itself in the meantime
+                if access_token.expires >= self._access_token.expires:
+                    self._access_token = access_token
+                    self._update_cached_access_token()
+                    self._save_cached_access_token()
+        except Exception as err:
+            # Requests fall back to refreshing the token themselves if it nears expiry
+            logger.warning("Background access token refresh failed: %s", err)
+            return BACKGROUND_REFRESH_RETRY_DELAY
+
+        delay = self._background_refresh_delay()
+        logger.debug("Next background access token refresh in %.0fs", delay)
+        return delay
+
+    @staticmethod
+    def _run_background_refresh(
+        provider_ref: "weakref.ref[ApiClientCredentialsProvider]", stop: Event
+    ) -> None:
+        provider = provider_ref()
+        delay = provider._background_refresh_delay() if provider else 0.0
+        del provider
+        while not stop.wait(delay):
+            if (provider := provider_ref()) is None:
+                return
+            delay = provider._refresh_in_background()
+            del provider
+
+    @property
+    def identity(self) -> str:
+        return f"oauth:{self.client_id}"
+
+    def _token_cache_credentials(self) -> Tuple[str, str]:
+        return self.client_id, self.client_secret
 
     def _request_access_token(self) -> AccessToken:
         """Request a new an API access token using client credentials flow."""
@@ -182,16 +474,18 @@ class ApiClientCredentialsProvider(CredentialsProvider):
 
             logger.debug(resp.content)
             resp_data = resp.json()
+            issued = datetime.now(timezone.utc)
+            self._access_token_issued = (resp_data["access_token"], issued)
             return AccessToken(
                 type="oauth",
                 token=resp_data["access_token"],
-                expires=datetime.now(timezone.utc) + timedelta(seconds=resp_data["expires_in"]),
+                expires=issued + timedelta(seconds=resp_data["expires_in"]),
                 scope=resp_data["scope"].split(),
             )
 
 
 class UserCredentialsProvider(CredentialsProvider):
-    def __init__(self, username: str, password: str):
+    def __init__(self, username: str, password: str, token_cache: Optional["TokenCache"] = None):
         """Credentials provider that uses a username and password for obtaining access
         tokens.
 
@@ -200,10 +494,22 @@ class UserCredentialsProvider(CredentialsProvider):
 
         :param password: The Jamf Pro API password.
         :type password: str
+
+        :param token_cache: (optional) A :class:`~jamf_pro_sdk.clients.token_cache.TokenCache` to
+            share unexpired tokens with other processes using the same credentials.
+        :type token_cache: TokenCache
         """
         self.username = username
         self.password = password
         super().__init__()
+        self.token_cache = token_cache
+
+    @property
+    def identity(self) -> str:
+        return f"user:{self.username}"
+
+    def _token_cache_credentials(self) -> Tuple[str, str]:
+        return self.username, self.password
 
     def _request_access_token(self) -> AccessToken:
         """Request a new an API access token using user authentication."""
@@ -227,6 +533,99 @@ class UserCredentialsProvider(CredentialsProvider):
             return AccessToken(type="user", **resp.json())
 
 
+class PooledCredentialsProvider(CredentialsProvider):
+    def __init__(
+        self,
+        providers: Iterable[CredentialsProvider],
+        strategy: Literal["round_robin", "least_recently_throttled"] = "round_robin",
+    ):
+        """A credentials provider that spreads requests across a pool of credentials providers.
+
+        Jamf Pro rate limits each API client separately. Handing out tokens from several API
+        clients lets the aggregate throughput of concurrent requests scale with the size of the
+        pool.
+
+        .. code-block:: python
+
+            >>> credentials = PooledCredentialsProvider(
+            ...     [
+            ...         ApiClientCredentialsProvider("client_id_1", "client_secret_1"),
+            ...         ApiClientCredentialsProvider("client_id_2", "client_secret_2"),
+            ...     ],
+            ...     strategy="least_recently_throttled",
+            ... )
+
+        :param providers: The credentials providers in the pool. Each obtains and refreshes its
+            own tokens.
+        :type providers: Iterable[CredentialsProvider]
+
+        :param strategy: How a provider is chosen for each request. ``round_robin`` cycles
+            through the pool. ``least_recently_throttled`` also cycles through the pool but
+            moves a provider to the back when a request made with its token is throttled.
+        :type strategy: str
+        """
+        self.providers: List[CredentialsProvider] = list(providers)
+        if not self.providers:
+            raise ValueError("At least one credentials provider is required")
+        if strategy not in ("round_robin", "least_recently_throttled"):
+            raise ValueError(f"Unsupported strategy: {strategy}")
+
+        self.strategy = strategy
+        self._pool_lock = Lock()
+        self._next_index = 0
+        # Per provider: (time last throttled, selection counter when last used)
+        self._usage: List[Tuple[float, int]] = [(0.0, 0)] * len(self.providers)
+        self._selections = 0
+        super().__init__()
+
+    def attach_client(self, client: "JamfProClient"):
+        super().attach_client(client)
+        for provider in self.providers:
+            provider.attach_client(client)
+
+    def close(self) -> None:
+        for provider in self.providers:
+            provider.close()
+
+    @property
+    def identity(self) -> str:
+        return "pool:" + ",".join(sorted(p.identity for p in self.providers))
+
+    def _select_provider(self) -> CredentialsProvider:
+        with self._pool_lock:
+            self._selections += 1
+            if self.strategy == "round_robin":
+                index = self._next_index
+                self._next_index = (index + 1) % len(self.providers)
+            else:
+                index = min(range(len(self.providers)), key=self._usage.__getitem__)
+                self._usage[index] = (self._usage[index][0], self._selections)
+            return self.providers[index]
+
+    def get_access_token(self, thread_lock: Lock = None) -> AccessToken:
+        """Obtain an access token from the next provider in the pool.
+
+        :return: An ``AccessToken`` object.
+        :rtype: AccessToken
+        """
+        return self._select_provider().get_access_token(thread_lock)
+
+    def report_throttled(self, access_token: AccessToken) -> None:
+        for index, provider in enumerate(self.providers):
+            if provider._access_token.token == access_token.token:
+                logger.debug("Credentials provider %d in pool was throttled", index)
+                with self._pool_lock:
+                    self._usage[index] = (time.monotonic(), self._usage[index][1])
+                provider.report_throttled(access_token)
+                return
+
+    def report_unauthorized(self, access_token: AccessToken) -> None:
+        for provider in self.providers:
+            if provider._access_token.token == access_token.token:
+                provider.report_unauthorized(access_token)
+                return
+
+
 @overload
 def prompt_for_credentials(
     provider_type: Type[UserCredentialsProvider],
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import base64
+import collections
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from ..models.client import CachePolicy
+
+logger = logging.getLogger("jamf_pro_sdk")
+
+# Response headers kept with a cached response
+CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+# Pro API resources that are named differently from the Classic API resource of the same records
+RESOURCE_ALIASES = {
+    "computersinventory": "computers",
+    "computersinventorydetail": "computers",
+}
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    stored_at: float
+    ttl: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.monotonic() - self.stored_at < self.ttl
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if etag := self.headers.get("ETag"):
+            headers["If-None-Match"] = etag
+        if last_modified := self.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def response(self) -> requests.Response:
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = self.url
+        response._content = self.content
+        return response
+
+
+def _hash(value: str) -> str:
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+def _resource(url: str) -> str:
+    """The resource a URL belongs to: the name after ``JSSResource`` or after the Pro API version
+    without hyphens. Classic API and Pro API URLs of the same records, and all Pro API versions,
+    share a resource so a write through either API removes the cached responses of both (e.g.
+    ``JSSResource/computergroups`` and ``api/v1/computer-groups`` are ``computergroups``).
+    """
+    parts = urlparse(url).path.strip("/").split("/")
+    if parts[0] == "api" and len(parts) > 2:
+        name = parts[2]
+    else:
+        name = parts[1] if len(parts) > 1 else parts[0]
+    name = name.replace("-", "").lower()
+    return RESOURCE_ALIASES.get(name, name)
+
+
+class ResponseCache:
+    def __init__(self, policy: CachePolicy, server: str = "", identity: str = ""):
+        """A thread safe cache of ``GET`` responses used by the client's ``_send_request``. See
+        :class:`~jamf_pro_sdk.models.client.CachePolicy` for the caching behavior.
+
+        Persisted responses are stored under a directory for the server and one for the
+        credentials identity within it, so clients using other credentials (which may have other
+        privileges) are never served them.
+
+        :param policy: The cache policy.
+        :type policy: CachePolicy
+
+        :param server: The base URL of the Jamf Pro server.
+        :type server: str
+
+        :param identity: Identifies the credentials the responses are requested with.
+        :type identity: str
+        """
+        self.policy = policy
+        self.directory = Path(policy.directory).expanduser() if policy.directory else None
+        self.server = server
+        self.identity = identity
+        self._entries: collections.OrderedDict[str, CacheEntry] = collections.OrderedDict()
+        self._size = 0
+        # Incremented on every invalidation so responses requested before it are not stored
+        self._generation = 0
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(request: Dict[str, Any]) -> str:
+        url = requests.Request("GET", request["url"], params=request.get("params")).prepare().url
+        return f"{url} {request['headers'].get('Accept', '')}"
+
+    @property
+    def _server_directory(self) -> Path:
+        return self.directory / _hash(self.server)
+
+    def _entry_path(self, key: str) -> Path:
+        resource = _resource(key.split(" ", 1)[0])
+        return (
+            self._server_directory / _hash(self.identity) / _hash(resource) / f"{_hash(key)}.json"
+        )
+
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        path = self._entry_path(key)
+        try:
+            data = json.loads(path.read_text())
+            # Entries are stored with their age since monotonic time does not carry across
+            # processes
+            return CacheEntry(
+                url=str(data["url"]),
+                status_code=int(data["status_code"]),
+                headers=dict(data["headers"]),
+                content=base64.b64decode(data["content"], validate=True),
+                stored_at=time.monotonic() - (time.time() - float(data["stored_at"])),
+                ttl=float(data["ttl"]),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            # binascii.Error (bad base64) is a ValueError
+            logger.debug("Removing unreadable cached response %s: %s", path, error)
+            path.unlink(missing_ok=True)
+            return None
+
+    def _save(self, key: str, entry: CacheEntry):
+        path = self._entry_path(key)
+        data = {
+            "url": entry.url,
+            "status_code": entry.status_code,
+            "headers": entry.headers,
+            "content": base64.b64encode(entry.content).decode(),
+            "stored_at": time.time() - (time.monotonic() - entry.stored_at),
+            "ttl": entry.ttl,
+        }
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # Write to a temporary file and rename so other processes never read a partial file
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as error:
+            logger.warning("Unable to write cached response: %s", error)
+
+    def _remove(self, key: str):
+        if entry := self._entries.pop(key, None):
+            self._size -= len(entry.content)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for a key (fresh or stale), or ``None``."""
+        with self._lock:
+            if entry := self._entries.get(key):
+                self._entries.move_to_end(key)
+                return entry
+        if self.directory and (entry := self._load(key)):
+            self.put(key, entry, persist=False)
+            return entry
+        return None
+
+    def put(self, key: str, entry: CacheEntry, persist: bool = True):
+        """Store an entry and remove the least recently used entries over the memory bounds."""
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self._size += len(entry.content)
+            while self._entries and (
+                len(self._entries) > self.policy.max_entries or self._size > self.policy.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+        if persist and self.directory:
+            self._save(key, entry)
+
+    def invalidate(self, url: Optional[str] = None):
+        """Remove the cached responses of the resource a URL belongs to, or all cached responses
+        of the server if no URL is given. Responses persisted for other credentials identities
+        are removed too.
+
+        :param url: (optional) A request URL.
+        :type url: str
+        """
+        resource = _resource(url) if url else None
+        with self._lock:
+            self._generation += 1
+            for key in list(self._entries):
+                if resource is None or _resource(key.split(" ", 1)[0]) == resource:
+                    self._remove(key)
+
+        if self.directory:
+            if resource is None:
+                shutil.rmtree(self._server_directory, ignore_errors=True)
+                return
+            # The change is visible to every identity on the server
+            try:
+                identity_directories = list(self._server_directory.iterdir())
+            except OSError:
+                return
+            for path in identity_directories:
+                shutil.rmtree(path / _hash(resource), ignore_errors=True)
+
+    def fetch(
+        self, request: Dict[str, Any], send: Callable[[Dict[str, Any]], requests.Response]
+    ) -> requests.Response:
+        """Return the response to a ``GET`` request from the cache, or send it with ``send``
+        and cache the response.
+
+        :param request: The keyword arguments for ``requests.Session.request``.
+        :type request: dict
+
+        :param send: Sends the request.
+        :type send: Callable
+        """
+        ttl = self.policy.ttl_for(urlparse(request["url"]).path)
+        if not ttl:
+            return send(request)
+
+        key = self._key(request)
+        entry = self.get(key)
+        if entry and entry.is_fresh:
+            return entry.response()
+
+        if entry:
+            request["headers"].update(entry.conditional_headers())
+
+        generation = self._generation
+        response = send(request)
+        if entry and response.status_code == 304:
+            entry.stored_at = time.monotonic()
+            if generation == self._generation:
+                self.put(key, entry)
+            return entry.response()
+
+        if response.status_code == 200 and generation == self._generation:
+            self.put(
+                key,
+                CacheEntry(
+                    url=response.url,
+                    status_code=response.status_code,
+                    headers={
+                        k: response.headers[k] for k in CACHED_HEADERS if k in response.headers
+                    },
+                    content=response.content,
+                    stored_at=time.monotonic(),
+                    ttl=ttl,
+                ),
+            )
+        return response
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import secrets
 import string
-from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Union
+from typing import Any, Callable, Iterable, Iterator, List, Optional, TypeVar, Union
 
 from defusedxml.ElementTree import fromstring
 
@@ -21,9 +21,10 @@ from ..models.classic.computers import (
     ClassicComputersItem,
 )
 from ..models.classic.packages import ClassicPackage, ClassicPackageItem
+from .decoders import JsonDecoder
+from .operations import Operation, run_operation
 
-if TYPE_CHECKING:
-    import requests
+T = TypeVar("T")
 
 VALID_COMPUTER_SUBSETS = (
     "general",
@@ -52,16 +53,23 @@ def parse_response_id(xml: str) -> int:
     return int(root.find("id").text)
 
 
-class ClassicApi:
-    """Provides a curated interface to the Jamf Pro Classic API."""
+class ClassicApiOperations:
+    """The Classic API operations shared by :class:`ClassicApi` and
+    :class:`~jamf_pro_sdk.clients.aio.classic_api.AsyncClassicApi`.
+
+    Each operation is an :data:`~jamf_pro_sdk.clients.operations.Operation`: it builds the
+    requests and parses the responses, and the client classes only send the requests.
+    """
 
     def __init__(
         self,
-        request_method: Callable[..., requests.Response],
-        concurrent_requests_method: Callable[..., Iterator],
+        request_method: Callable[..., Any],
+        concurrent_requests_method: Callable[..., Any],
+        json_decoder: Optional[JsonDecoder] = None,
     ):
         self.api_request = request_method
         self.concurrent_api_requests = concurrent_requests_method
+        self.json_decoder = json_decoder or JsonDecoder()
 
     @staticmethod
     def _parse_id(model: Union[int, object]) -> int:
@@ -77,6 +85,246 @@ class ClassicApi:
 
     # /categories APIs
 
+    def _list_all_categories(self) -> Operation[List[ClassicCategoriesItem]]:
+        resp = yield {"method": "get", "resource_path": "categories"}
+        return self.json_decoder.validate_list(
+            ClassicCategoriesItem, resp.content, root="categories"
+        )
+
+    def _get_category_by_id(self, category: CategoryId) -> Operation[ClassicCategory]:
+        category_id = self._parse_id(category)
+        resp = yield {"method": "get", "resource_path": f"categories/id/{category_id}"}
+        return self.json_decoder.validate(ClassicCategory, resp.content, root="category")
+
+    def _update_category_by_id(
+        self, category: CategoryId, data: Union[str, ClassicCategory]
+    ) -> Operation[None]:
+        category_id = self._parse_id(category)
+        yield {"method": "put", "resource_path": f"categories/id/{category_id}", "data": data}
+
+    def _delete_category_by_id(self, category: CategoryId) -> Operation[None]:
+        category_id = self._parse_id(category)
+        yield {"method": "delete", "resource_path": f"categories/id/{category_id}"}
+
+    def _create_category(self, data: Union[str, ClassicCategory]) -> Operation[int]:
+        resp = yield {"method": "post", "resource_path": "categories/id/0", "data": data}
+        return parse_response_id(resp.text)
+
+    # /computers APIs
+
+    def _list_all_computers(
+        self, subsets: Iterable[str] = None
+    ) -> Operation[List[ClassicComputersItem]]:
+        if subsets:
+            if not all(i.lower() in ("basic",) for i in subsets):
+                raise ValueError(f"Invalid subset(s). Must be one of: ('basic').")
+            path = "computers/subset/basic"
+        else:
+            path = "computers"
+
+        resp = yield {"method": "get", "resource_path": path}
+        return self.json_decoder.validate_list(ClassicComputersItem, resp.content, root="computers")
+
+    def _get_computer_by_id(
+        self, computer: ComputerId, subsets: Iterable[str] = None
+    ) -> Operation[ClassicComputer]:
+        computer_id = self._parse_id(computer)
+        if subsets:
+            if not all(i.lower() in VALID_COMPUTER_SUBSETS for i in subsets):
+                raise ValueError(f"Invalid subset(s). Must be one of: {VALID_COMPUTER_SUBSETS}.")
+            path = f"computers/id/{computer_id}/subset/{'&'.join(subsets)}"
+        else:
+            path = f"computers/id/{computer_id}"
+
+        resp = yield {"method": "get", "resource_path": path}
+        return self.json_decoder.validate(ClassicComputer, resp.content, root="computer")
+
+    def _update_computer_by_id(
+        self, computer: ComputerId, data: Union[str, ClassicComputer]
+    ) -> Operation[None]:
+        computer_id = self._parse_id(computer)
+        yield {"method": "put", "resource_path": f"computers/id/{computer_id}", "data": data}
+
+    def _delete_computer_by_id(self, computer: ComputerId) -> Operation[None]:
+        computer_id = self._parse_id(computer)
+        yield {"method": "delete", "resource_path": f"computers/id/{computer_id}"}
+
+    def _set_computer_unmanaged_by_id(self, computer: ComputerId) -> Operation[None]:
+        data = {
+            "general": {
+                "remote_management": {
+                    "managed": False,
+                    "management_username": "",
+                    "management_password": "",
+                }
+            }
+        }
+        update_management = ClassicComputer(**data)
+        computer_id = self._parse_id(computer)
+        yield {
+            "method": "put",
+            "resource_path": f"computers/id/{computer_id}",
+            "data": update_management,
+        }
+
+    def _set_computer_managed_by_id(
+        self, computer: ComputerId, management_user: str = "admin", management_password: str = None
+    ) -> Operation[None]:
+        if not management_password:
+            management_password = "".join(
+                secrets.choice(string.ascii_letters + string.punctuation) for _ in range(16)
+            )
+        computer_id = self._parse_id(computer)
+
+        data = {
+            "general": {
+                "remote_management": {
+                    "managed": True,
+                    "management_username": management_user,
+                    "management_password": management_password,
+                }
+            }
+        }
+        manage_computer = ClassicComputer(**data)
+        yield {
+            "method": "put",
+            "resource_path": f"computers/id/{computer_id}",
+            "data": manage_computer,
+        }
+
+    # /computergroups APIs
+
+    def _create_computer_group(self, data: Union[str, ClassicComputerGroup]) -> Operation[int]:
+        resp = yield {"method": "post", "resource_path": "computergroups/id/0", "data": data}
+        return parse_response_id(resp.text)
+
+    def _list_all_computer_groups(self) -> Operation[List[ClassicComputerGroup]]:
+        resp = yield {"method": "get", "resource_path": "computergroups"}
+        return self.json_decoder.validate_list(
+            ClassicComputerGroup, resp.content, root="computer_groups"
+        )
+
+    def _get_computer_group_by_id(self, computer_group_id: int) -> Operation[ClassicComputerGroup]:
+        resp = yield {"method": "get", "resource_path": f"computergroups/id/{computer_group_id}"}
+        return self.json_decoder.validate(ClassicComputerGroup, resp.content, root="computer_group")
+
+    def _update_smart_computer_group_by_id(
+        self, computer_group_id: int, data: Union[str, ClassicComputerGroup]
+    ) -> Operation[None]:
+        yield {
+            "method": "put",
+            "resource_path": f"computergroups/id/{computer_group_id}",
+            "data": data,
+        }
+
+    def _update_static_computer_group_membership_by_id(
+        self,
+        computer_group_id: int,
+        computers_to_add: Iterable[Union[int, ClassicComputerGroupMember]] = None,
+        computers_to_remove: Iterable[Union[int, ClassicComputerGroupMember]] = None,
+    ) -> Operation[None]:
+        group_update = ClassicComputerGroupMembershipUpdate()
+
+        if computers_to_add:
+            group_update.computer_additions = []
+            for i in computers_to_add:
+                group_update.computer_additions.append(
+                    ClassicComputerGroupMember(id=i) if isinstance(i, int) else i
+                )
+
+        if computers_to_remove:
+            group_update.computer_deletions = []
+            for i in computers_to_remove:
+                group_update.computer_deletions.append(
+                    ClassicComputerGroupMember(id=i) if isinstance(i, int) else i
+                )
+
+        yield {
+            "method": "put",
+            "resource_path": f"computergroups/id/{computer_group_id}",
+            "data": group_update,
+        }
+
+    # /advancedcomputersearches APIs
+
+    def _create_advanced_computer_search(
+        self, data: Union[str, ClassicAdvancedComputerSearch]
+    ) -> Operation[int]:
+        resp = yield {"method": "post", "resource_path": "advancedcomputersearches", "data": data}
+        return parse_response_id(resp.text)
+
+    def _list_all_advanced_computer_searches(
+        self,
+    ) -> Operation[List[ClassicAdvancedComputerSearchesItem]]:
+        resp = yield {"method": "get", "resource_path": "advancedcomputersearches"}
+        return self.json_decoder.validate_list(
+            ClassicAdvancedComputerSearchesItem, resp.content, root="advanced_computer_searches"
+        )
+
+    def _get_advanced_computer_search_by_id(
+        self, advanced_search: AdvancedComputerSearchId
+    ) -> Operation[ClassicAdvancedComputerSearch]:
+        advanced_search_id = self._parse_id(advanced_search)
+        resp = yield {
+            "method": "get",
+            "resource_path": f"advancedcomputersearches/id/{advanced_search_id}",
+        }
+        return self.json_decoder.validate(
+            ClassicAdvancedComputerSearch, resp.content, root="advanced_computer_search"
+        )
+
+    def _update_advanced_computer_search_by_id(
+        self,
+        advanced_search: AdvancedComputerSearchId,
+        data: Union[str, ClassicAdvancedComputerSearch],
+        return_updated: bool = False,
+    ) -> Operation[Optional[ClassicAdvancedComputerSearch]]:
+        advanced_search_id = self._parse_id(advanced_search)
+        yield {
+            "method": "put",
+            "resource_path": f"advancedcomputersearches/id/{advanced_search_id}",
+            "data": data,
+        }
+        if return_updated:
+            return (yield from self._get_advanced_computer_search_by_id(advanced_search_id))
+
+    def _delete_advanced_computer_search_by_id(
+        self, advanced_search: AdvancedComputerSearchId
+    ) -> Operation[None]:
+        advanced_search_id = self._parse_id(advanced_search)
+        yield {
+            "method": "delete",
+            "resource_path": f"advancedcomputersearches/id/{advanced_search_id}",
+        }
+
+    # /packages APIs
+
+    def _create_package(self, data: Union[str, ClassicPackage]) -> Operation[int]:
+        resp = yield {"method": "post", "resource_path": "packages/id/0", "data": data}
+        return parse_response_id(resp.text)
+
+    def _list_all_packages(self) -> Operation[List[ClassicPackageItem]]:
+        resp = yield {"method": "get", "resource_path": "packages"}
+        return self.json_decoder.validate_list(ClassicPackageItem, resp.content, root="packages")
+
+    def _get_package_by_id(self, package: PackageId) -> Operation[ClassicPackage]:
+        package_id = self._parse_id(package)
+        resp = yield {"method": "get", "resource_path": f"packages/id/{package_id}"}
+        return self.json_decoder.validate(ClassicPackage, resp.content, root="package")
+
+    def _delete_package_by_id(self, package: PackageId) -> Operation[None]:
+        package_id = self._parse_id(package)
+        yield {"method": "delete", "resource_path": f"packages/id/{package_id}"}
+
+
+class ClassicApi(ClassicApiOperations):
+    """Provides a curated interface to the Jamf Pro Classic API."""
+
+    def _run(self, operation: Operation[T]) -> T:
+        return run_operation(operation, self.api_request)
+
+    # /categories APIs
+
     def list_all_categories(self) -> List[ClassicCategoriesItem]:
         """Returns a list of all categories.
 
@@ -84,8 +332,7 @@ class ClassicApi:
         :rtype: List[ClassicCategoriesItem]
 
         """
-        resp = self.api_request(method="get", resource_path="categories")
-        return [ClassicCategoriesItem(**i) for i in resp.json()["categories"]]
+        return self._run(self._list_all_categories())
 
     def get_category_by_id(self, category: CategoryId) -> ClassicCategory:
         """Returns a single category record using the ID.
@@ -97,9 +344,7 @@ class ClassicApi:
         :rtype: ClassicCategory
 
         """
-        category_id = ClassicApi._parse_id(category)
-        resp = self.api_request(method="get", resource_path=f"categories/id/{category_id}")
-        return ClassicCategory(**resp.json()["category"])
+        return self._run(self._get_category_by_id(category))
 
     def update_category_by_id(
         self, category: CategoryId, data: Union[str, ClassicCategory]
@@ -113,8 +358,7 @@ class ClassicApi:
             :class:`~jamf_pro_sdk.models.classic.categories.ClassicCategory` object.
         :type data: Union[str, ClassicCategory]
         """
-        category_id = ClassicApi._parse_id(category)
-        self.api_request(method="put", resource_path=f"categories/id/{category_id}", data=data)
+        self._run(self._update_category_by_id(category, data))
 
     def delete_category_by_id(self, category: CategoryId) -> None:
         """Delete a single category record using the ID.
@@ -123,8 +367,7 @@ class ClassicApi:
         :type category: Union[int, ClassicCategory, ClassicCategoriesItem]
 
         """
-        category_id = ClassicApi._parse_id(category)
-        self.api_request(method="delete", resource_path=f"categories/id/{category_id}")
+        self._run(self._delete_category_by_id(category))
 
     def create_category(self, data: Union[str, ClassicCategory]) -> int:
         """Create a new category.
@@ -137,8 +380,7 @@ class ClassicApi:
         :rtype: int
 
         """
-        resp = self.api_request(method="post", resource_path="categories/id/0", data=data)
-        return parse_response_id(resp.text)
+        return self._run(self._create_category(data))
 
     # /computers APIs
 
@@ -154,15 +396,7 @@ class ClassicApi:
         :rtype: List[~jamf_pro_sdk.models.classic.computers.ClassicComputersItem]
 
         """
-        if subsets:
-            if not all(i.lower() in ("basic",) for i in subsets):
-                raise ValueError(f"Invalid subset(s). Must be one of: ('basic').")
-            path = "computers/subset/basic"
-        else:
-            path = "computers"
-
-        resp = self.api_request(method="get", resource_path=path)
-        return [ClassicComputersItem(**i) for i in resp.json()["computers"]]
+        return self._run(self._list_all_computers(subsets))
 
     def get_computer_by_id(
         self, computer: ComputerId, subsets: Iterable[str] = None
@@ -182,16 +416,7 @@ class ClassicApi:
         :rtype: ~jamf_pro_sdk.models.classic.computers.ClassicComputer
 
         """
-        computer_id = ClassicApi._parse_id(computer)
-        if subsets:
-            if not all(i.lower() in VALID_COMPUTER_SUBSETS for i in subsets):
-                raise ValueError(f"Invalid subset(s). Must be one of: {VALID_COMPUTER_SUBSETS}.")
-            path = f"computers/id/{computer_id}/subset/{'&'.join(subsets)}"
-        else:
-            path = f"computers/id/{computer_id}"
-
-        resp = self.api_request(method="get", resource_path=path)
-        return ClassicComputer(**resp.json()["computer"])
+        return self._run(self._get_computer_by_id(computer, subsets))
 
     def get_computers(
         self, computers: List[ComputerId] = None, subsets: Iterable[str] = None
@@ -238,8 +463,7 @@ class ClassicApi:
         :type data: Union[str, ~jamf_pro_sdk.models.classic.computers.Computer]
 
         """
-        computer_id = ClassicApi._parse_id(computer)
-        self.api_request(method="put", resource_path=f"computers/id/{computer_id}", data=data)
+        self._run(self._update_computer_by_id(computer, data))
 
     def delete_computer_by_id(self, computer: ComputerId) -> None:
         """Delete a single computer record using the ID.
@@ -248,8 +472,7 @@ class ClassicApi:
         :type computer: Union[int, ClassicComputer, ClassicComputersItem]
 
         """
-        computer_id = ClassicApi._parse_id(computer)
-        self.api_request(method="delete", resource_path=f"computers/id/{computer_id}")
+        self._run(self._delete_computer_by_id(computer))
 
     def set_computer_unmanaged_by_id(self, computer: ComputerId) -> None:
         """Sets the management status to `unmanaged` for a single computer using the ID
@@ -260,20 +483,7 @@ class ClassicApi:
         :param computer: A computer ID or supported Classic API model.
         :type computer: Union[int,  ~jamf_pro_sdk.models.classic.computers.Computer, ComputersItem]
         """
-        data = {
-            "general": {
-                "remote_management": {
-                    "managed": False,
-                    "management_username": "",
-                    "management_password": "",
-                }
-            }
-        }
-        update_management = ClassicComputer(**data)
-        computer_id = ClassicApi._parse_id(computer)
-        self.api_request(
-            method="put", resource_path=f"computers/id/{computer_id}", data=update_management
-        )
+        self._run(self._set_computer_unmanaged_by_id(computer))
 
     def set_computer_managed_by_id(
         self, computer: ComputerId, management_user: str = "admin", management_password: str = None
@@ -293,25 +503,7 @@ class ClassicApi:
         :type management_password: str
 
         """
-        if not management_password:
-            management_password = "".join(
-                secrets.choice(string.ascii_letters + string.punctuation) for _ in range(16)
-            )
-        computer_id = ClassicApi._parse_id(computer)
-
-        data = {
-            "general": {
-                "remote_management": {
-                    "managed": True,
-                    "management_username": management_user,
-                    "management_password": management_password,
-                }
-            }
-        }
-        manage_computer = ClassicComputer(**data)
-        self.api_request(
-            method="put", resource_path=f"computers/id/{computer_id}", data=manage_computer
-        )
+        self._run(self._set_computer_managed_by_id(computer, management_user, management_password))
 
     # /computergroups APIs
 
@@ -334,8 +526,7 @@ class ClassicApi:
         :rtype: int
 
         """
-        resp = self.api_request(method="post", resource_path="computergroups/id/0", data=data)
-        return parse_response_id(resp.text)
+        return self._run(self._create_computer_group(data))
 
     def list_all_computer_groups(self) -> List[ClassicComputerGroup]:
         """Returns a list of all computer groups.
@@ -346,8 +537,7 @@ class ClassicApi:
         :rtype: List[~jamf_pro_sdk.models.classic.computer_groups.ClassicComputerGroup]
 
         """
-        resp = self.api_request(method="get", resource_path="computergroups")
-        return [ClassicComputerGroup(**i) for i in resp.json()["computer_groups"]]
+        return self._run(self._list_all_computer_groups())
 
     def get_computer_group_by_id(self, computer_group_id: int) -> ClassicComputerGroup:
         """Returns a single computer group record using the ID.
@@ -359,10 +549,7 @@ class ClassicApi:
         :rtype: ~jamf_pro_sdk.models.classic.computer_groups.ClassicComputerGroup
 
         """
-        resp = self.api_request(
-            method="get", resource_path=f"computergroups/id/{computer_group_id}"
-        )
-        return ClassicComputerGroup(**resp.json()["computer_group"])
+        return self._run(self._get_computer_group_by_id(computer_group_id))
 
     def update_smart_computer_group_by_id(
         self, computer_group_id: int, data: Union[str, ClassicComputerGroup]
@@ -384,11 +571,7 @@ class ClassicApi:
         :type data: Union[str, ClassicComputerGroup]
 
         """
-        self.api_request(
-            method="put",
-            resource_path=f"computergroups/id/{computer_group_id}",
-            data=data,
-        )
+        return self._run(self._update_smart_computer_group_by_id(computer_group_id, data))
 
     def update_static_computer_group_membership_by_id(
         self,
@@ -413,26 +596,10 @@ class ClassicApi:
         :type computers_to_remove: Iterable[Union[int, ClassicComputerGroupMember]]
 
         """
-        group_update = ClassicComputerGroupMembershipUpdate()
-
-        if computers_to_add:
-            group_update.computer_additions = []
-            for i in computers_to_add:
-                group_update.computer_additions.append(
-                    ClassicComputerGroupMember(id=i) if isinstance(i, int) else i
-                )
-
-        if computers_to_remove:
-            group_update.computer_deletions = []
-            for i in computers_to_remove:
-                group_update.computer_deletions.append(
-                    ClassicComputerGroupMember(id=i) if isinstance(i, int) else i
-                )
-
-        self.api_request(
-            method="put",
-            resource_path=f"computergroups/id/{computer_group_id}",
-            data=group_update,
+        self._run(
+            self._update_static_computer_group_membership_by_id(
+                computer_group_id, computers_to_add, computers_to_remove
+            )
         )
 
     # /advancedcomputersearches APIs
@@ -451,8 +618,7 @@ class ClassicApi:
         :rtype: int
 
         """
-        resp = self.api_request(method="post", resource_path="advancedcomputersearches", data=data)
-        return parse_response_id(resp.text)
+        return self._run(self._create_advanced_computer_search(data))
 
     def list_all_advanced_computer_searches(self) -> List[ClassicAdvancedComputerSearchesItem]:
         """Returns a list of all advanced computer searches.
@@ -461,11 +627,7 @@ class ClassicApi:
         :rtype: List[ClassicAdvancedComputerSearchesItem]
 
         """
-        resp = self.api_request(method="get", resource_path="advancedcomputersearches")
-        return [
-            ClassicAdvancedComputerSearchesItem(**i)
-            for i in resp.json()["advanced_computer_searches"]
-        ]
+        return self._run(self._list_all_advanced_computer_searches())
 
     def get_advanced_computer_search_by_id(self, advanced_search: AdvancedComputerSearchId):
         """Returns a single advanced computer search using the ID.
@@ -483,11 +645,7 @@ class ClassicApi:
         :rtype: ~jamf_pro_sdk.models.classic.advanced_computer_searches.ClassicAdvancedComputerSearch
 
         """
-        advanced_search_id = ClassicApi._parse_id(advanced_search)
-        resp = self.api_request(
-            method="get", resource_path=f"advancedcomputersearches/id/{advanced_search_id}"
-        )
-        return ClassicAdvancedComputerSearch(**resp.json()["advanced_computer_search"])
+        return self._run(self._get_advanced_computer_search_by_id(advanced_search))
 
     def update_advanced_computer_search_by_id(
         self,
@@ -513,14 +671,9 @@ class ClassicApi:
         :rtype: Union[None, ~jamf_pro_sdk.models.classic.advanced_computer_searches.ClassicAdvancedComputerSearch]
 
         """
-        advanced_search_id = ClassicApi._parse_id(advanced_search)
-        self.api_request(
-            method="put",
-            resource_path=f"advancedcomputersearches/id/{advanced_search_id}",
-            data=data,
+        return self._run(
+            self._update_advanced_computer_search_by_id(advanced_search, data, return_updated)
         )
-        if return_updated:
-            return self.get_advanced_computer_search_by_id(advanced_search_id)
 
     def delete_advanced_computer_search_by_id(self, advanced_search: AdvancedComputerSearchId):
         """Delete an advanced computer search using the ID.
@@ -529,11 +682,7 @@ class ClassicApi:
         :type advanced_search: Union[int, ClassicAdvancedComputerSearch, ClassicAdvancedComputerSearchesItem]
 
         """
-        advanced_search_id = ClassicApi._parse_id(advanced_search)
-        self.api_request(
-            method="delete",
-            resource_path=f"advancedcomputersearches/id/{advanced_search_id}",
-        )
+        return self._run(self._delete_advanced_computer_search_by_id(advanced_search))
 
     # /packages APIs
 
@@ -552,8 +701,7 @@ class ClassicApi:
         :rtype: int
 
         """
-        resp = self.api_request(method="post", resource_path="packages/id/0", data=data)
-        return parse_response_id(resp.text)
+        return self._run(self._create_package(data))
 
     def list_all_packages(self) -> List[ClassicPackageItem]:
         """Returns a list of all packages.
@@ -562,8 +710,7 @@ class ClassicApi:
         :rtype: List[~jamf_pro_sdk.models.classic.packages.ClassicPackageItem]
 
         """
-        resp = self.api_request(method="get", resource_path="packages")
-        return [ClassicPackageItem(**i) for i in resp.json()["packages"]]
+        return self._run(self._list_all_packages())
 
     def get_package_by_id(self, package: PackageId) -> ClassicPackage:
         """Returns a single package record using the ID.
@@ -575,9 +722,7 @@ class ClassicApi:
         :rtype: ~jamf_pro_sdk.models.classic.packages.ClassicPackage
 
         """
-        package_id = ClassicApi._parse_id(package)
-        resp = self.api_request(method="get", resource_path=f"packages/id/{package_id}")
-        return ClassicPackage(**resp.json()["package"])
+        return self._run(self._get_package_by_id(package))
 
     def delete_package_by_id(self, package: PackageId) -> None:
         """Delete a single computer record using the ID.
@@ -590,5 +735,4 @@ class ClassicApi:
         :type package: Union[int, ClassicPackage, ClassicPackageItem]
 
         """
-        package_id = ClassicApi._parse_id(package)
-        self.api_request(method="delete", resource_path=f"packages/id/{package_id}")
+        self._run(self._delete_package_by_id(package))
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import copy
+import logging
+import math
+import time
+from collections import deque
+from concurrent.futures import Future
+from threading import Condition, Lock
+from typing import Callable, Deque, Dict, Hashable, Optional
+
+import requests
+
+from ..helpers import parse_retry_after
+
+THROTTLE_STATUS_CODES = (429, 503)
+
+logger = logging.getLogger("jamf_pro_sdk")
+
+
+class AdaptiveConcurrencyLimiter:
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        initial_limit: Optional[int] = None,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 1.5,
+        latency_window: int = 100,
+    ):
+        """An additive-increase/multiplicative-decrease (AIMD) limit on the number of operations
+        that may run at once.
+
+        The limit is raised by one after each round of ``limit`` successful operations as long
+        as the 95th percentile latency stays within ``latency_tolerance`` of the lowest observed
+        p95. When an operation is throttled (a ``429`` or ``503`` response, or any response with a
+        ``Retry-After`` header) the limit is multiplied by ``decrease_factor`` and new operations
+        are held until the ``Retry-After`` period has passed. Only one decrease is applied for
+        operations that were already running when the limit was lowered.
+
+        :param max_limit: The highest value the limit can be raised to.
+        :type max_limit: int
+
+        :param min_limit: The lowest value the limit can be decreased to (defaults to ``1``).
+        :type min_limit: int
+
+        :param initial_limit: The starting limit (defaults to half of ``max_limit``).
+        :type initial_limit: int
+
+        :param decrease_factor: The multiplier applied to the limit when throttled.
+        :type decrease_factor: float
+
+        :param latency_tolerance: How far the p95 latency may rise above its baseline before the
+            limit stops increasing.
+        :type latency_tolerance: float
+
+        :param latency_window: The number of recent latency samples the p95 is calculated from.
+        :type latency_window: int
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+
+        if initial_limit is None:
+            initial_limit = math.ceil(self.max_limit / 2)
+        self._limit = max(self.min_limit, min(initial_limit, self.max_limit))
+
+        self._condition = Condition()
+        self._in_flight = 0
+        self._round_completions = 0
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+        self._baseline_p95: Optional[float] = None
+        self._last_decrease = 0.0
+        self._hold_until = 0.0
+
+    @property
+    def limit(self) -> int:
+        """The current concurrency limit."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """The number of operations currently running."""
+        return self._in_flight
+
+    @property
+    def p95_latency(self) -> Optional[float]:
+        """The 95th percentile latency (in seconds) of recent successful operations."""
+        with self._condition:
+            return self._p95()
+
+    def _p95(self) -> Optional[float]:
+        if not self._latencies:
+            return None
+        latencies = sorted(self._latencies)
+        return latencies[math.ceil(0.95 * len(latencies)) - 1]
+
+    def acquire(self) -> float:
+        """Block until an operation may start.
+
+        :return: The start time of the operation. Pass this value to :meth:`release`.
+        :rtype: float
+        """
+        with self._condition:
+            while True:
+                wait = self._hold_until - time.monotonic()
+                if wait <= 0 and self._in_flight < self._limit:
+                    break
+                self._condition.wait(timeout=wait if wait > 0 else None)
+
+            self._in_flight += 1
+            return time.monotonic()
+
+    def release(
+        self,
+        started: float,
+        throttled: bool = False,
+        retry_after: Optional[float] = None,
+        record: bool = True,
+    ) -> None:
+        """Record the outcome of an operation and free its slot.
+
+        :param started: The value returned by :meth:`acquire`.
+        :type started: float
+
+        :param throttled: Set to ``True`` if the server throttled the operation.
+        :type throttled: bool
+
+        :param retry_after: The number of seconds the server asked to wait before retrying.
+        :type retry_after: float
+
+        :param record: Set to ``False`` to free the slot without recording an outcome, e.g. for an
+            operation that failed without a response from the server.
+        :type record: bool
+        """
+        now = time.monotonic()
+        with self._condition:
+            self._in_flight -= 1
+            if record:
+                self._record(now, started, throttled, retry_after)
+            self._condition.notify_all()
+
+    def record(
+        self, started: float, throttled: bool = False, retry_after: Optional[float] = None
+    ) -> None:
+        """Record the outcome of one attempt of an operation without freeing the operation's slot.
+        Used when an operation is retried so each attempt is reported, and the time spent waiting
+        between attempts is not counted as latency.
+
+        :param started: The time the attempt started (``time.monotonic()``).
+        :type started: float
+
+        :param throttled: Set to ``True`` if the server throttled the attempt.
+        :type throttled: bool
+
+        :param retry_after: The number of seconds the server asked to wait before retrying.
+        :type retry_after: float
+        """
+        now = time.monotonic()
+        with self._condition:
+            self._record(now, started, throttled, retry_after)
+            self._condition.notify_all()
+
+    def _record(
+        self, now: float, started: float, throttled: bool, retry_after: Optional[float]
+    ) -> None:
+        if throttled or retry_after is not None:
+            if retry_after:
+                self._hold_until = max(self._hold_until, now + retry_after)
+            # Operations that started before the last decrease were already accounted for
+            if started >= self._last_decrease:
+                self._decrease(now)
+        else:
+            self._latencies.append(now - started)
+            self._round_completions += 1
+            if self._round_completions >= self._limit:
+                self._end_round()
+
+    def _decrease(self, now: float) -> None:
+        new_limit = max(self.min_limit, math.floor(self._limit * self.decrease_factor))
+        logger.info("AdaptiveConcurrency throttled: limit %d -> %d", self._limit, new_limit)
+        self._limit = new_limit
+        self._last_decrease = now
+        self._round_completions = 0
+
+    def _end_round(self) -> None:
+        self._round_completions = 0
+        p95 = self._p95()
+
+        if self._baseline_p95 is None or p95 < self._baseline_p95:
+            self._baseline_p95 = p95
+
+        if p95 <= self._baseline_p95 * self.latency_tolerance:
+            if self._limit < self.max_limit:
+                logger.debug(
+                    "AdaptiveConcurrency p95 %.3fs: limit %d -> %d",
+                    p95,
+                    self._limit,
+                    self._limit + 1,
+                )
+                self._limit += 1
+        else:
+            # Let the baseline drift towards sustained latency so growth can resume
+            self._baseline_p95 = self._baseline_p95 * 0.9 + p95 * 0.1
+            logger.debug("AdaptiveConcurrency p95 %.3fs: holding limit %d", p95, self._limit)
+
+    def observe(
+        self, started: float, response: Optional[requests.Response], release: bool = True
+    ) -> None:
+        """Release the slot for an operation using its HTTP response (or the response attached
+        to a raised ``HTTPError``) to determine if it was throttled.
+
+        :param started: The value returned by :meth:`acquire`, or the start time of the attempt
+            if ``release`` is ``False``.
+        :type started: float
+
+        :param response: The response of the operation, if there was one.
+        :type response: requests.Response
+
+        :param release: Set to ``False`` to only :meth:`record` the response of one attempt.
+        :type release: bool
+        """
+        report = self.release if release else self.record
+        if response is None:
+            report(started)
+        else:
+            report(
+                started,
+                throttled=response.status_code in THROTTLE_STATUS_CODES,
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
+
+
+class RequestCoalescer:
+    def __init__(self):
+        """Merges identical requests that are in flight at the same time into a single request
+        (single-flight).
+
+        The first caller for a key sends the request. Callers with the same key that arrive
+        before it has returned wait for it and receive a copy of its response, or its exception.
+        A call made after the response has returned sends a new request.
+        """
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = Lock()
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently in flight."""
+        return len(self._calls)
+
+    def call(self, key: Hashable, send: Callable[[], requests.Response]) -> requests.Response:
+        """Send a request, or wait for the identical request that is in flight.
+
+        :param key: Identifies identical requests.
+        :type key: Hashable
+
+        :param send: Sends the request and returns the response.
+        :type send: Callable
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return copy.copy(future.result())
+
+        try:
+            response = send()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                del self._calls[key]
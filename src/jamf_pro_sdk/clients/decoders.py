@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import functools
+import json
+from typing import Any, Generic, List, Optional, Tuple, Type, TypeVar, Union
+
+import pydantic_core
+from pydantic import BaseModel, Field, TypeAdapter, create_model
+
+from ..models.client import JsonBackends
+
+try:
+    import orjson
+except ImportError:
+    ORJSON_IS_INSTALLED = False
+    orjson = None
+else:
+    ORJSON_IS_INSTALLED = True
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class _PageResponse(BaseModel, Generic[M]):
+    totalCount: int
+    results: List[M]
+
+
+@functools.lru_cache(maxsize=None)
+def _adapter(model: Type[BaseModel], root: Optional[str], many: bool) -> TypeAdapter:
+    annotation: Any = List[model] if many else model
+    if root:
+        # Only the root member is validated: other top-level keys are ignored
+        annotation = create_model(f"{model.__name__}Root", value=(annotation, Field(alias=root)))
+    return TypeAdapter(annotation)
+
+
+class JsonDecoder:
+    def __init__(self, backend: Union[JsonBackends, str] = JsonBackends.stdlib):
+        """Decodes JSON response bodies and parses them into models using the configured backend.
+
+        - ``stdlib``: ``json.loads`` followed by ``model_validate``.
+        - ``pydantic``: The raw bytes are passed to pydantic-core's native parser and validated in
+          a single step. Plain decoding uses ``pydantic_core.from_json``.
+        - ``orjson``: ``orjson.loads`` followed by ``model_validate``. Requires the ``orjson``
+          extra dependency.
+
+        :param backend: The JSON backend.
+        :type backend: JsonBackends
+        """
+        self.backend = JsonBackends(backend)
+        if self.backend == JsonBackends.orjson and not ORJSON_IS_INSTALLED:
+            raise ImportError("The 'orjson' extra dependency is required.")
+
+    def loads(self, content: Union[bytes, str]) -> Any:
+        """Decode a JSON document.
+
+        :param content: The raw JSON.
+        :type content: bytes | str
+        """
+        if self.backend == JsonBackends.orjson:
+            return orjson.loads(content)
+        elif self.backend == JsonBackends.pydantic:
+            return pydantic_core.from_json(content)
+        return json.loads(content)
+
+    def validate(self, model: Type[M], content: Union[bytes, str], root: Optional[str] = None) -> M:
+        """Parse a JSON document into a model.
+
+        :param model: The model to parse the document as.
+        :type model: Type[BaseModel]
+
+        :param content: The raw JSON.
+        :type content: bytes | str
+
+        :param root: (optional) The key of the object to parse if the model is nested under a root
+            key (as in Classic API responses).
+        :type root: str
+        """
+        if self.backend == JsonBackends.pydantic:
+            if root:
+                return _adapter(model, root, False).validate_json(content).value
+            return model.model_validate_json(content)
+
+        data = self.loads(content)
+        return model.model_validate(data[root] if root else data)
+
+    def validate_list(
+        self, model: Type[M], content: Union[bytes, str], root: Optional[str] = None
+    ) -> List[M]:
+        """Parse a JSON array into a list of models. See :meth:`validate`."""
+        if self.backend == JsonBackends.pydantic:
+            result = _adapter(model, root, True).validate_json(content)
+            return result.value if root else result
+
+        data = self.loads(content)
+        return _adapter(model, None, True).validate_python(data[root] if root else data)
+
+    def validate_page(
+        self, model: Optional[Type[M]], content: Union[bytes, str]
+    ) -> Tuple[int, list]:
+        """Parse a Pro API page response (``{"totalCount": ..., "results": [...]}``).
+
+        :param model: The model to parse each result as. If ``None`` the results are returned as
+            decoded JSON.
+        :type model: Type[BaseModel]
+
+        :param content: The raw JSON.
+        :type content: bytes | str
+
+        :return: The ``totalCount`` and the list of results.
+        :rtype: Tuple[int, list]
+        """
+        if model and self.backend == JsonBackends.pydantic:
+            page = _PageResponse[model].model_validate_json(content)
+            return page.totalCount, page.results
+
+        data = self.loads(content)
+        results = data["results"]
+        if model:
+            results = [model.model_validate(i) for i in results]
+        return data["totalCount"], results
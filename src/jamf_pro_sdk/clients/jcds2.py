@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import io
 import logging
 import math
+import mmap
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import TYPE_CHECKING, Callable, Iterator, Union
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, Union
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -19,10 +21,13 @@ else:
 
 from ..models.classic.packages import ClassicPackage
 from ..models.pro.jcds2 import NewFile
+from ..models.pro.packages import Package
+from .pro_api.pagination import FilterField
 
 if TYPE_CHECKING:
     from .classic_api import ClassicApi
     from .pro_api import ProApi
+    from .retry import RetryHandler
 
 CHUNK_SIZE = 1024 * 1024 * 20  # 20 MB
 
@@ -37,22 +42,98 @@ class JCDS2FileNotFoundError(Exception):
     """The requested file does not exist in the JCDS."""
 
 
+class ChunkReader(io.RawIOBase):
+    def __init__(self, buffer: mmap.mmap, start: int, end: int):
+        """A read-only, seekable file-like window over a range of a memory-mapped file.
+
+        Reads copy directly from the mapping into the caller's buffer, so a chunk is never held
+        in memory as a whole. Closing the reader releases its view of the mapping.
+
+        :param buffer: The memory-mapped file.
+        :type buffer: mmap.mmap
+
+        :param start: The offset of the first byte of the window.
+        :type start: int
+
+        :param end: The offset after the last byte of the window.
+        :type end: int
+        """
+        super().__init__()
+        self._view = memoryview(buffer)[start:end]
+        self._position = 0
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError("Negative seek position")
+        self._position = offset
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        data = self._view[self._position : self._position + len(buffer)]
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
 class FileUpload:
-    """Represents a file that will be uploaded to the JCDS."""
+    """Represents a file that will be uploaded to the JCDS.
+
+    Use the object as a context manager to memory-map the file while chunks are read with
+    :meth:`chunk_reader`.
+    """
 
     def __init__(self, path: Path):
         self.path = path
         self.size = path.stat().st_size
         self.total_chunks = math.ceil(self.size / CHUNK_SIZE)
+        self._fobj = None
+        self._mmap: Optional[mmap.mmap] = None
+
+    def __enter__(self):
+        self._fobj = open(self.path, "rb")
+        if self.size:
+            self._mmap = mmap.mmap(self._fobj.fileno(), 0, access=mmap.ACCESS_READ)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._mmap:
+            self._mmap.close()
+            self._mmap = None
+        self._fobj.close()
+        self._fobj = None
+
+    def chunk_reader(self, chunk_number: int) -> ChunkReader:
+        """Returns a file-like reader over the range of bytes for a given chunk (index). The file
+        must be opened by entering the ``FileUpload`` context.
+        """
+        if chunk_number >= self.total_chunks:
+            raise ValueError(f"Chunk number must be less than {self.total_chunks}")
+        if not self._mmap:
+            raise RuntimeError("The file is not open")
 
-    def get_chunk(self, chunk_number: int) -> bytes:
-        """Returns a range of bytes for a given chunk (index)."""
-        if chunk_number > self.total_chunks:
-            raise ValueError(f"Chunk number must be less than or equal to {self.total_chunks}")
-
-        with open(self.path, "rb") as fobj:
-            fobj.seek(chunk_number * CHUNK_SIZE)
-            return fobj.read(CHUNK_SIZE)
+        start = chunk_number * CHUNK_SIZE
+        return ChunkReader(self._mmap, start, min(start + CHUNK_SIZE, self.size))
 
 
 class JCDS2:
@@ -63,10 +144,12 @@ class JCDS2:
         classic_api_client: ClassicApi,
         pro_api_client: ProApi,
         concurrent_requests_method: Callable[..., Iterator],
+        retry_handler: Optional[RetryHandler] = None,
     ):
         self.classic_api_client = classic_api_client
         self.pro_api_client = pro_api_client
         self.concurrent_api_requests = concurrent_requests_method
+        self.retry_handler = retry_handler
 
     @staticmethod
     def _upload_file(s3_client, jcds_file: NewFile, file_upload: FileUpload):
@@ -88,19 +171,20 @@ class JCDS2:
 
         multipart_upload_parts = list()
 
-        for r in self.concurrent_api_requests(
-            handler=self._upload_part,
-            arguments=[
-                {
-                    "s3_client": s3_client,
-                    "part_number": i,
-                    "file_upload": file_upload,
-                    "multipart_upload": multipart_upload,
-                }
-                for i in range(1, file_upload.total_chunks + 1)
-            ],
-        ):
-            multipart_upload_parts.append(r)
+        with file_upload:
+            for r in self.concurrent_api_requests(
+                handler=self._upload_part,
+                arguments=[
+                    {
+                        "s3_client": s3_client,
+                        "part_number": i,
+                        "file_upload": file_upload,
+                        "multipart_upload": multipart_upload,
+                    }
+                    for i in range(1, file_upload.total_chunks + 1)
+                ],
+            ):
+                multipart_upload_parts.append(r)
 
         try:
             multipart_upload_complete = s3_client.complete_multipart_upload(
@@ -120,20 +204,49 @@ class JCDS2:
             logger.debug(multipart_aborted)
             raise
 
-    @staticmethod
-    def _upload_part(s3_client, multipart_upload: dict, part_number: int, file_upload: FileUpload):
+    def _upload_part(
+        self, s3_client, multipart_upload: dict, part_number: int, file_upload: FileUpload
+    ):
         logger.info("JCDS2-UploadMultipart-Part %s %s", part_number, file_upload.path.name)
-        # TODO: Retry functionality if a part upload fails
-        part_resp = s3_client.upload_part(
-            Body=file_upload.get_chunk(part_number - 1),
-            Bucket=multipart_upload["Bucket"],
-            Key=multipart_upload["Key"],
-            PartNumber=part_number,
-            UploadId=multipart_upload["UploadId"],
-        )
+
+        def upload_part():
+            with file_upload.chunk_reader(part_number - 1) as body:
+                return s3_client.upload_part(
+                    Body=body,
+                    Bucket=multipart_upload["Bucket"],
+                    Key=multipart_upload["Key"],
+                    PartNumber=part_number,
+                    UploadId=multipart_upload["UploadId"],
+                )
+
+        # Uploading a part number again replaces the previous upload, so it is safe to retry
+        if self.retry_handler:
+            part_resp = self.retry_handler.call(upload_part, method="PUT")
+        else:
+            part_resp = upload_part()
         logger.debug(part_resp)
         return {"PartNumber": part_number, "ETag": part_resp["ETag"]}
 
+    def find_package_by_file_name(self, file_name: str) -> Optional[Package]:
+        """Return the package associated to a file name, or ``None`` if there is none.
+
+        A single Pro API request filtered on the ``fileName`` is made instead of reading every
+        package.
+
+        :param file_name: The file name of the package.
+        :type file_name: str
+
+        :return: The package.
+        :rtype: ~jamf_pro_sdk.models.pro.packages.Package
+        """
+        # Quote the value so spaces and RSQL operators in file names are matched literally
+        escaped = file_name.replace("\\", "\\\\").replace('"', '\\"')
+        packages = self.pro_api_client.get_packages_v1(
+            filter_expression=FilterField("fileName").eq(f'"{escaped}"')
+        )
+        # The filter may match more than the exact name (e.g. with wildcards)
+        return next((p for p in packages if p.fileName == file_name), None)
+
     def upload_file(self, file_path: Union[str, Path]) -> None:
         """Upload a file to the JCDS and create the package object.
 
@@ -162,16 +275,10 @@ class JCDS2:
 
         file_upload = FileUpload(file_path)
 
-        packages = [
-            self.classic_api_client.get_package_by_id(p)
-            for p in self.classic_api_client.list_all_packages()
-        ]
-
-        for p in packages:
-            if file_upload.path.name == p.filename:
-                raise JCDS2FileExistsError(
-                    f"The file '{file_upload.path.name}' exists and is associated to package ({p.id}) '{p.name}'"
-                )
+        if p := self.find_package_by_file_name(file_upload.path.name):
+            raise JCDS2FileExistsError(
+                f"The file '{file_upload.path.name}' exists and is associated to package ({p.id}) '{p.packageName}'"
+            )
 
         new_jcds_file = self.pro_api_client.create_jcds_file_v1()
 
@@ -202,16 +309,25 @@ class JCDS2:
             new_pkg_resp = self.classic_api_client.create_package(data=new_package)
             logger.debug(new_pkg_resp)
 
-    @staticmethod
-    def _download_range(session: requests.Session, url: str, index: int, temp_dir: str):
+    def _download_range(self, session: requests.Session, url: str, index: int, temp_dir: str):
         range_start = index * CHUNK_SIZE
         range_end = ((index + 1) * CHUNK_SIZE) - 1
-        with session.get(
-            url, headers={"Range": f"bytes={range_start}-{range_end}"}, timeout=60
-        ) as range_response:
-            logger.debug(range_response.headers)
-            with open(temp_dir + f"/chunk_{str(index).zfill(9)}", "wb") as fobj:
-                fobj.write(range_response.content)
+
+        def download_range() -> requests.Response:
+            with session.get(
+                url, headers={"Range": f"bytes={range_start}-{range_end}"}, timeout=60
+            ) as resp:
+                return resp
+
+        if self.retry_handler:
+            range_response = self.retry_handler.call(download_range, method="GET")
+        else:
+            range_response = download_range()
+
+        logger.debug(range_response.headers)
+        range_response.raise_for_status()
+        with open(temp_dir + f"/chunk_{str(index).zfill(9)}", "wb") as fobj:
+            fobj.write(range_response.content)
 
     def download_file(self, file_name: str, download_path: Union[str, Path]) -> None:
         """Download a file from the JCDS by filename.
@@ -241,11 +357,13 @@ class JCDS2:
             else:
                 raise
 
-        # TODO: Retry feature that's not relying on urllib3's implementation
+        # urllib3 retries are only used if the client does not have a retry policy
         download_session = requests.Session()
         download_session.mount(
             prefix="https://",
-            adapter=HTTPAdapter(max_retries=3, pool_connections=5, pool_maxsize=5),
+            adapter=HTTPAdapter(
+                max_retries=0 if self.retry_handler else 3, pool_connections=5, pool_maxsize=5
+            ),
         )
 
         with download_session.head(download_file.uri) as download_file_head:
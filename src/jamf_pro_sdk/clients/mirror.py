@@ -0,0 +1,415 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Type, Union
+
+from pydantic import BaseModel
+
+from ..models.classic.computer_groups import ClassicComputerGroup
+from ..models.pro.computers import Computer
+from ..models.pro.mobile_devices import MobileDevice
+from ..models.pro.packages import Package
+from .sync import (
+    ComputerInventorySync,
+    MobileDeviceInventorySync,
+    SnapshotStore,
+    SyncResult,
+    format_watermark,
+)
+
+if TYPE_CHECKING:
+    from . import JamfProClient
+
+# The indexed columns of each table and the record field they are read from
+COMPUTER_COLUMNS = {
+    "name": "general.name",
+    "serial_number": "hardware.serialNumber",
+    "udid": "udid",
+    "management_id": "general.managementId",
+    "last_contact_time": "general.lastContactTime",
+    "report_date": "general.reportDate",
+}
+MOBILE_DEVICE_COLUMNS = {
+    "name": "general.displayName",
+    "serial_number": "hardware.serialNumber",
+    "udid": "general.udid",
+    "last_inventory_update_date": "general.lastInventoryUpdateDate",
+}
+PACKAGE_COLUMNS = {
+    "package_name": "packageName",
+    "file_name": "fileName",
+}
+COMPUTER_GROUP_COLUMNS = {
+    "name": "name",
+}
+
+# Timestamp columns are stored in UTC so they compare correctly as text
+TIMESTAMP_COLUMNS = {
+    "last_contact_time",
+    "report_date",
+    "last_inventory_update_date",
+}
+
+
+def _read_field(record: dict, field: str) -> Any:
+    for key in field.split("."):
+        if not isinstance(record, dict):
+            return None
+        record = record.get(key)
+    return record
+
+
+def _column_value(column: str, value: Any) -> Any:
+    if value is None or column not in TIMESTAMP_COLUMNS:
+        return value
+    return format_watermark(datetime.fromisoformat(value.replace("Z", "+00:00")))
+
+
+class SqliteSnapshotStore(SnapshotStore):
+    def __init__(
+        self, connection: sqlite3.Connection, table: str, columns: Optional[Dict[str, str]] = None
+    ):
+        """A snapshot store kept in a table of a SQLite database. Each record is stored as JSON
+        in the ``data`` column next to indexed ``columns`` read from the record. Changes are
+        committed on :meth:`save`.
+
+        :param connection: The SQLite database connection.
+        :type connection: sqlite3.Connection
+
+        :param table: The name of the table.
+        :type table: str
+
+        :param columns: (optional) A mapping of column names to the (dotted) record fields they
+            hold. An index is created for each column.
+        :type columns: Dict[str, str]
+        """
+        self.connection = connection
+        self.table = table
+        self.columns = columns or {}
+
+        column_definitions = "".join(f", {i} TEXT" for i in self.columns)
+        with connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                f"(id TEXT PRIMARY KEY, data TEXT NOT NULL{column_definitions})"
+            )
+            for column in self.columns:
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {table}_{column} ON {table} ({column})"
+                )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks (name TEXT PRIMARY KEY, value TEXT)"
+            )
+
+        row = connection.execute("SELECT value FROM watermarks WHERE name = ?", (table,)).fetchone()
+        self.watermark = datetime.fromisoformat(row[0]) if row and row[0] else None
+
+    def get(self, record_id: str) -> Optional[dict]:
+        row = self.connection.execute(
+            f"SELECT data FROM {self.table} WHERE id = ?", (record_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def upsert(self, record_id: str, record: dict):
+        columns = ", ".join(["id", "data", *self.columns])
+        placeholders = ", ".join("?" * (len(self.columns) + 2))
+        values = [_column_value(k, _read_field(record, v)) for k, v in self.columns.items()]
+        self.connection.execute(
+            f"INSERT OR REPLACE INTO {self.table} ({columns}) VALUES ({placeholders})",
+            (record_id, json.dumps(record), *values),
+        )
+
+    def delete(self, record_id: str):
+        self.connection.execute(f"DELETE FROM {self.table} WHERE id = ?", (record_id,))
+
+    def ids(self) -> Set[str]:
+        return {i for (i,) in self.connection.execute(f"SELECT id FROM {self.table}")}
+
+    def records(self) -> Iterator[dict]:
+        return self.find()
+
+    def find(self, order_by: Optional[str] = None, **conditions: Any) -> Iterator[dict]:
+        """Return the records matching all of the conditions.
+
+        A condition is a column name and a value (e.g. ``serial_number="C02XK1"``). Add the
+        ``__lt``, ``__lte``, ``__gt``, ``__gte`` or ``__like`` suffix to the column name to
+        compare instead of match. A ``datetime`` value is compared against timestamp columns
+        in UTC.
+
+        :param order_by: (optional) The column to sort the results by. Prefix with ``-`` for
+            descending order.
+        :type order_by: str
+
+        :return: An iterator of the matching records.
+        :rtype: Iterator[dict]
+        """
+        operators = {"lt": "<", "lte": "<=", "gt": ">", "gte": ">=", "like": "LIKE"}
+        clauses, values = [], []
+        for key, value in conditions.items():
+            column, _, operator = key.partition("__")
+            if column not in self.columns or (operator and operator not in operators):
+                raise ValueError(f"Invalid condition: {key}")
+            if isinstance(value, datetime):
+                value = format_watermark(value)
+            clauses.append(f"{column} {operators.get(operator, '=')} ?")
+            values.append(value)
+
+        query = f"SELECT data FROM {self.table}"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        if order_by:
+            column = order_by.lstrip("-")
+            if column not in self.columns and column != "id":
+                raise ValueError(f"Invalid column: {column}")
+            query += f" ORDER BY {column} {'DESC' if order_by.startswith('-') else 'ASC'}"
+
+        for (data,) in self.connection.execute(query, values):
+            yield json.loads(data)
+
+    def replace_all(self, records: Dict[str, dict]) -> int:
+        """Replace the contents of the table with the ``records``. Returns the number of records
+        that were removed.
+        """
+        removed = self.ids() - set(records)
+        for record_id in removed:
+            self.delete(record_id)
+        for record_id, record in records.items():
+            self.upsert(record_id, record)
+        return len(removed)
+
+    def save(self):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO watermarks (name, value) VALUES (?, ?)",
+            (self.table, self.watermark.isoformat() if self.watermark else None),
+        )
+        self.connection.commit()
+
+
+class InventoryMirror:
+    def __init__(
+        self,
+        client: JamfProClient,
+        path: Union[str, Path],
+        computer_sections: Optional[List[str]] = None,
+        mobile_device_sections: Optional[List[str]] = None,
+    ):
+        """A local SQLite mirror of computer and mobile device inventory, packages, and Classic
+        API computer groups for running reports without requesting the records from Jamf Pro.
+
+        Computer and mobile device inventory is refreshed incrementally (see
+        :class:`~jamf_pro_sdk.clients.sync.InventorySync`). Packages and computer groups are
+        requested in full on every refresh.
+
+        Each table stores the record as JSON in the ``data`` column along with indexed columns
+        for common lookups. The ``connection`` can be used for ad-hoc SQL, including SQLite's
+        ``json_extract()`` on the ``data`` column.
+
+        :param client: A Jamf Pro client.
+        :type client: JamfProClient
+
+        :param path: The path to the SQLite database file. Use ``:memory:`` for a mirror that
+            is not persisted.
+        :type path: str | Path
+
+        :param computer_sections: (optional) The computer inventory sections to mirror (defaults
+            to ``GENERAL`` and ``HARDWARE``).
+        :type computer_sections: List[str]
+
+        :param mobile_device_sections: (optional) The mobile device inventory sections to mirror
+            (defaults to ``GENERAL`` and ``HARDWARE``).
+        :type mobile_device_sections: List[str]
+        """
+        self.client = client
+        self.connection = sqlite3.connect(str(path))
+
+        self.computers = SqliteSnapshotStore(self.connection, "computers", COMPUTER_COLUMNS)
+        self.mobile_devices = SqliteSnapshotStore(
+            self.connection, "mobile_devices", MOBILE_DEVICE_COLUMNS
+        )
+        self.packages = SqliteSnapshotStore(self.connection, "packages", PACKAGE_COLUMNS)
+        self.computer_groups = SqliteSnapshotStore(
+            self.connection, "computer_groups", COMPUTER_GROUP_COLUMNS
+        )
+
+        self._computer_sync = ComputerInventorySync(
+            client, self.computers, sections=computer_sections or ["GENERAL", "HARDWARE"]
+        )
+        self._mobile_device_sync = MobileDeviceInventorySync(
+            client, self.mobile_devices, sections=mobile_device_sections or ["GENERAL", "HARDWARE"]
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+
+    def _refresh_packages(self) -> SyncResult:
+        packages = {
+            i.id: i.model_dump(mode="json", exclude_unset=True)
+            for i in self.client.pro_api.get_packages_v1(page_size=2000, stream_records=True)
+        }
+        removed = self.packages.replace_all(packages)
+        self.packages.save()
+        return SyncResult(
+            updated=len(packages), removed=removed, total=len(self.packages), watermark=None
+        )
+
+    def _refresh_computer_groups(self) -> SyncResult:
+        group_ids = [i.id for i in self.client.classic_api.list_all_computer_groups()]
+        groups = {}
+        for group in self.client.concurrent_api_requests(
+            self.client.classic_api.get_computer_group_by_id, group_ids, return_exceptions=True
+        ):
+            # A partial result would remove groups that failed to be requested
+            if isinstance(group, Exception):
+                raise group
+            groups[str(group.id)] = group.model_dump(mode="json", exclude_unset=True)
+
+        removed = self.computer_groups.replace_all(groups)
+        self.computer_groups.save()
+        return SyncResult(
+            updated=len(groups),
+            removed=removed,
+            total=len(self.computer_groups),
+            watermark=None,
+        )
+
+    def refresh(
+        self,
+        prune: bool = False,
+        computers: bool = True,
+        mobile_devices: bool = True,
+        packages: bool = True,
+        computer_groups: bool = True,
+    ) -> Dict[str, SyncResult]:
+        """Update the mirror from Jamf Pro.
+
+        :param prune: (optional) Also remove computers and mobile devices that were deleted.
+            This requests the IDs of all devices.
+        :type prune: bool
+
+        :param computers: (optional) Refresh computer inventory.
+        :type computers: bool
+
+        :param mobile_devices: (optional) Refresh mobile device inventory.
+        :type mobile_devices: bool
+
+        :param packages: (optional) Refresh packages.
+        :type packages: bool
+
+        :param computer_groups: (optional) Refresh computer groups.
+        :type computer_groups: bool
+
+        :return: The result of each refreshed table.
+        :rtype: Dict[str, SyncResult]
+        """
+        results = {}
+        if computers:
+            results["computers"] = self._computer_sync.sync(prune=prune)
+        if mobile_devices:
+            results["mobile_devices"] = self._mobile_device_sync.sync(prune=prune)
+        if packages:
+            results["packages"] = self._refresh_packages()
+        if computer_groups:
+            results["computer_groups"] = self._refresh_computer_groups()
+        return results
+
+    @staticmethod
+    def _models(model: Type[BaseModel], records: Iterator[dict]) -> List[Any]:
+        return [model.model_validate(i) for i in records]
+
+    def get_computer(self, computer_id: Union[str, int]) -> Optional[Computer]:
+        """Return a computer by ID.
+
+        :param computer_id: The computer ID.
+        :type computer_id: str | int
+
+        :rtype: ~jamf_pro_sdk.models.pro.computers.Computer
+        """
+        record = self.computers.get(str(computer_id))
+        return Computer.model_validate(record) if record else None
+
+    def find_computers(self, order_by: Optional[str] = None, **conditions: Any) -> List[Computer]:
+        """Return the computers matching all of the conditions. See
+        :meth:`SqliteSnapshotStore.find`.
+
+        Columns: ``name``, ``serial_number``, ``udid``, ``management_id``,
+        ``last_contact_time``, ``report_date``.
+
+        .. code-block:: python
+
+            mirror.find_computers(serial_number="C02XK1")
+            mirror.find_computers(last_contact_time__lt=datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+        :rtype: List[~jamf_pro_sdk.models.pro.computers.Computer]
+        """
+        return self._models(Computer, self.computers.find(order_by, **conditions))
+
+    def get_mobile_device(self, mobile_device_id: Union[str, int]) -> Optional[MobileDevice]:
+        """Return a mobile device by ID.
+
+        :param mobile_device_id: The mobile device ID.
+        :type mobile_device_id: str | int
+
+        :rtype: ~jamf_pro_sdk.models.pro.mobile_devices.MobileDevice
+        """
+        record = self.mobile_devices.get(str(mobile_device_id))
+        return MobileDevice.model_validate(record) if record else None
+
+    def find_mobile_devices(
+        self, order_by: Optional[str] = None, **conditions: Any
+    ) -> List[MobileDevice]:
+        """Return the mobile devices matching all of the conditions. See
+        :meth:`SqliteSnapshotStore.find`.
+
+        Columns: ``name``, ``serial_number``, ``udid``, ``last_inventory_update_date``.
+
+        :rtype: List[~jamf_pro_sdk.models.pro.mobile_devices.MobileDevice]
+        """
+        return self._models(MobileDevice, self.mobile_devices.find(order_by, **conditions))
+
+    def find_packages(self, order_by: Optional[str] = None, **conditions: Any) -> List[Package]:
+        """Return the packages matching all of the conditions. See
+        :meth:`SqliteSnapshotStore.find`.
+
+        Columns: ``package_name``, ``file_name``.
+
+        :rtype: List[~jamf_pro_sdk.models.pro.packages.Package]
+        """
+        return self._models(Package, self.packages.find(order_by, **conditions))
+
+    def find_computer_groups(
+        self, order_by: Optional[str] = None, **conditions: Any
+    ) -> List[ClassicComputerGroup]:
+        """Return the computer groups matching all of the conditions. See
+        :meth:`SqliteSnapshotStore.find`.
+
+        Columns: ``name``.
+
+        :rtype: List[~jamf_pro_sdk.models.classic.computer_groups.ClassicComputerGroup]
+        """
+        return self._models(ClassicComputerGroup, self.computer_groups.find(order_by, **conditions))
+
+    def computer_group_ids(self, computer_id: Union[str, int]) -> List[int]:
+        """Return the IDs of the computer groups a computer is a member of.
+
+        :param computer_id: The computer ID.
+        :type computer_id: str | int
+
+        :rtype: List[int]
+        """
+        rows = self.connection.execute(
+            "SELECT DISTINCT computer_groups.id FROM computer_groups, "
+            "json_each(computer_groups.data, '$.computers') AS member "
+            "WHERE json_extract(member.value, '$.id') = ?",
+            (int(computer_id),),
+        )
+        return sorted(int(i) for (i,) in rows)
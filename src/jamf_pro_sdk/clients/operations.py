@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Dict, Generator, TypeVar
+
+T = TypeVar("T")
+
+#: An API operation shared by the sync and async clients. The generator builds and yields the
+#: keyword arguments of each request it makes, is sent the response to each request, and returns
+#: the parsed result. It performs no I/O itself, so the same operation is run by
+#: :func:`run_operation` with a blocking request method and by :func:`run_operation_async` with a
+#: coroutine request method.
+Operation = Generator[Dict[str, Any], Any, T]
+
+
+def run_operation(operation: Operation[T], request_method: Callable[..., Any]) -> T:
+    """Run an operation, sending each of its requests with a blocking request method.
+
+    :param operation: The operation to run.
+    :type operation: Operation
+
+    :param request_method: Sends a request (e.g. ``JamfProClient.classic_api_request``) and
+        returns the response.
+    :type request_method: Callable
+
+    :return: The result of the operation.
+    """
+    response = None
+    while True:
+        try:
+            request = operation.send(response)
+        except StopIteration as stop:
+            return stop.value
+        response = request_method(**request)
+
+
+async def run_operation_async(
+    operation: Operation[T], request_method: Callable[..., Awaitable[Any]]
+) -> T:
+    """Run an operation, awaiting each of its requests with a coroutine request method.
+
+    :param operation: The operation to run.
+    :type operation: Operation
+
+    :param request_method: Sends a request (e.g. ``AsyncJamfProClient.classic_api_request``) and
+        returns the response.
+    :type request_method: Callable
+
+    :return: The result of the operation.
+    """
+    response = None
+    while True:
+        try:
+            request = operation.send(response)
+        except StopIteration as stop:
+            return stop.value
+        response = await request_method(**request)
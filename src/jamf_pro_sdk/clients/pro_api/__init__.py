@@ -1,6 +1,19 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Iterator, List, Literal, Optional, Union, overload
+from concurrent.futures import Executor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    TypeVar,
+    Union,
+    overload,
+)
 from uuid import UUID
 
 from ...models.pro.api_options import (
@@ -34,24 +47,245 @@ from ...models.pro.mdm import (
 )
 from ...models.pro.mobile_devices import MobileDevice
 from ...models.pro.packages import Package
+from ..decoders import JsonDecoder
+from ..operations import Operation, run_operation
 from .pagination import Paginator
 
 if TYPE_CHECKING:
-    import requests
-
     from .pagination import FilterExpression, Page, SortExpression
 
+T = TypeVar("T")
 
-class ProApi:
-    """Provides an interface to the Jamf Pro API."""
+
+class ProApiOperations:
+    """The Pro API operations shared by :class:`ProApi` and
+    :class:`~jamf_pro_sdk.clients.aio.pro_api.AsyncProApi`.
+
+    Each operation is an :data:`~jamf_pro_sdk.clients.operations.Operation`: it builds the
+    requests and parses the responses, and the client classes only send the requests. Paginated
+    operations validate their arguments and return the keyword arguments of the paginator.
+    """
 
     def __init__(
         self,
-        request_method: Callable[..., requests.Response],
-        concurrent_requests_method: Callable[..., Iterator],
+        request_method: Callable[..., Any],
+        concurrent_requests_method: Callable[..., Any],
+        json_decoder: Optional[JsonDecoder] = None,
     ):
         self.api_request = request_method
         self.concurrent_api_requests = concurrent_requests_method
+        self.json_decoder = json_decoder or JsonDecoder()
+
+    # Computer Inventory APIs
+
+    def _get_computer_inventory_v1(
+        self,
+        sections: Optional[List[str]] = None,
+        start_page: int = 0,
+        end_page: Optional[int] = None,
+        page_size: Union[int, Literal["auto"]] = 100,
+        sort_expression: Optional[SortExpression] = None,
+        filter_expression: Optional[FilterExpression] = None,
+        lazy_validation: bool = False,
+        validation_executor: Optional[Executor] = None,
+    ) -> Dict[str, Any]:
+        if not sections:
+            sections = ["GENERAL"]
+        elif "ALL" in sections:
+            sections = get_computer_inventory_v1_allowed_sections[1:]
+
+        if not all([i in get_computer_inventory_v1_allowed_sections for i in sections]):
+            raise ValueError(
+                f"Values for 'sections' must be one of: {', '.join(get_computer_inventory_v1_allowed_sections)}"
+            )
+
+        if sort_expression:
+            sort_expression.validate(get_computer_inventory_v1_allowed_sort_fields)
+
+        if filter_expression:
+            filter_expression.validate(get_computer_inventory_v1_allowed_filter_fields)
+
+        return dict(
+            resource_path="v1/computers-inventory",
+            return_model=Computer,
+            start_page=start_page,
+            end_page=end_page,
+            page_size=page_size,
+            sort_expression=sort_expression,
+            filter_expression=filter_expression,
+            extra_params={"section": ",".join(sections)},
+            lazy_validation=lazy_validation,
+            validation_executor=validation_executor,
+        )
+
+    # Package APIs
+
+    def _get_packages_v1(
+        self,
+        start_page: int = 0,
+        end_page: Optional[int] = None,
+        page_size: Union[int, Literal["auto"]] = 100,
+        sort_expression: Optional[SortExpression] = None,
+        filter_expression: Optional[FilterExpression] = None,
+    ) -> Dict[str, Any]:
+        if sort_expression:
+            sort_expression.validate(get_packages_v1_allowed_sort_fields)
+
+        if filter_expression:
+            filter_expression.validate(get_packages_v1_allowed_filter_fields)
+
+        return dict(
+            resource_path="v1/packages",
+            return_model=Package,
+            start_page=start_page,
+            end_page=end_page,
+            page_size=page_size,
+            sort_expression=sort_expression,
+            filter_expression=filter_expression,
+        )
+
+    # JCDS APIs
+
+    def _get_jcds_files_v1(self) -> Operation[List[File]]:
+        resp = yield {"method": "get", "resource_path": "v1/jcds/files"}
+        return self.json_decoder.validate_list(File, resp.content)
+
+    def _create_jcds_file_v1(self) -> Operation[NewFile]:
+        resp = yield {"method": "post", "resource_path": "v1/jcds/files"}
+        return self.json_decoder.validate(NewFile, resp.content)
+
+    def _get_jcds_file_v1(self, file_name: str) -> Operation[DownloadUrl]:
+        resp = yield {"method": "get", "resource_path": f"v1/jcds/files/{file_name}"}
+        return self.json_decoder.validate(DownloadUrl, resp.content)
+
+    def _delete_jcds_file_v1(self, file_name: str) -> Operation[None]:
+        yield {"method": "delete", "resource_path": f"v1/jcds/files/{file_name}"}
+
+    # MDM APIs
+
+    def _renew_mdm_profile_v1(
+        self, udids: List[Union[str, UUID]]
+    ) -> Operation[RenewMdmProfileResponse]:
+        resp = yield {
+            "method": "post",
+            "resource_path": "v1/mdm/renew-profile",
+            "data": {"udids": [str(i) for i in udids]},
+        }
+
+        try:
+            return RenewMdmProfileResponse(
+                udidsNotProcessed=resp.json()["udidsNotProcessed"]["udids"]
+            )
+        except KeyError:
+            return RenewMdmProfileResponse(udidsNotProcessed=[])
+
+    def _send_mdm_command_preview(
+        self,
+        management_ids: List[Union[str, UUID]],
+        command: Union[
+            EnableLostModeCommand,
+            EraseDeviceCommand,
+            LogOutUserCommand,
+            RestartDeviceCommand,
+            SetRecoveryLockCommand,
+            ShutDownDeviceCommand,
+            CustomCommand,
+        ],
+    ) -> Operation[List[SendMdmCommandResponse]]:
+        data = SendMdmCommand(
+            clientData=[SendMdmCommandClientData(managementId=i) for i in management_ids],
+            commandData=command,
+        )
+
+        resp = yield {"method": "post", "resource_path": "preview/mdm/commands", "data": data}
+        return self.json_decoder.validate_list(SendMdmCommandResponse, resp.content)
+
+    def _get_mdm_commands_v2(
+        self,
+        filter_expression: FilterExpression,
+        start_page: int = 0,
+        end_page: Optional[int] = None,
+        page_size: Union[int, Literal["auto"]] = 100,
+        sort_expression: Optional[SortExpression] = None,
+    ) -> Dict[str, Any]:
+        if command_filters := [i for i in filter_expression.fields if i.name == "command"]:
+            if not all(
+                [i.value in get_mdm_commands_v2_allowed_command_types for i in command_filters]
+            ):
+                raise ValueError(
+                    f"Values for 'command' filters must be one of: {', '.join(get_mdm_commands_v2_allowed_command_types)}"
+                )
+
+        if sort_expression:
+            sort_expression.validate(get_mdm_commands_v2_allowed_sort_fields)
+
+        if filter_expression:
+            filter_expression.validate(get_mdm_commands_v2_allowed_filter_fields)
+
+        return dict(
+            resource_path="v2/mdm/commands",
+            return_model=MdmCommandStatus,
+            start_page=start_page,
+            end_page=end_page,
+            page_size=page_size,
+            sort_expression=sort_expression,
+            filter_expression=filter_expression,
+        )
+
+    # Mobile Device Inventory APIs
+
+    def _get_mobile_device_inventory_v2(
+        self,
+        sections: Optional[List[str]] = None,
+        start_page: int = 0,
+        end_page: Optional[int] = None,
+        page_size: Union[int, Literal["auto"]] = 100,
+        sort_expression: Optional[SortExpression] = None,
+        filter_expression: Optional[FilterExpression] = None,
+        lazy_validation: bool = False,
+        validation_executor: Optional[Executor] = None,
+    ) -> Dict[str, Any]:
+        if not sections:
+            sections = ["GENERAL"]
+        elif "ALL" in sections:
+            sections = get_mobile_device_inventory_v2_allowed_sections[1:]
+
+        if not all([i in get_mobile_device_inventory_v2_allowed_sections for i in sections]):
+            raise ValueError(
+                f"Values for 'sections' must be one of: {', '.join(get_mobile_device_inventory_v2_allowed_sections)}"
+            )
+
+        if sort_expression:
+            sort_expression.validate(get_mobile_device_inventory_v2_allowed_sort_fields)
+
+        if filter_expression:
+            filter_expression.validate(get_mobile_device_inventory_v2_allowed_filter_fields)
+
+        return dict(
+            resource_path="v2/mobile-devices/detail",
+            return_model=MobileDevice,
+            start_page=start_page,
+            end_page=end_page,
+            page_size=page_size,
+            sort_expression=sort_expression,
+            filter_expression=filter_expression,
+            extra_params={"section": ",".join(sections)},
+            lazy_validation=lazy_validation,
+            validation_executor=validation_executor,
+        )
+
+
+class ProApi(ProApiOperations):
+    """Provides an interface to the Jamf Pro API."""
+
+    def _run(self, operation: Operation[T]) -> T:
+        return run_operation(operation, self.api_request)
+
+    def _paginate(
+        self, paginator_args: Dict[str, Any], return_generator: bool, stream_records: bool
+    ) -> Union[list, Iterator]:
+        paginator = Paginator(api_client=self, **paginator_args)
+        return paginator(return_generator=return_generator, stream_records=stream_records)
 
     # Computer Inventory APIs
 
@@ -61,10 +295,13 @@ class ProApi:
         sections: Optional[List[str]] = ...,
         start_page: int = ...,
         end_page: Optional[int] = ...,
-        page_size: int = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
         sort_expression: Optional[SortExpression] = ...,
         filter_expression: Optional[FilterExpression] = ...,
         return_generator: Literal[False] = False,
+        stream_records: Literal[False] = False,
+        lazy_validation: bool = ...,
+        validation_executor: Optional[Executor] = ...,
     ) -> List[Computer]: ...
 
     @overload
@@ -73,22 +310,43 @@ class ProApi:
         sections: Optional[List[str]] = ...,
         start_page: int = ...,
         end_page: Optional[int] = ...,
-        page_size: int = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
         sort_expression: Optional[SortExpression] = ...,
         filter_expression: Optional[FilterExpression] = ...,
         return_generator: Literal[True] = True,
+        stream_records: Literal[False] = False,
+        lazy_validation: bool = ...,
+        validation_executor: Optional[Executor] = ...,
     ) -> Iterator[Page]: ...
 
+    @overload
+    def get_computer_inventory_v1(
+        self,
+        sections: Optional[List[str]] = ...,
+        start_page: int = ...,
+        end_page: Optional[int] = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
+        sort_expression: Optional[SortExpression] = ...,
+        filter_expression: Optional[FilterExpression] = ...,
+        return_generator: bool = ...,
+        stream_records: Literal[True] = True,
+        lazy_validation: bool = ...,
+        validation_executor: Optional[Executor] = ...,
+    ) -> Iterator[Computer]: ...
+
     def get_computer_inventory_v1(
         self,
         sections: Optional[List[str]] = None,
         start_page: int = 0,
         end_page: Optional[int] = None,
-        page_size: int = 100,
+        page_size: Union[int, Literal["auto"]] = 100,
         sort_expression: Optional[SortExpression] = None,
         filter_expression: Optional[FilterExpression] = None,
         return_generator: bool = False,
-    ) -> Union[List[Computer], Iterator[Page]]:
+        stream_records: bool = False,
+        lazy_validation: bool = False,
+        validation_executor: Optional[Executor] = None,
+    ) -> Union[List[Computer], Iterator[Page], Iterator[Computer]]:
         """Returns a list of computer inventory records.
 
         :param sections: (optional) Select which sections of the computer's details to return. If
@@ -109,9 +367,10 @@ class ProApi:
             more information.
         :type start_page: int
 
-        :param page_size: (optional) The number of results to include in each requested page. See
-            :class:`Paginator` for more information.
-        :type page_size: int
+        :param page_size: (optional) The number of results to include in each requested page, or
+            ``auto`` to choose the size from the first response. See :class:`Paginator` for more
+            information.
+        :type page_size: int | str
 
         :param sort_expression: (optional) The sort fields to apply to the request. See the
             documentation for :ref:`Pro API Sorting` for more information.
@@ -135,40 +394,40 @@ class ProApi:
             default, the results for all pages will be returned in a single response.
         :type return_generator: bool
 
-        :return: List of computers OR a paginator generator.
-        :rtype: List[~jamf_pro_sdk.models.pro.computer.Computer] | Iterator[Page]
+        :param stream_records: If ``True`` a generator is returned that yields each record in page
+            order. Each page is released once its records have been consumed so memory use does
+            not grow with the total number of records. Overrides ``return_generator``.
+        :type stream_records: bool
 
-        """
-        if not sections:
-            sections = ["GENERAL"]
-        elif "ALL" in sections:
-            sections = get_computer_inventory_v1_allowed_sections[1:]
+        :param lazy_validation: If ``True`` each record is returned as a
+            :class:`~jamf_pro_sdk.models.lazy.LazyModel` proxy that validates a field only when it
+            is accessed. Use this when reading a few fields from records with many sections.
+        :type lazy_validation: bool
 
-        if not all([i in get_computer_inventory_v1_allowed_sections for i in sections]):
-            raise ValueError(
-                f"Values for 'sections' must be one of: {', '.join(get_computer_inventory_v1_allowed_sections)}"
-            )
+        :param validation_executor: (optional) An executor (e.g. a ``ProcessPoolExecutor``) that
+            parses and validates pages so validation can use more than one CPU core. See
+            :class:`Paginator` for more information.
+        :type validation_executor: Executor
 
-        if sort_expression:
-            sort_expression.validate(get_computer_inventory_v1_allowed_sort_fields)
+        :return: List of computers, a paginator generator, OR a record generator.
+        :rtype: List[~jamf_pro_sdk.models.pro.computer.Computer] | Iterator[Page] | Iterator[~jamf_pro_sdk.models.pro.computer.Computer]
 
-        if filter_expression:
-            filter_expression.validate(get_computer_inventory_v1_allowed_filter_fields)
-
-        paginator = Paginator(
-            api_client=self,
-            resource_path="v1/computers-inventory",
-            return_model=Computer,
-            start_page=start_page,
-            end_page=end_page,
-            page_size=page_size,
-            sort_expression=sort_expression,
-            filter_expression=filter_expression,
-            extra_params={"section": ",".join(sections)},
+        """
+        return self._paginate(
+            self._get_computer_inventory_v1(
+                sections,
+                start_page,
+                end_page,
+                page_size,
+                sort_expression,
+                filter_expression,
+                lazy_validation,
+                validation_executor,
+            ),
+            return_generator,
+            stream_records,
         )
 
-        return paginator(return_generator=return_generator)
-
     # Package APIs
 
     @overload
@@ -176,10 +435,11 @@ class ProApi:
         self,
         start_page: int = ...,
         end_page: Optional[int] = ...,
-        page_size: int = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
         sort_expression: Optional[SortExpression] = ...,
         filter_expression: Optional[FilterExpression] = ...,
         return_generator: Literal[False] = False,
+        stream_records: Literal[False] = False,
     ) -> List[Package]: ...
 
     @overload
@@ -187,21 +447,35 @@ class ProApi:
         self,
         start_page: int = ...,
         end_page: Optional[int] = ...,
-        page_size: int = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
         sort_expression: Optional[SortExpression] = ...,
         filter_expression: Optional[FilterExpression] = ...,
         return_generator: Literal[True] = True,
+        stream_records: Literal[False] = False,
     ) -> Iterator[Page]: ...
 
+    @overload
+    def get_packages_v1(
+        self,
+        start_page: int = ...,
+        end_page: Optional[int] = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
+        sort_expression: Optional[SortExpression] = ...,
+        filter_expression: Optional[FilterExpression] = ...,
+        return_generator: bool = ...,
+        stream_records: Literal[True] = True,
+    ) -> Iterator[Package]: ...
+
     def get_packages_v1(
         self,
         start_page: int = 0,
         end_page: Optional[int] = None,
-        page_size: int = 100,
+        page_size: Union[int, Literal["auto"]] = 100,
         sort_expression: Optional[SortExpression] = None,
         filter_expression: Optional[FilterExpression] = None,
         return_generator: bool = False,
-    ) -> Union[List[Package], Iterator[Page]]:
+        stream_records: bool = False,
+    ) -> Union[List[Package], Iterator[Page], Iterator[Package]]:
         """Returns a list of package records.
 
         :param start_page: (optional) The page to begin returning results from. See
@@ -212,9 +486,10 @@ class ProApi:
             more information.
         :type start_page: int
 
-        :param page_size: (optional) The number of results to include in each requested page. See
-            :class:`Paginator` for more information.
-        :type page_size: int
+        :param page_size: (optional) The number of results to include in each requested page, or
+            ``auto`` to choose the size from the first response. See :class:`Paginator` for more
+            information.
+        :type page_size: int | str
 
         :param sort_expression: (optional) The sort fields to apply to the request. See the
             documentation for :ref:`Pro API Sorting` for more information.
@@ -238,29 +513,23 @@ class ProApi:
             default, the results for all pages will be returned in a single response.
         :type return_generator: bool
 
-        :return: List of packages OR a paginator generator.
-        :rtype: List[~jamf_pro_sdk.models.pro.packages.package] | Iterator[Page]
+        :param stream_records: If ``True`` a generator is returned that yields each record in page
+            order. Each page is released once its records have been consumed so memory use does
+            not grow with the total number of records. Overrides ``return_generator``.
+        :type stream_records: bool
 
-        """
-        if sort_expression:
-            sort_expression.validate(get_packages_v1_allowed_sort_fields)
+        :return: List of packages, a paginator generator, OR a record generator.
+        :rtype: List[~jamf_pro_sdk.models.pro.packages.package] | Iterator[Page] | Iterator[~jamf_pro_sdk.models.pro.packages.package]
 
-        if filter_expression:
-            filter_expression.validate(get_packages_v1_allowed_filter_fields)
-
-        paginator = Paginator(
-            api_client=self,
-            resource_path="v1/packages",
-            return_model=Package,
-            start_page=start_page,
-            end_page=end_page,
-            page_size=page_size,
-            sort_expression=sort_expression,
-            filter_expression=filter_expression,
+        """
+        return self._paginate(
+            self._get_packages_v1(
+                start_page, end_page, page_size, sort_expression, filter_expression
+            ),
+            return_generator,
+            stream_records,
         )
 
-        return paginator(return_generator=return_generator)
-
     # JCDS APIs
 
     def get_jcds_files_v1(self) -> List[File]:
@@ -270,8 +539,7 @@ class ProApi:
         :rtype: List[File]
 
         """
-        resp = self.api_request(method="get", resource_path="v1/jcds/files")
-        return [File(**i) for i in resp.json()]
+        return self._run(self._get_jcds_files_v1())
 
     def create_jcds_file_v1(self) -> NewFile:
         """Create a new file in the JCDS.
@@ -280,8 +548,7 @@ class ProApi:
         :rtype: NewFile
 
         """
-        resp = self.api_request(method="post", resource_path="v1/jcds/files")
-        return NewFile(**resp.json())
+        return self._run(self._create_jcds_file_v1())
 
     def get_jcds_file_v1(self, file_name: str) -> DownloadUrl:
         """Read a JCDS file record by its filename.
@@ -290,8 +557,7 @@ class ProApi:
         :rtype: DownloadUrl
 
         """
-        resp = self.api_request(method="get", resource_path=f"v1/jcds/files/{file_name}")
-        return DownloadUrl(**resp.json())
+        return self._run(self._get_jcds_file_v1(file_name))
 
     def delete_jcds_file_v1(self, file_name: str) -> None:
         """Delete a file from the JCDS.
@@ -302,7 +568,7 @@ class ProApi:
             :meth:`~jamf_pro_sdk.clients.classic_api.ClassicApi.delete_package_by_id`.
 
         """
-        self.api_request(method="delete", resource_path=f"v1/jcds/files/{file_name}")
+        self._run(self._delete_jcds_file_v1(file_name))
 
     # MDM APIs
 
@@ -316,18 +582,7 @@ class ProApi:
             processed for renewal.
         :rtype: RenewMdmProfileResponse
         """
-        resp = self.api_request(
-            method="post",
-            resource_path="v1/mdm/renew-profile",
-            data={"udids": [str(i) for i in udids]},
-        )
-
-        try:
-            return RenewMdmProfileResponse(
-                udidsNotProcessed=resp.json()["udidsNotProcessed"]["udids"]
-            )
-        except KeyError:
-            return RenewMdmProfileResponse(udidsNotProcessed=[])
+        return self._run(self._renew_mdm_profile_v1(udids))
 
     def send_mdm_command_preview(
         self,
@@ -377,13 +632,7 @@ class ProApi:
         :return: A list of command responses.
         :rtype: List[SendMdmCommandResponse]
         """
-        data = SendMdmCommand(
-            clientData=[SendMdmCommandClientData(managementId=i) for i in management_ids],
-            commandData=command,
-        )
-
-        resp = self.api_request(method="post", resource_path="preview/mdm/commands", data=data)
-        return [SendMdmCommandResponse(**i) for i in resp.json()]
+        return self._run(self._send_mdm_command_preview(management_ids, command))
 
     @overload
     def get_mdm_commands_v2(
@@ -391,9 +640,10 @@ class ProApi:
         filter_expression: FilterExpression,
         start_page: int = ...,
         end_page: Optional[int] = ...,
-        page_size: int = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
         sort_expression: Optional[SortExpression] = ...,
         return_generator: Literal[False] = False,
+        stream_records: Literal[False] = False,
     ) -> List[MdmCommandStatus]: ...
 
     @overload
@@ -402,20 +652,34 @@ class ProApi:
         filter_expression: FilterExpression,
         start_page: int = ...,
         end_page: Optional[int] = ...,
-        page_size: int = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
         sort_expression: Optional[SortExpression] = ...,
         return_generator: Literal[True] = True,
+        stream_records: Literal[False] = False,
     ) -> Iterator[Page]: ...
 
+    @overload
+    def get_mdm_commands_v2(
+        self,
+        filter_expression: FilterExpression,
+        start_page: int = ...,
+        end_page: Optional[int] = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
+        sort_expression: Optional[SortExpression] = ...,
+        return_generator: bool = ...,
+        stream_records: Literal[True] = True,
+    ) -> Iterator[MdmCommandStatus]: ...
+
     def get_mdm_commands_v2(
         self,
         filter_expression: FilterExpression,
         start_page: int = 0,
         end_page: Optional[int] = None,
-        page_size: int = 100,
+        page_size: Union[int, Literal["auto"]] = 100,
         sort_expression: Optional[SortExpression] = None,
         return_generator: bool = False,
-    ) -> Union[List[MdmCommandStatus], Iterator[Page]]:
+        stream_records: bool = False,
+    ) -> Union[List[MdmCommandStatus], Iterator[Page], Iterator[MdmCommandStatus]]:
         """Returns a list of MDM commands.
 
         :param filter_expression: The filter expression to apply to the request. At least **one**
@@ -436,9 +700,10 @@ class ProApi:
             more information.
         :type start_page: int
 
-        :param page_size: (optional) The number of results to include in each requested page. See
-            :class:`Paginator` for more information.
-        :type page_size: int
+        :param page_size: (optional) The number of results to include in each requested page, or
+            ``auto`` to choose the size from the first response. See :class:`Paginator` for more
+            information.
+        :type page_size: int | str
 
         :param sort_expression: (optional) The sort fields to apply to the request. See the
             documentation for :ref:`Pro API Sorting` for more information.
@@ -453,37 +718,22 @@ class ProApi:
             the results for all pages will be returned in a single response.
         :type return_generator: bool
 
-        :return: List of MDM commands OR a paginator generator.
-        :rtype: List[~jamf_pro_sdk.models.pro.mdm.MdmCommand] | Iterator[Page]
-        """
-
-        if command_filters := [i for i in filter_expression.fields if i.name == "command"]:
-            if not all(
-                [i.value in get_mdm_commands_v2_allowed_command_types for i in command_filters]
-            ):
-                raise ValueError(
-                    f"Values for 'command' filters must be one of: {', '.join(get_mdm_commands_v2_allowed_command_types)}"
-                )
-
-        if sort_expression:
-            sort_expression.validate(get_mdm_commands_v2_allowed_sort_fields)
+        :param stream_records: If ``True`` a generator is returned that yields each record in page
+            order. Each page is released once its records have been consumed so memory use does
+            not grow with the total number of records. Overrides ``return_generator``.
+        :type stream_records: bool
 
-        if filter_expression:
-            filter_expression.validate(get_mdm_commands_v2_allowed_filter_fields)
-
-        paginator = Paginator(
-            api_client=self,
-            resource_path="v2/mdm/commands",
-            return_model=MdmCommandStatus,
-            start_page=start_page,
-            end_page=end_page,
-            page_size=page_size,
-            sort_expression=sort_expression,
-            filter_expression=filter_expression,
+        :return: List of MDM commands, a paginator generator, OR a record generator.
+        :rtype: List[~jamf_pro_sdk.models.pro.mdm.MdmCommand] | Iterator[Page] | Iterator[~jamf_pro_sdk.models.pro.mdm.MdmCommand]
+        """
+        return self._paginate(
+            self._get_mdm_commands_v2(
+                filter_expression, start_page, end_page, page_size, sort_expression
+            ),
+            return_generator,
+            stream_records,
         )
 
-        return paginator(return_generator=return_generator)
-
     # Mobile Device Inventory APIs
 
     @overload
@@ -492,10 +742,13 @@ class ProApi:
         sections: Optional[List[str]] = ...,
         start_page: int = ...,
         end_page: Optional[int] = ...,
-        page_size: int = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
         sort_expression: Optional[SortExpression] = ...,
         filter_expression: Optional[FilterExpression] = ...,
         return_generator: Literal[False] = False,
+        stream_records: Literal[False] = False,
+        lazy_validation: bool = ...,
+        validation_executor: Optional[Executor] = ...,
     ) -> List[MobileDevice]: ...
 
     @overload
@@ -504,22 +757,43 @@ class ProApi:
         sections: Optional[List[str]] = ...,
         start_page: int = ...,
         end_page: Optional[int] = ...,
-        page_size: int = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
         sort_expression: Optional[SortExpression] = ...,
         filter_expression: Optional[FilterExpression] = ...,
         return_generator: Literal[True] = True,
+        stream_records: Literal[False] = False,
+        lazy_validation: bool = ...,
+        validation_executor: Optional[Executor] = ...,
     ) -> Iterator[Page]: ...
 
+    @overload
+    def get_mobile_device_inventory_v2(
+        self,
+        sections: Optional[List[str]] = ...,
+        start_page: int = ...,
+        end_page: Optional[int] = ...,
+        page_size: Union[int, Literal["auto"]] = ...,
+        sort_expression: Optional[SortExpression] = ...,
+        filter_expression: Optional[FilterExpression] = ...,
+        return_generator: bool = ...,
+        stream_records: Literal[True] = True,
+        lazy_validation: bool = ...,
+        validation_executor: Optional[Executor] = ...,
+    ) -> Iterator[MobileDevice]: ...
+
     def get_mobile_device_inventory_v2(
         self,
         sections: Optional[List[str]] = None,
         start_page: int = 0,
         end_page: Optional[int] = None,
-        page_size: int = 100,
+        page_size: Union[int, Literal["auto"]] = 100,
         sort_expression: Optional[SortExpression] = None,
         filter_expression: Optional[FilterExpression] = None,
         return_generator: bool = False,
-    ) -> Union[List[MobileDevice], Iterator[Page]]:
+        stream_records: bool = False,
+        lazy_validation: bool = False,
+        validation_executor: Optional[Executor] = None,
+    ) -> Union[List[MobileDevice], Iterator[Page], Iterator[MobileDevice]]:
         """Returns a list of mobile device (iOS and tvOS) inventory records.
 
         :param sections: (optional) Select which sections of the computer's details to return. If
@@ -540,9 +814,10 @@ class ProApi:
             more information.
         :type start_page: int
 
-        :param page_size: (optional) The number of results to include in each requested page. See
-            :class:`Paginator` for more information.
-        :type page_size: int
+        :param page_size: (optional) The number of results to include in each requested page, or
+            ``auto`` to choose the size from the first response. See :class:`Paginator` for more
+            information.
+        :type page_size: int | str
 
         :param sort_expression: (optional) The sort fields to apply to the request. See the
             documentation for :ref:`Pro API Sorting` for more information.
@@ -566,36 +841,36 @@ class ProApi:
             default, the results for all pages will be returned in a single response.
         :type return_generator: bool
 
-        :return: List of computers OR a paginator generator.
-        :rtype: List[~jamf_pro_sdk.models.pro.mobile_devices.MobileDevice] | Iterator[Page]
+        :param stream_records: If ``True`` a generator is returned that yields each record in page
+            order. Each page is released once its records have been consumed so memory use does
+            not grow with the total number of records. Overrides ``return_generator``.
+        :type stream_records: bool
 
-        """
-        if not sections:
-            sections = ["GENERAL"]
-        elif "ALL" in sections:
-            sections = get_mobile_device_inventory_v2_allowed_sections[1:]
+        :param lazy_validation: If ``True`` each record is returned as a
+            :class:`~jamf_pro_sdk.models.lazy.LazyModel` proxy that validates a field only when it
+            is accessed. Use this when reading a few fields from records with many sections.
+        :type lazy_validation: bool
 
-        if not all([i in get_mobile_device_inventory_v2_allowed_sections for i in sections]):
-            raise ValueError(
-                f"Values for 'sections' must be one of: {', '.join(get_mobile_device_inventory_v2_allowed_sections)}"
-            )
-
-        if sort_expression:
-            sort_expression.validate(get_mobile_device_inventory_v2_allowed_sort_fields)
+        :param validation_executor: (optional) An executor (e.g. a ``ProcessPoolExecutor``) that
+            parses and validates pages so validation can use more than one CPU core. See
+            :class:`Paginator` for more information.
+        :type validation_executor: Executor
 
-        if filter_expression:
-            filter_expression.validate(get_mobile_device_inventory_v2_allowed_filter_fields)
+        :return: List of computers, a paginator generator, OR a record generator.
+        :rtype: List[~jamf_pro_sdk.models.pro.mobile_devices.MobileDevice] | Iterator[Page] | Iterator[~jamf_pro_sdk.models.pro.mobile_devices.MobileDevice]
 
-        paginator = Paginator(
-            api_client=self,
-            resource_path="v2/mobile-devices/detail",
-            return_model=MobileDevice,
-            start_page=start_page,
-            end_page=end_page,
-            page_size=page_size,
-            sort_expression=sort_expression,
-            filter_expression=filter_expression,
-            extra_params={"section": ",".join(sections)},
+        """
+        return self._paginate(
+            self._get_mobile_device_inventory_v2(
+                sections,
+                start_page,
+                end_page,
+                page_size,
+                sort_expression,
+                filter_expression,
+                lazy_validation,
+                validation_executor,
+            ),
+            return_generator,
+            stream_records,
         )
-
-        return paginator(return_generator=return_generator)
@@ -1,14 +1,42 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 import math
+from concurrent.futures import Executor
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from pydantic import BaseModel
 
+from ...models.client import JsonBackends
+from ...models.lazy import LazyModel
+from ..decoders import JsonDecoder
+
 if TYPE_CHECKING:
+    import httpx
+    import requests
+
+    from ..aio.pro_api import AsyncProApi
     from . import ProApi
 
+logger = logging.getLogger("jamf_pro_sdk")
+
+MAX_PAGE_SIZE = 2000
+AUTO_PAGE_SIZE_PROBE = 100
+
 
 # QUERY FILTERING
 
@@ -132,6 +160,46 @@ class SortField:
 # PAGINATION
 
 
+def _validate_page(
+    backend: JsonBackends, model: Optional[Type[BaseModel]], content: bytes
+) -> Tuple[int, list]:
+    """Parse a page response. Defined at the module level so it can be run in a process pool."""
+    return JsonDecoder(backend).validate_page(model, content)
+
+
+def plan_pages(
+    total_count: int, page_size: int, start_page: int = 0, end_page: Optional[int] = None
+) -> range:
+    """Return the pages that contain results for a paginated request.
+
+    A page is included if it is between ``start_page`` and ``end_page`` (inclusive) and at least
+    one of the ``total_count`` results falls on it at the given ``page_size``.
+
+    :param total_count: The total number of results.
+    :type total_count: int
+
+    :param page_size: The number of results on each page.
+    :type page_size: int
+
+    :param start_page: (optional) The first page (defaults to ``0``).
+    :type start_page: int
+
+    :param end_page: (optional) The last page. If not set all pages from ``start_page`` on are
+        included.
+    :type end_page: int
+
+    :return: The page numbers in ascending order.
+    :rtype: range
+    """
+    if page_size < 1:
+        raise ValueError("'page_size' must be at least 1")
+
+    last_page = math.ceil(total_count / page_size) - 1
+    if end_page is not None:
+        last_page = min(last_page, end_page)
+    return range(max(start_page, 0), last_page + 1)
+
+
 class Page(BaseModel):
     """A page result from a Pro API paginator."""
 
@@ -149,10 +217,15 @@ class Paginator:
         return_model: Type[BaseModel],
         start_page: int = 0,
         end_page: Optional[int] = None,
-        page_size: int = 100,
+        page_size: Union[int, Literal["auto"]] = 100,
         sort_expression: Optional[SortExpression] = None,
         filter_expression: Optional[FilterExpression] = None,
         extra_params: Optional[Dict[str, str]] = None,
+        prefetch: Optional[int] = None,
+        lazy_validation: bool = False,
+        validation_executor: Optional[Executor] = None,
+        max_page_bytes: int = 8 * 1024 * 1024,
+        max_page_seconds: float = 30,
     ):
         """A paginator for the Jamf Pro API. A paginator automatically iterates over an API if
         multiple unreturned pages are detected in the response. Paginated requests are performed
@@ -186,7 +259,20 @@ class Paginator:
 
         :param page_size: (optional) The number of results to include in each requested page. The
             default value is ``100`` and the maximum value is ``2000``.
-        :type page_size: int
+
+            Set to ``auto`` to choose the page size from the first response: the first page is
+            requested with ``100`` results and its size and transfer time are measured. The
+            transfer time is the response's own ``elapsed`` time, so waiting for an access token
+            or the rate limiter and failed attempts that were retried are not counted. The
+            remaining pages use the largest size (up to ``2000``) that stays within
+            ``max_page_bytes`` and ``max_page_seconds``, even if that is smaller than ``100``.
+            Pages are numbered in the order they are yielded, and no result is returned twice.
+            Cannot be combined with ``start_page`` or ``end_page``.
+
+            The largest page within the budgets stands in for the page size with the most records
+            per second: it assumes the time per record is constant, so larger pages only save the
+            fixed cost of each request. The throughput of different page sizes is not measured.
+        :type page_size: int | str
 
         :param sort_expression: (optional) The sort fields to apply to the request. See the
             documentation for :ref:`Pro API Sorting` for more information.
@@ -200,6 +286,34 @@ class Paginator:
             query string parameters of the requests.
         :type extra_params: Dict[str, str]
 
+        :param prefetch: (optional) The number of pages to request ahead of the page being
+            consumed. Pages are always yielded in page order. A small value gives a low time to
+            the first record and bounds memory use, while a value at or above
+            ``session_config.max_concurrency`` keeps every connection busy. Must be at least
+            ``1``. Defaults to ``max_concurrency * session_config.max_in_flight_factor``.
+        :type prefetch: int
+
+        :param lazy_validation: (optional) If ``True`` results are returned as
+            :class:`~jamf_pro_sdk.models.lazy.LazyModel` proxies of the ``return_model`` that
+            validate each field only when it is accessed.
+        :type lazy_validation: bool
+
+        :param validation_executor: (optional) An executor, typically a
+            ``concurrent.futures.ProcessPoolExecutor``, that parses and validates the raw page
+            responses. The threads requesting pages then only perform network I/O, and validating
+            large models is no longer limited to a single core by the GIL. The ``return_model``
+            must be importable by the worker processes. Not used with ``lazy_validation``.
+        :type validation_executor: Executor
+
+        :param max_page_bytes: (optional) With ``page_size="auto"``, the largest estimated response
+            size of a page in bytes (defaults to 8 MiB). Memory use grows with this value times the
+            number of pages in flight.
+        :type max_page_bytes: int
+
+        :param max_page_seconds: (optional) With ``page_size="auto"``, the longest estimated time
+            to receive a page (defaults to ``30``).
+        :type max_page_seconds: float
+
         """
         self._api_client = api_client
         self.resource_path = resource_path
@@ -210,65 +324,207 @@ class Paginator:
         self.sort_expression = sort_expression
         self.filter_expression = filter_expression
         self.extra_params = extra_params
-
-    def _paginated_request(self, page: int) -> Page:
-        query_params: dict = {"page": page, "page-size": self.page_size}
+        self.prefetch = prefetch
+        self.lazy_validation = lazy_validation
+        self.validation_executor = validation_executor
+        self.max_page_bytes = max_page_bytes
+        self.max_page_seconds = max_page_seconds
+
+        if prefetch is not None and prefetch < 1:
+            raise ValueError("'prefetch' must be at least 1")
+        if page_size == "auto" and (start_page or end_page is not None):
+            raise ValueError("'start_page' and 'end_page' cannot be used with an 'auto' page size")
+
+    def _query_params(self, page: int, page_size: Optional[int] = None) -> dict:
+        query_params: dict = {"page": page, "page-size": page_size or self.page_size}
         if self.sort_expression:
             query_params["sort"] = str(self.sort_expression)
         if self.filter_expression:
             query_params["filter"] = str(self.filter_expression)
         if self.extra_params:
             query_params.update(self.extra_params)
-
-        response = self._api_client.api_request(
-            method="get", resource_path=self.resource_path, query_params=query_params
-        ).json()
+        return query_params
+
+    def _parse_page(
+        self, page: int, content: bytes, parsed: Optional[Tuple[int, list]] = None
+    ) -> Page:
+        json_decoder = self._api_client.json_decoder
+        if parsed:
+            total_count, results = parsed
+        elif self.lazy_validation and self.return_model:
+            response = json_decoder.loads(content)
+            total_count = response["totalCount"]
+            results = [LazyModel(self.return_model, i) for i in response["results"]]
+        else:
+            total_count, results = json_decoder.validate_page(self.return_model, content)
 
         return Page(
             page=page,
-            page_count=len(response["results"]),
-            total_count=response["totalCount"],
-            results=(
-                [self.return_model.model_validate(i) for i in response["results"]]
-                if self.return_model
-                else response["results"]
-            ),
+            page_count=len(results),
+            total_count=total_count,
+            results=results,
         )
 
+    @property
+    def _use_validation_executor(self) -> bool:
+        return self.validation_executor is not None and not self.lazy_validation
+
+    def _remaining_pages(self, first_page: Page) -> range:
+        """The page numbers left to request after the first page has been returned."""
+        pages = plan_pages(first_page.total_count, self.page_size, self.start_page, self.end_page)
+        # The first page has already been requested
+        return pages[1:]
+
+    def _auto_page_size(
+        self, returned: int, total_count: int, content_length: int, elapsed: float
+    ) -> int:
+        """Choose the page size for the remaining pages from the measurements of the first page
+        (``returned`` results in ``content_length`` bytes). The size stays within the
+        ``max_page_bytes`` and ``max_page_seconds`` budgets even when that is smaller than the
+        first page.
+        """
+        results_count = max(1, returned)
+        bytes_per_record = content_length / results_count
+        seconds_per_record = elapsed / results_count
+
+        page_size = min(MAX_PAGE_SIZE, total_count)
+        page_size = min(page_size, int(self.max_page_bytes / bytes_per_record))
+        if seconds_per_record > 0:
+            page_size = min(page_size, int(self.max_page_seconds / seconds_per_record))
+        page_size = max(page_size, 1)
+
+        logger.debug(
+            "Paginator auto page size %d (%.0f bytes and %.4fs per record)",
+            page_size,
+            bytes_per_record,
+            seconds_per_record,
+        )
+        return page_size
+
+    @staticmethod
+    def _auto_remaining_pages(returned: int, total_count: int, page_size: int) -> range:
+        """The pages left to request at the automatically chosen page size, starting from the
+        page that holds the first result not returned by the first page.
+        """
+        if total_count <= returned:
+            return range(0)
+        return plan_pages(total_count, page_size, returned // page_size)
+
+    @staticmethod
+    def _renumber_auto_page(page: Page, number: int, returned: int, page_size: int) -> Page:
+        """Drop the results already returned by the first page and number the page in the order
+        pages are yielded.
+        """
+        if (skip := returned - page.page * page_size) > 0:
+            page.results = page.results[skip:]
+            page.page_count = len(page.results)
+        page.page = number
+        return page
+
+    def _paginated_request(self, page: int, page_size: Optional[int] = None) -> Page:
+        response = self._api_client.api_request(
+            method="get",
+            resource_path=self.resource_path,
+            query_params=self._query_params(page, page_size),
+        )
+        return self._page_from_response(page, response)
+
+    def _page_from_response(self, page: int, response: requests.Response) -> Page:
+        if self._use_validation_executor:
+            return self._parse_page(
+                page,
+                response.content,
+                self.validation_executor.submit(
+                    _validate_page,
+                    self._api_client.json_decoder.backend,
+                    self.return_model,
+                    response.content,
+                ).result(),
+            )
+        return self._parse_page(page, response.content)
+
     def _request(self) -> Iterator[Page]:
+        if self.page_size == "auto":
+            yield from self._auto_request()
+            return
+
         first_page = self._paginated_request(page=self.start_page)
         yield first_page
 
-        total_count = (
-            min(first_page.total_count, (self.end_page + 1) * self.page_size)
-            if self.end_page
-            else first_page.total_count
+        if remaining_pages := self._remaining_pages(first_page):
+            yield from self._concurrent_pages({"page": i} for i in remaining_pages)
+
+    def _concurrent_pages(self, arguments: Iterable[dict]) -> Iterator[Page]:
+        """Request pages concurrently in page order. A failed page request is raised instead of
+        being yielded in place of the page.
+        """
+        for page in self._api_client.concurrent_api_requests(
+            self._paginated_request,
+            arguments,
+            return_exceptions=True,
+            max_in_flight=self.prefetch,
+        ):
+            if isinstance(page, Exception):
+                raise page
+            yield page
+
+    def _auto_request(self) -> Iterator[Page]:
+        response = self._api_client.api_request(
+            method="get",
+            resource_path=self.resource_path,
+            query_params=self._query_params(0, AUTO_PAGE_SIZE_PROBE),
         )
+        # Only the transfer of the response: not the token, rate limiter or retried attempts
+        elapsed = response.elapsed.total_seconds()
+        first_page = self._page_from_response(0, response)
+        # The consumer may release the results of a yielded page: measure them first
+        returned, total_count = len(first_page.results), first_page.total_count
+        yield first_page
 
-        if total_count > (results_count := len(first_page.results)):
-            for page in self._api_client.concurrent_api_requests(
-                self._paginated_request,
-                [
-                    {"page": i}
-                    for i in range(
-                        self.start_page + 1,
-                        math.ceil((total_count - results_count) / self.page_size) + 1,
-                    )
-                ],
-            ):
-                yield page
+        page_size = self._auto_page_size(returned, total_count, len(response.content), elapsed)
+        remaining_pages = self._auto_remaining_pages(returned, total_count, page_size)
+        pages = self._concurrent_pages({"page": i, "page_size": page_size} for i in remaining_pages)
+        for number, page in enumerate(pages, start=1):
+            yield self._renumber_auto_page(page, number, returned, page_size)
 
-    def __call__(self, return_generator: bool = True) -> Union[List, Iterator[Page]]:
+    def records(self) -> Iterator:
+        """Iterate over the results of all pages one record at a time in page order.
+
+        Only the pages currently being requested or consumed are held in memory. A page is
+        released once all of its records have been yielded.
+
+        :return: An iterator that yields each result (parsed as the ``return_model`` if set).
+        :rtype: Iterator
+        """
+        for page in self._request():
+            results, page.results = page.results, []
+            del page
+            # Drop each record from the list as it is handed out
+            results.reverse()
+            while results:
+                yield results.pop()
+
+    def __call__(
+        self, return_generator: bool = True, stream_records: bool = False
+    ) -> Union[List, Iterator[Page], Iterator]:
         """Call the instantiated paginator to return results.
 
         :param return_generator: If ``True`` a generator is returned to iterate over pages. If
             ``False`` the results for all pages will be returned in a single list response.
         :type return_generator: bool
 
-        :return: An iterator that yields :class:`~Page` objects, or a list of responses if
-            ``return_generator`` is ``False``.
-        :rtype: Union[List, Iterator[Page]]
+        :param stream_records: If ``True`` a generator is returned that yields each record in page
+            order (see :meth:`records`). Overrides ``return_generator``.
+        :type stream_records: bool
+
+        :return: An iterator that yields :class:`~Page` objects, an iterator that yields records
+            if ``stream_records`` is ``True``, or a list of responses if ``return_generator`` is
+            ``False``.
+        :rtype: Union[List, Iterator[Page], Iterator]
         """
+        if stream_records:
+            return self.records()
+
         generator = self._request()
         if return_generator:
             return generator
@@ -278,3 +534,400 @@ class Paginator:
                 results.extend(i.results)
 
             return results
+
+
+class AsyncPaginator(Paginator):
+    def __init__(
+        self,
+        api_client: AsyncProApi,
+        resource_path: str,
+        return_model: Type[BaseModel],
+        start_page: int = 0,
+        end_page: Optional[int] = None,
+        page_size: Union[int, Literal["auto"]] = 100,
+        sort_expression: Optional[SortExpression] = None,
+        filter_expression: Optional[FilterExpression] = None,
+        extra_params: Optional[Dict[str, str]] = None,
+        prefetch: Optional[int] = None,
+        lazy_validation: bool = False,
+        validation_executor: Optional[Executor] = None,
+        max_page_bytes: int = 8 * 1024 * 1024,
+        max_page_seconds: float = 30,
+    ):
+        """The ``asyncio`` counterpart of :class:`Paginator`. Arguments and behavior are the same,
+        but pages are requested as coroutines on the
+        :class:`~jamf_pro_sdk.clients.aio.AsyncJamfProClient` and calling the paginator must be
+        awaited.
+
+        :param api_client: An async Jamf Pro API client.
+        :type api_client: AsyncProApi
+        """
+        super().__init__(
+            api_client=api_client,  # type: ignore[arg-type]
+            resource_path=resource_path,
+            return_model=return_model,
+            start_page=start_page,
+            end_page=end_page,
+            page_size=page_size,
+            sort_expression=sort_expression,
+            filter_expression=filter_expression,
+            extra_params=extra_params,
+            prefetch=prefetch,
+            lazy_validation=lazy_validation,
+            validation_executor=validation_executor,
+            max_page_bytes=max_page_bytes,
+            max_page_seconds=max_page_seconds,
+        )
+
+    async def _paginated_request(self, page: int, page_size: Optional[int] = None) -> Page:
+        response = await self._api_client.api_request(
+            method="get",
+            resource_path=self.resource_path,
+            query_params=self._query_params(page, page_size),
+        )
+        return await self._page_from_response(page, response)
+
+    async def _page_from_response(self, page: int, response: httpx.Response) -> Page:
+        if self._use_validation_executor:
+            return self._parse_page(
+                page,
+                response.content,
+                await asyncio.get_running_loop().run_in_executor(
+                    self.validation_executor,
+                    _validate_page,
+                    self._api_client.json_decoder.backend,
+                    self.return_model,
+                    response.content,
+                ),
+            )
+        return self._parse_page(page, response.content)
+
+    async def _request(self) -> AsyncIterator[Page]:
+        if self.page_size == "auto":
+            async for page in self._auto_request():
+                yield page
+            return
+
+        first_page = await self._paginated_request(page=self.start_page)
+        yield first_page
+
+        if remaining_pages := self._remaining_pages(first_page):
+            async for page in self._concurrent_pages({"page": i} for i in remaining_pages):
+                yield page
+
+    async def _concurrent_pages(self, arguments: Iterable[dict]) -> AsyncIterator[Page]:
+        async for page in self._api_client.concurrent_api_requests(
+            self._paginated_request,
+            arguments,
+            return_exceptions=True,
+            max_in_flight=self.prefetch,
+        ):
+            if isinstance(page, Exception):
+                raise page
+            yield page
+
+    async def _auto_request(self) -> AsyncIterator[Page]:
+        response = await self._api_client.api_request(
+            method="get",
+            resource_path=self.resource_path,
+            query_params=self._query_params(0, AUTO_PAGE_SIZE_PROBE),
+        )
+        # Only the transfer of the response: not the token, rate limiter or retried attempts
+        elapsed = response.elapsed.total_seconds()
+        first_page = await self._page_from_response(0, response)
+        # The consumer may release the results of a yielded page: measure them first
+        returned, total_count = len(first_page.results), first_page.total_count
+        yield first_page
+
+        page_size = self._auto_page_size(returned, total_count, len(response.content), elapsed)
+        remaining_pages = self._auto_remaining_pages(returned, total_count, page_size)
+        number = 1
+        async for page in self._concurrent_pages(
+            {"page": i, "page_size": page_size} for i in remaining_pages
+        ):
+            yield self._renumber_auto_page(page, number, returned, page_size)
+            number += 1
+
+    async def records(self) -> AsyncIterator:
+        """Iterate over the results of all pages one record at a time in page order. See
+        :meth:`Paginator.records`.
+
+        :return: An async iterator that yields each result.
+        :rtype: AsyncIterator
+        """
+        async for page in self._request():
+            results, page.results = page.results, []
+            del page
+            results.reverse()
+            while results:
+                yield results.pop()
+
+    async def __call__(
+        self, return_generator: bool = True, stream_records: bool = False
+    ) -> Union[List, AsyncIterator[Page], AsyncIterator]:
+        """Call the instantiated paginator to return results.
+
+        :param return_generator: If ``True`` an async generator is returned to iterate over pages.
+            If ``False`` the results for all pages will be returned in a single list response.
+        :type return_generator: bool
+
+        :param stream_records: If ``True`` an async generator is returned that yields each record
+            in page order. Overrides ``return_generator``.
+        :type stream_records: bool
+
+        :return: An async iterator that yields :class:`~Page` objects, an async iterator that
+            yields records if ``stream_records`` is ``True``, or a list of responses if
+            ``return_generator`` is ``False``.
+        :rtype: Union[List, AsyncIterator[Page], AsyncIterator]
+        """
+        if stream_records:
+            return self.records()
+
+        generator = self._request()
+        if return_generator:
+            return generator
+        else:
+            results = []
+            for i in sorted([p async for p in generator], key=lambda x: x.page):
+                results.extend(i.results)
+
+            return results
+
+
+def _get_field(record, field: str):
+    """Read a dotted field from a raw result or a model."""
+    for key in field.split("."):
+        record = record[key] if isinstance(record, dict) else getattr(record, key)
+    return record
+
+
+class PartitionedPaginator(Paginator):
+    def __init__(
+        self,
+        api_client: ProApi,
+        resource_path: str,
+        return_model: Type[BaseModel],
+        partitions: int = 8,
+        id_field: str = "id",
+        page_size: int = 100,
+        filter_expression: Optional[FilterExpression] = None,
+        extra_params: Optional[Dict[str, str]] = None,
+        prefetch: Optional[int] = None,
+        lazy_validation: bool = False,
+        validation_executor: Optional[Executor] = None,
+    ):
+        """A paginator that splits a collection into disjoint ranges of a numeric ID field and
+        paginates every range from page ``0`` in parallel.
+
+        Large page offsets become slower on the server as the collection grows. Paginating several
+        smaller ranges keeps every offset shallow, so pulling very large collections (100k+
+        records) scales with the client's concurrency.
+
+        The lowest and highest IDs are found with two single record requests. The span between
+        them is divided evenly into ``partitions`` ranges that are applied as
+        ``FilterField(id_field).gte(low) & FilterField(id_field).lt(high)`` on top of the
+        ``filter_expression``. Results are sorted by the ID field and yielded in ascending ID
+        order. Pages are numbered in the order they are yielded.
+
+        See :class:`Paginator` for a description of the other arguments.
+
+        :param partitions: (optional) The number of ID ranges to split the collection into
+            (defaults to ``8``).
+        :type partitions: int
+
+        :param id_field: (optional) The numeric field to partition on. It must be an allowed
+            filter and sort field of the API (defaults to ``id``).
+        :type id_field: str
+        """
+        if partitions < 1:
+            raise ValueError("'partitions' must be at least 1")
+
+        super().__init__(
+            api_client=api_client,
+            resource_path=resource_path,
+            return_model=return_model,
+            page_size=page_size,
+            sort_expression=SortField(id_field).asc(),
+            filter_expression=filter_expression,
+            extra_params=extra_params,
+            prefetch=prefetch,
+            lazy_validation=lazy_validation,
+            validation_executor=validation_executor,
+        )
+        self.partitions = partitions
+        self.id_field = id_field
+
+    def _partition_filter(self, low: int, high: int) -> FilterExpression:
+        expression = FilterField(self.id_field).gte(low) & FilterField(self.id_field).lt(high)
+        if self.filter_expression:
+            return filter_group(self.filter_expression) & expression
+        return expression
+
+    def _id_bounds(self) -> Optional[Tuple[int, int]]:
+        """Return the lowest and highest ID in the collection, or ``None`` if it is empty."""
+        bounds = []
+        for order in ("asc", "desc"):
+            query_params = self._query_params(0, 1)
+            query_params["sort"] = f"{self.id_field}:{order}"
+            response = self._api_client.api_request(
+                method="get", resource_path=self.resource_path, query_params=query_params
+            )
+            results = self._api_client.json_decoder.loads(response.content)["results"]
+            if not results:
+                return None
+            bounds.append(int(_get_field(results[0], self.id_field)))
+        return bounds[0], bounds[1]
+
+    def _partition_ranges(self, low: int, high: int) -> List[Tuple[int, int]]:
+        """Split the IDs from ``low`` to ``high`` (inclusive) into contiguous ranges."""
+        span = high - low + 1
+        count = min(self.partitions, span)
+        edges = [low + span * i // count for i in range(count)] + [high + 1]
+        return list(zip(edges[:-1], edges[1:]))
+
+    def _partition_request(
+        self, partition: int, low: int, high: int, page: int
+    ) -> Tuple[int, Page]:
+        query_params = self._query_params(page)
+        query_params["filter"] = str(self._partition_filter(low, high))
+        response = self._api_client.api_request(
+            method="get", resource_path=self.resource_path, query_params=query_params
+        )
+        return partition, self._page_from_response(page, response)
+
+    def _request(self) -> Iterator[Page]:
+        if not (bounds := self._id_bounds()):
+            return
+
+        ranges = self._partition_ranges(*bounds)
+        logger.debug("PartitionedPaginator ranges: %s", ranges)
+
+        # The first page of every partition is needed to know how many pages it has
+        first_pages = []
+        for result in self._api_client.concurrent_api_requests(
+            self._partition_request,
+            (
+                {"partition": n, "low": low, "high": high, "page": 0}
+                for n, (low, high) in enumerate(ranges)
+            ),
+            return_exceptions=True,
+        ):
+            if isinstance(result, Exception):
+                raise result
+            first_pages.append(result[1])
+
+        # Remaining pages are requested in partition order so they can be merged in ID order
+        remaining = iter(
+            self._api_client.concurrent_api_requests(
+                self._partition_request,
+                (
+                    {"partition": n, "low": low, "high": high, "page": i}
+                    for n, ((low, high), first_page) in enumerate(zip(ranges, first_pages))
+                    for i in self._remaining_pages(first_page)
+                ),
+                max_in_flight=self.prefetch,
+                return_exceptions=True,
+            )
+        )
+
+        def next_page():
+            result = next(remaining, None)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        pending = next_page()
+
+        page_number = 0
+        for n, first_page in enumerate(first_pages):
+            first_page.page = page_number
+            page_number += 1
+            yield first_page
+
+            while pending is not None and pending[0] == n:
+                pending[1].page = page_number
+                page_number += 1
+                yield pending[1]
+                pending = next_page()
+
+
+class KeysetPaginator(Paginator):
+    def __init__(
+        self,
+        api_client: ProApi,
+        resource_path: str,
+        return_model: Type[BaseModel],
+        id_field: str = "id",
+        page_size: int = 100,
+        filter_expression: Optional[FilterExpression] = None,
+        extra_params: Optional[Dict[str, str]] = None,
+        lazy_validation: bool = False,
+    ):
+        """A paginator that returns every record exactly once while records are being added and
+        removed.
+
+        Page offsets shift when records are created or deleted during a scan, which causes
+        duplicated or skipped results across pages. This paginator sorts by a numeric ID field and
+        requests page ``0`` with a ``id_field > last_seen`` filter after each page instead of an
+        offset. Any returned record that is not above the last seen ID is dropped. Records deleted
+        before they are reached are not returned, and records created with a higher ID than the
+        last seen are.
+
+        Pages are requested one after another since each depends on the previous one. The
+        ``total_count`` of each page is the number of matching records from that page on. See
+        :class:`Paginator` for a description of the other arguments.
+
+        :param id_field: (optional) The numeric field to sort and filter on. It must be an allowed
+            filter and sort field of the API (defaults to ``id``).
+        :type id_field: str
+        """
+        super().__init__(
+            api_client=api_client,
+            resource_path=resource_path,
+            return_model=return_model,
+            page_size=page_size,
+            sort_expression=SortField(id_field).asc(),
+            filter_expression=filter_expression,
+            extra_params=extra_params,
+            lazy_validation=lazy_validation,
+        )
+        self.id_field = id_field
+
+    def _keyset_filter(self, last_seen: Optional[int]) -> Optional[FilterExpression]:
+        if last_seen is None:
+            return self.filter_expression
+        expression = FilterField(self.id_field).gt(last_seen)
+        if self.filter_expression:
+            return filter_group(self.filter_expression) & expression
+        return expression
+
+    def _keyset_request(self, page: int, last_seen: Optional[int]) -> Page:
+        query_params = self._query_params(0)
+        if filter_expression := self._keyset_filter(last_seen):
+            query_params["filter"] = str(filter_expression)
+        response = self._api_client.api_request(
+            method="get", resource_path=self.resource_path, query_params=query_params
+        )
+        return self._parse_page(page, response.content)
+
+    def _request(self) -> Iterator[Page]:
+        page_number = 0
+        last_seen = None
+        while True:
+            page = self._keyset_request(page_number, last_seen)
+            returned_count = len(page.results)
+            if last_seen is not None:
+                page.results = [
+                    i for i in page.results if int(_get_field(i, self.id_field)) > last_seen
+                ]
+                page.page_count = len(page.results)
+
+            # The consumer may take the results of a yielded page (see ``records``)
+            is_last_page = not page.results or returned_count >= page.total_count
+            if page.results:
+                last_seen = max(int(_get_field(i, self.id_field)) for i in page.results)
+                yield page
+                page_number += 1
+
+            if is_last_page:
+                return
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:
+    FCNTL_IS_AVAILABLE = False
+    fcntl = None
+else:
+    FCNTL_IS_AVAILABLE = True
+
+logger = logging.getLogger("jamf_pro_sdk")
+
+
+class RateLimiter:
+    """The base rate limiter class all other rate limiters should inherit from.
+
+    The client calls :meth:`acquire` before sending every Classic API and Pro API request
+    (including retries).
+    """
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        pass
+
+
+def _take_token(
+    tokens: float, updated: float, now: float, rate: float, burst: int
+) -> Tuple[float, float]:
+    """Refill a token bucket for the time elapsed and reserve one token.
+
+    Returns the new token count, which is negative if the caller must wait, and the number of
+    seconds to wait.
+    """
+    tokens = min(float(burst), tokens + max(0.0, now - updated) * rate) - 1
+    return tokens, (-tokens / rate if tokens < 0 else 0.0)
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """A thread safe token bucket rate limiter for a single process.
+
+        :param rate: The sustained number of requests per second.
+        :type rate: float
+
+        :param burst: The number of requests that may be sent at once after a period of no
+            activity (defaults to ``rate`` rounded up, minimum `1`).
+        :type burst: int
+        """
+        if rate <= 0:
+            raise ValueError("'rate' must be greater than 0")
+
+        self.rate = rate
+        self.burst = burst if burst else max(1, math.ceil(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, wait = _take_token(
+                self._tokens, self._updated, now, self.rate, self.burst
+            )
+            self._updated = now
+
+        if wait > 0:
+            logger.debug("RateLimiter waiting %.3fs", wait)
+            time.sleep(wait)
+
+
+class FileTokenBucketRateLimiter(RateLimiter):
+    def __init__(self, path: Union[str, Path], rate: float, burst: Optional[int] = None):
+        """A token bucket rate limiter whose state is stored in a local file. All processes on
+        the host that use the same file share a single budget, e.g. multiple scripts or cron jobs
+        making requests to the same Jamf Pro server.
+
+        The file is locked with ``flock`` while the bucket is updated and this limiter is only
+        available on macOS and Linux.
+
+        :param path: The path to the state file. It will be created if it does not exist.
+        :type path: str | Path
+
+        :param rate: The sustained number of requests per second.
+        :type rate: float
+
+        :param burst: The number of requests that may be sent at once after a period of no
+            activity (defaults to ``rate`` rounded up, minimum `1`).
+        :type burst: int
+        """
+        if not FCNTL_IS_AVAILABLE:
+            raise RuntimeError("File based rate limiting is not supported on this platform")
+        if rate <= 0:
+            raise ValueError("'rate' must be greater than 0")
+
+        self.path = Path(path)
+        self.rate = rate
+        self.burst = burst if burst else max(1, math.ceil(rate))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def acquire(self) -> None:
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            with os.fdopen(os.dup(fd), "r+") as fobj:
+                # Wall clock time is used as it is comparable across processes
+                now = time.time()
+                try:
+                    state = json.load(fobj)
+                    tokens, updated = float(state["tokens"]), float(state["updated"])
+                except (ValueError, KeyError, TypeError):
+                    tokens, updated = float(self.burst), now
+
+                tokens, wait = _take_token(tokens, updated, now, self.rate, self.burst)
+
+                fobj.seek(0)
+                fobj.truncate()
+                json.dump({"tokens": tokens, "updated": now}, fobj)
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+        if wait > 0:
+            logger.debug("RateLimiter waiting %.3fs", wait)
+            time.sleep(wait)
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from threading import Lock
+from typing import Any, Awaitable, Callable, Optional, Tuple, TypeVar, Union
+
+import requests
+
+try:
+    import httpx
+except ImportError:
+    HTTPX_IS_INSTALLED = False
+    httpx = None
+else:
+    HTTPX_IS_INSTALLED = True
+
+from ..helpers import parse_retry_after
+from ..models.client import RetryPolicy
+
+logger = logging.getLogger("jamf_pro_sdk")
+
+T = TypeVar("T")
+
+
+class RetryBudget:
+    def __init__(self, ratio: float, min_retries: int):
+        """A thread safe budget that limits retries to a fraction of all requests.
+
+        :param ratio: The fraction of a retry each request adds to the budget.
+        :type ratio: float
+
+        :param min_retries: The starting balance and the most the budget can accumulate.
+        :type min_retries: int
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self._balance = float(min_retries)
+        self._lock = Lock()
+
+    @property
+    def balance(self) -> float:
+        """The number of retries currently available."""
+        return self._balance
+
+    def deposit(self) -> None:
+        """Record a request."""
+        with self._lock:
+            self._balance = min(self._balance + self.ratio, max(self.min_retries, 1))
+
+    def withdraw(self) -> bool:
+        """Spend one retry. Returns ``False`` if the budget is exhausted."""
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryHandler:
+    def __init__(self, policy: RetryPolicy):
+        """Runs operations according to a :class:`~jamf_pro_sdk.models.client.RetryPolicy`.
+
+        An operation may return a ``requests.Response`` (or an ``httpx.Response``) or raise an
+        exception. Responses with a retryable status, ``requests`` and ``httpx`` connection
+        errors, and ``botocore`` errors carrying a retryable status are retried.
+
+        :param policy: The retry policy.
+        :type policy: RetryPolicy
+        """
+        self.policy = policy
+        self.budget = RetryBudget(policy.budget_ratio, policy.budget_min_retries)
+
+    def _should_retry_exception(self, method: str, err: Exception) -> Tuple[bool, Optional[float]]:
+        if isinstance(err, requests.HTTPError) and err.response is not None:
+            return self._should_retry_response(method, err.response)
+        elif isinstance(err, requests.ConnectTimeout):
+            # The connection was never established: the request cannot have been processed
+            return True, None
+        elif isinstance(err, (requests.ConnectionError, requests.Timeout)):
+            return self.policy.is_idempotent(method), None
+        elif HTTPX_IS_INSTALLED and isinstance(err, httpx.ConnectTimeout):
+            return True, None
+        elif HTTPX_IS_INSTALLED and isinstance(err, httpx.TransportError):
+            return self.policy.is_idempotent(method), None
+
+        # botocore ClientError: the HTTP status is in the response metadata
+        error_response = getattr(err, "response", None)
+        if isinstance(error_response, dict):
+            metadata = error_response.get("ResponseMetadata", {})
+            status_code = metadata.get("HTTPStatusCode")
+            if status_code is not None:
+                return (
+                    self.policy.is_retryable_status(method, status_code),
+                    parse_retry_after(metadata.get("HTTPHeaders", {}).get("retry-after")),
+                )
+
+        # botocore connection and timeout errors
+        if type(err).__module__.startswith("botocore") and "Connect" in type(err).__name__:
+            return self.policy.is_idempotent(method), None
+
+        return False, None
+
+    def _should_retry_response(
+        self, method: str, response: Union[requests.Response, httpx.Response]
+    ) -> Tuple[bool, Optional[float]]:
+        return (
+            self.policy.is_retryable_status(method, response.status_code),
+            parse_retry_after(response.headers.get("Retry-After")),
+        )
+
+    def call(
+        self,
+        operation: Callable[[], T],
+        method: str,
+        before_retry: Optional[Callable[[], Any]] = None,
+    ) -> T:
+        """Run an operation, retrying it as allowed by the policy.
+
+        If retries are exhausted the last response is returned, or the last exception raised.
+
+        :param operation: A callable that performs the request.
+        :type operation: Callable
+
+        :param method: The HTTP method of the request. Used for the policy's idempotency rules.
+        :type method: str
+
+        :param before_retry: (optional) A callable invoked before each retry, e.g. to rewind file
+            objects that are sent as the request body.
+        :type before_retry: Callable
+
+        :return: The value returned by the operation.
+        """
+        self.budget.deposit()
+        retry_number = 0
+
+        while True:
+            try:
+                result = operation()
+            except Exception as err:
+                if (delay := self._retry_delay(method, retry_number, error=err)) is None:
+                    raise
+            else:
+                if (delay := self._retry_delay(method, retry_number, result=result)) is None:
+                    return result
+
+            retry_number += 1
+            time.sleep(delay)
+            if before_retry:
+                before_retry()
+
+    async def call_async(
+        self,
+        operation: Callable[[], Awaitable[T]],
+        method: str,
+        before_retry: Optional[Callable[[], Any]] = None,
+    ) -> T:
+        """The ``asyncio`` counterpart of :meth:`call`. The operation is a coroutine function and
+        the delay between retries does not block the event loop.
+        """
+        self.budget.deposit()
+        retry_number = 0
+
+        while True:
+            try:
+                result = await operation()
+            except Exception as err:
+                if (delay := self._retry_delay(method, retry_number, error=err)) is None:
+                    raise
+            else:
+                if (delay := self._retry_delay(method, retry_number, result=result)) is None:
+                    return result
+
+            retry_number += 1
+            await asyncio.sleep(delay)
+            if before_retry:
+                before_retry()
+
+    def _retry_delay(
+        self,
+        method: str,
+        retry_number: int,
+        result: Any = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """Return the number of seconds to wait before retrying the outcome of an attempt, or
+        ``None`` if it is not retried.
+        """
+        if error is not None:
+            retry, retry_after = self._should_retry_exception(method, error)
+            reason = repr(error)
+        elif isinstance(result, requests.Response) or (
+            HTTPX_IS_INSTALLED and isinstance(result, httpx.Response)
+        ):
+            retry, retry_after = self._should_retry_response(method, result)
+            reason = f"HTTP {result.status_code}"
+        else:
+            return None
+
+        if not self._can_retry(retry, retry_number, retry_after):
+            return None
+
+        delay = self.policy.backoff(retry_number + 1, retry_after)
+        logger.warning(
+            "Retrying %s request (%d/%d) in %.2fs: %s",
+            method.upper(),
+            retry_number + 1,
+            self.policy.max_retries,
+            delay,
+            reason,
+        )
+        return delay
+
+    def _can_retry(self, retry: bool, retry_number: int, retry_after: Optional[float]) -> bool:
+        if not retry or retry_number >= self.policy.max_retries:
+            return False
+        if retry_after is not None and retry_after > self.policy.retry_after_max:
+            logger.warning("Not retrying: Retry-After of %.0fs exceeds the maximum", retry_after)
+            return False
+        if not self.budget.withdraw():
+            logger.warning("Not retrying: the retry budget is exhausted")
+            return False
+        return True
@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import abc
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from pydantic import BaseModel
+
+from ..models.pro.api_options import (
+    get_computer_inventory_v1_allowed_sections,
+    get_mobile_device_inventory_v2_allowed_sections,
+)
+from ..models.pro.computers import Computer
+from ..models.pro.mobile_devices import MobileDevice
+from .pro_api.pagination import FilterExpression, FilterField, KeysetPaginator
+
+if TYPE_CHECKING:
+    from . import JamfProClient
+
+logger = logging.getLogger("jamf_pro_sdk")
+
+
+def format_watermark(value: datetime) -> str:
+    """Format a watermark as the UTC timestamp used in Pro API filter expressions."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class SnapshotStore(abc.ABC):
+    """The interface for a local store of inventory records used by :class:`InventorySync`.
+
+    Records are stored as JSON compatible dictionaries keyed by their ID along with the
+    watermark of the last sync.
+    """
+
+    watermark: Optional[datetime]
+
+    @abc.abstractmethod
+    def get(self, record_id: str) -> Optional[dict]:
+        """Return a record, or ``None`` if it is not in the store."""
+
+    @abc.abstractmethod
+    def upsert(self, record_id: str, record: dict):
+        """Add or replace a record."""
+
+    @abc.abstractmethod
+    def delete(self, record_id: str):
+        """Remove a record if it is in the store."""
+
+    @abc.abstractmethod
+    def ids(self) -> Set[str]:
+        """Return the IDs of all records."""
+
+    @abc.abstractmethod
+    def records(self) -> Iterator[dict]:
+        """Iterate over all records."""
+
+    @abc.abstractmethod
+    def save(self):
+        """Persist the changes made since the store was loaded or last saved."""
+
+    def __len__(self) -> int:
+        return len(self.ids())
+
+
+class JsonSnapshotStore(SnapshotStore):
+    def __init__(self, path: Union[str, Path]):
+        """A snapshot store kept in a single JSON file. The file is loaded when the store is
+        created (if it exists) and rewritten atomically on :meth:`save`.
+
+        :param path: The path to the JSON file.
+        :type path: str | Path
+        """
+        self.path = Path(path)
+        self.watermark = None
+        self._records: Dict[str, dict] = {}
+
+        if self.path.exists():
+            data = json.loads(self.path.read_text())
+            if data.get("watermark"):
+                self.watermark = datetime.fromisoformat(data["watermark"])
+            self._records = data["records"]
+
+    def get(self, record_id: str) -> Optional[dict]:
+        return self._records.get(record_id)
+
+    def upsert(self, record_id: str, record: dict):
+        self._records[record_id] = record
+
+    def delete(self, record_id: str):
+        self._records.pop(record_id, None)
+
+    def ids(self) -> Set[str]:
+        return set(self._records)
+
+    def records(self) -> Iterator[dict]:
+        return iter(self._records.values())
+
+    def save(self):
+        data = {
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+            "records": self._records,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+class SyncResult(BaseModel):
+    """The outcome of an inventory sync."""
+
+    updated: int
+    removed: int
+    total: int
+    watermark: Optional[datetime]
+
+
+class InventorySync(abc.ABC):
+    #: The Pro API filter fields that can be used as the watermark
+    watermark_fields: Tuple[str, ...] = ()
+    #: The inventory sections that can be requested
+    allowed_sections: List[str] = []
+
+    def __init__(
+        self,
+        client: JamfProClient,
+        store: SnapshotStore,
+        sections: Optional[List[str]] = None,
+        watermark_field: Optional[str] = None,
+        overlap: timedelta = timedelta(minutes=5),
+        page_size: int = 100,
+    ):
+        """Keeps a local snapshot of an inventory up to date by only requesting records that
+        changed since the last sync.
+
+        The first sync requests every record. Each sync stores the newest ``watermark_field``
+        value that was returned as the watermark, and the next sync only requests records with a
+        value at or after the watermark minus the ``overlap``. Re-requested records are merged by
+        ID so the overlap is safe, and it covers clock differences between the client and the
+        server.
+
+        Records are paged by ID with a :class:`~jamf_pro_sdk.clients.pro_api.pagination.KeysetPaginator`
+        rather than by the watermark field, so a record whose value changes during the sync
+        does not shift the pages and cause other records to be skipped. The watermark is never
+        later than the time the sync started: a record that changes while the sync is running
+        is requested again by the next sync.
+
+        Changed records cannot reveal deleted devices. Call :meth:`sync` with ``prune=True``
+        periodically to also remove records that no longer exist.
+
+        Subclasses implement the requests for a specific inventory.
+
+        :param client: A Jamf Pro client.
+        :type client: JamfProClient
+
+        :param store: The snapshot store the records are merged into.
+        :type store: SnapshotStore
+
+        :param sections: (optional) The inventory sections to request. The ``GENERAL`` section
+            is always included.
+        :type sections: List[str]
+
+        :param watermark_field: (optional) The field used as the watermark. Defaults to the
+            first of the subclass's ``watermark_fields``.
+        :type watermark_field: str
+
+        :param overlap: (optional) How far before the watermark the next sync starts (defaults
+            to 5 minutes).
+        :type overlap: timedelta
+
+        :param page_size: (optional) The number of records requested in each page.
+        :type page_size: int
+        """
+        watermark_field = watermark_field or self.watermark_fields[0]
+        if watermark_field not in self.watermark_fields:
+            raise ValueError(
+                f"'watermark_field' must be one of: {', '.join(self.watermark_fields)}"
+            )
+
+        sections = list(sections or ["GENERAL"])
+        if "ALL" in sections:
+            sections = [i for i in self.allowed_sections if i != "ALL"]
+        elif "GENERAL" not in sections:
+            sections.insert(0, "GENERAL")
+        if not all(i in self.allowed_sections for i in sections):
+            raise ValueError(
+                f"Values for 'sections' must be one of: {', '.join(self.allowed_sections)}"
+            )
+
+        self.client = client
+        self.store = store
+        self.sections = sections
+        self.watermark_field = watermark_field
+        self.overlap = overlap
+        self.page_size = page_size
+
+    @abc.abstractmethod
+    def _request_records(
+        self,
+        sections: List[str],
+        filter_expression: Optional[FilterExpression] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterator[BaseModel]:
+        """Request the records matching the filter in ID order, one record at a time."""
+
+    @abc.abstractmethod
+    def _record_id(self, record: BaseModel) -> str:
+        """Return the ID a record is stored under."""
+
+    def _record_watermark(self, record: BaseModel) -> Optional[datetime]:
+        value = getattr(record.general, self.watermark_field.split(".")[-1])
+        if value is not None and value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
+
+    def _prune(self) -> int:
+        current = {self._record_id(i) for i in self._request_records(["GENERAL"], page_size=2000)}
+        removed = self.store.ids() - current
+        for record_id in removed:
+            self.store.delete(record_id)
+        return len(removed)
+
+    def sync(self, prune: bool = False) -> SyncResult:
+        """Request the records that changed since the last sync, merge them into the store, and
+        save it.
+
+        :param prune: (optional) Also request the IDs of all records and remove the records that
+            were deleted.
+        :type prune: bool
+
+        :return: The number of records updated and removed, the total number of records in the
+            store, and the new watermark.
+        :rtype: SyncResult
+        """
+        started = datetime.now(timezone.utc)
+        watermark = self.store.watermark
+        filter_expression = None
+        if watermark:
+            filter_expression = FilterField(self.watermark_field).gte(
+                format_watermark(watermark - self.overlap)
+            )
+
+        updated = 0
+        for record in self._request_records(self.sections, filter_expression=filter_expression):
+            self.store.upsert(
+                self._record_id(record), record.model_dump(mode="json", exclude_unset=True)
+            )
+            updated += 1
+            if (value := self._record_watermark(record)) and (
+                watermark is None or value > watermark
+            ):
+                watermark = value
+
+        if watermark and watermark > started:
+            watermark = started
+
+        removed = self._prune() if prune else 0
+
+        self.store.watermark = watermark
+        self.store.save()
+        logger.info("Inventory sync updated %d and removed %d records", updated, removed)
+        return SyncResult(
+            updated=updated, removed=removed, total=len(self.store), watermark=watermark
+        )
+
+
+class ComputerInventorySync(InventorySync):
+    """Keeps a local snapshot of computer inventory up to date. See :class:`InventorySync`.
+
+    The ``watermark_field`` is either ``general.reportDate`` (the default, updated on inventory
+    submission) or ``general.lastContactTime`` (updated on every check-in). The ``sections`` are
+    those of :meth:`~jamf_pro_sdk.clients.pro_api.ProApi.get_computer_inventory_v1`.
+    """
+
+    watermark_fields = ("general.reportDate", "general.lastContactTime")
+    allowed_sections = get_computer_inventory_v1_allowed_sections
+
+    def _request_records(self, sections, filter_expression=None, page_size=None):
+        paginator = KeysetPaginator(
+            api_client=self.client.pro_api,
+            resource_path="v1/computers-inventory",
+            return_model=Computer,
+            page_size=page_size or self.page_size,
+            filter_expression=filter_expression,
+            extra_params={"section": ",".join(sections)},
+        )
+        return paginator(stream_records=True)
+
+    def _record_id(self, record) -> str:
+        return record.id
+
+
+class MobileDeviceInventorySync(InventorySync):
+    """Keeps a local snapshot of mobile device inventory up to date. See :class:`InventorySync`.
+
+    The watermark is the ``lastInventoryUpdateDate``. The ``sections`` are those of
+    :meth:`~jamf_pro_sdk.clients.pro_api.ProApi.get_mobile_device_inventory_v2`.
+    """
+
+    watermark_fields = ("lastInventoryUpdateDate",)
+    allowed_sections = get_mobile_device_inventory_v2_allowed_sections
+
+    def _request_records(self, sections, filter_expression=None, page_size=None):
+        paginator = KeysetPaginator(
+            api_client=self.client.pro_api,
+            resource_path="v2/mobile-devices/detail",
+            return_model=MobileDevice,
+            id_field="mobileDeviceId",
+            page_size=page_size or self.page_size,
+            filter_expression=filter_expression,
+            extra_params={"section": ",".join(sections)},
+        )
+        return paginator(stream_records=True)
+
+    def _record_id(self, record) -> str:
+        return record.mobileDeviceId
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Optional, Tuple, Union
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+except ImportError:
+    CRYPTOGRAPHY_IS_INSTALLED = False
+    Fernet = InvalidToken = hashes = PBKDF2HMAC = None
+else:
+    CRYPTOGRAPHY_IS_INSTALLED = True
+
+from ..models.client import AccessToken
+
+logger = logging.getLogger("jamf_pro_sdk")
+
+DEFAULT_TOKEN_CACHE_DIR = Path.home() / ".cache" / "jamf-pro-sdk" / "tokens"
+MAX_CACHED_KEYS = 32
+
+
+class TokenCache:
+    def __init__(self, path: Union[str, Path] = None, iterations: int = 100_000):
+        """An encrypted on-disk cache of access tokens that can be shared by separate processes,
+        e.g. cron jobs or CLI wrappers that create a new client on every run.
+
+        Each token is stored in its own file keyed by the server and the identity (username or
+        client ID) of the credentials. Tokens are encrypted with a key derived from the password
+        or client secret, so a cached token can only be read with the same credentials. Each file
+        keeps the salt it was first written with, so the (deliberately slow) key derivation only
+        runs once per file and secret in a process. Files are created with ``0600`` permissions.
+
+        .. important::
+
+            The token cache requires the ``tokencache`` extra dependency.
+
+        :param path: (optional) The directory the token files are written to (defaults to
+            ``~/.cache/jamf-pro-sdk/tokens``).
+        :type path: str | Path
+
+        :param iterations: The number of PBKDF2 iterations used to derive the encryption key.
+        :type iterations: int
+        """
+        if not CRYPTOGRAPHY_IS_INSTALLED:
+            raise ImportError("The 'tokencache' extra dependency is required.")
+
+        self.path = Path(path) if path else DEFAULT_TOKEN_CACHE_DIR
+        self.iterations = iterations
+        # Key derivation is deliberately slow: keep the most recently used derived keys
+        self._keys: OrderedDict[Tuple[bytes, str], Fernet] = OrderedDict()
+        self._lock = Lock()
+
+    def _token_file(self, server: str, identity: str) -> Path:
+        name = hashlib.sha256(f"{server}\0{identity}".encode()).hexdigest()
+        return self.path / f"{name}.token"
+
+    def _fernet(self, salt: bytes, secret: str) -> Fernet:
+        cache_key = (salt, hashlib.sha256(secret.encode()).hexdigest())
+        with self._lock:
+            if cache_key in self._keys:
+                self._keys.move_to_end(cache_key)
+            else:
+                kdf = PBKDF2HMAC(
+                    algorithm=hashes.SHA256(), length=32, salt=salt, iterations=self.iterations
+                )
+                self._keys[cache_key] = Fernet(
+                    base64.urlsafe_b64encode(kdf.derive(secret.encode()))
+                )
+                if len(self._keys) > MAX_CACHED_KEYS:
+                    self._keys.popitem(last=False)
+            return self._keys[cache_key]
+
+    @staticmethod
+    def _read_salt(token_file: Path) -> Optional[bytes]:
+        """Return the salt of an existing token file, or ``None`` if it cannot be read."""
+        try:
+            salt = base64.b64decode(json.loads(token_file.read_text())["salt"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return salt if len(salt) == 16 else None
+
+    def load(self, server: str, identity: str, secret: str) -> Optional[AccessToken]:
+        """Read a cached access token.
+
+        :param server: The base URL of the Jamf Pro server.
+        :type server: str
+
+        :param identity: The username or client ID.
+        :type identity: str
+
+        :param secret: The password or client secret.
+        :type secret: str
+
+        :return: The cached ``AccessToken``, or ``None`` if there is no readable unexpired token.
+        :rtype: AccessToken
+        """
+        token_file = self._token_file(server, identity)
+        try:
+            data = json.loads(token_file.read_text())
+            fernet = self._fernet(base64.b64decode(data["salt"]), secret)
+            access_token = AccessToken.model_validate_json(fernet.decrypt(data["token"].encode()))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, InvalidToken) as err:
+            logger.debug("Ignoring unreadable cached access token %s: %s", token_file, err)
+            return None
+
+        if not access_token.token or access_token.is_expired:
+            return None
+
+        logger.debug(
+            "Loaded access token from token cache (%ds remaining)", access_token.seconds_remaining
+        )
+        return access_token
+
+    def save(self, server: str, identity: str, secret: str, access_token: AccessToken) -> None:
+        """Write an access token to the cache. Errors are logged and otherwise ignored.
+
+        :param server: The base URL of the Jamf Pro server.
+        :type server: str
+
+        :param identity: The username or client ID.
+        :type identity: str
+
+        :param secret: The password or client secret.
+        :type secret: str
+
+        :param access_token: The access token to store.
+        :type access_token: AccessToken
+        """
+        token_file = self._token_file(server, identity)
+        salt = self._read_salt(token_file) or os.urandom(16)
+        data = {
+            "salt": base64.b64encode(salt).decode(),
+            "token": self._fernet(salt, secret)
+            .encrypt(access_token.model_dump_json().encode())
+            .decode(),
+        }
+
+        try:
+            self.path.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # Write to a temporary file and rename so other processes never read a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as fobj:
+                    json.dump(data, fobj)
+                os.replace(tmp_path, token_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as err:
+            logger.warning("Unable to write access token to token cache: %s", err)
+
+    def clear(self, server: str, identity: str) -> None:
+        """Remove a cached access token.
+
+        :param server: The base URL of the Jamf Pro server.
+        :type server: str
+
+        :param identity: The username or client ID.
+        :type identity: str
+        """
+        self._token_file(server, identity).unlink(missing_ok=True)
@@ -1,5 +1,8 @@
 import logging
 import sys
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
 
 
 def logger_quick_setup(level=logging.INFO):
@@ -22,3 +25,31 @@ def logger_quick_setup(level=logging.INFO):
         urllib3_logger = logging.getLogger("urllib3")
         urllib3_logger.setLevel(logging.DEBUG)
         urllib3_logger.addHandler(handler)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse the value of a ``Retry-After`` response header into a number of seconds. The header
+    may be given as a number of seconds or as an HTTP date.
+
+    :param value: The header value.
+    :type value: str
+
+    :return: The number of seconds to wait, or ``None`` if the value is missing or invalid.
+    :rtype: float
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
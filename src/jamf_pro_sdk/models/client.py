@@ -1,8 +1,12 @@
+import fnmatch
 import platform
+import random
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Set, Union
+
+from pydantic import Field
 
 from ..__about__ import __version__
 from . import BaseModel
@@ -16,6 +20,144 @@ class Schemes(str, Enum):
     https = "https"
 
 
+class JsonBackends(str, Enum):
+    stdlib = "stdlib"
+    pydantic = "pydantic"
+    orjson = "orjson"
+
+
+class RetryPolicy(BaseModel):
+    """Retry behavior for Classic API, Pro API, and JCDS2 requests.
+
+    Retries are attempted with jittered exponential backoff. A ``Retry-After`` header on the
+    response takes precedence over the computed backoff. Requests using a method in ``methods``
+    are retried on any status in ``status_codes`` or on a connection error. Other requests (e.g.
+    ``POST``) are only retried on a status in ``always_retry_status_codes`` or a connection
+    timeout, where the server cannot have processed the request.
+
+    Retries draw from a budget shared by all requests on the client: every request adds
+    ``budget_ratio`` to the budget, and every retry spends one. This prevents retries from
+    multiplying load on a server that is failing most requests.
+
+    :param max_retries: The maximum number of retries for a single request (defaults to `3`).
+    :type max_retries: int
+
+    :param backoff_factor: The base delay in seconds. The delay before retry ``n`` is
+        ``backoff_factor * 2 ** (n - 1)`` (defaults to `0.5`).
+    :type backoff_factor: float
+
+    :param backoff_max: The maximum delay in seconds between retries (defaults to `30`).
+    :type backoff_max: float
+
+    :param jitter: Randomize each delay between zero and the computed backoff (defaults to `True`).
+    :type jitter: bool
+
+    :param status_codes: The response status codes that will be retried for idempotent methods.
+    :type status_codes: Set[int]
+
+    :param methods: The HTTP methods considered idempotent.
+    :type methods: Set[str]
+
+    :param always_retry_status_codes: The response status codes that will be retried for any
+        method (defaults to `429`).
+    :type always_retry_status_codes: Set[int]
+
+    :param respect_retry_after: Wait for the duration of a ``Retry-After`` response header, up to
+        ``retry_after_max`` seconds (defaults to `True`).
+    :type respect_retry_after: bool
+
+    :param retry_after_max: The longest ``Retry-After`` value that will be honored. Responses asking
+        for a longer wait are not retried (defaults to `120`).
+    :type retry_after_max: float
+
+    :param budget_ratio: The fraction of a retry added to the budget by each request (defaults to
+        `0.2`).
+    :type budget_ratio: float
+
+    :param budget_min_retries: The size of the retry budget when the client is created, and the
+        most it can accumulate (defaults to `10`).
+    :type budget_min_retries: int
+    """
+
+    max_retries: int = Field(default=3, ge=0)
+    backoff_factor: float = Field(default=0.5, ge=0)
+    backoff_max: float = Field(default=30, ge=0)
+    jitter: bool = True
+    status_codes: Set[int] = {429, 500, 502, 503, 504}
+    methods: Set[str] = {"DELETE", "GET", "HEAD", "OPTIONS", "PUT"}
+    always_retry_status_codes: Set[int] = {429}
+    respect_retry_after: bool = True
+    retry_after_max: float = Field(default=120, ge=0)
+    budget_ratio: float = Field(default=0.2, ge=0)
+    budget_min_retries: int = Field(default=10, ge=0)
+
+    def is_idempotent(self, method: str) -> bool:
+        """Can requests using this HTTP method be safely retried on any failure?"""
+        return method.upper() in self.methods
+
+    def is_retryable_status(self, method: str, status_code: int) -> bool:
+        """Should a response with this status code be retried for this HTTP method?"""
+        if status_code in self.always_retry_status_codes:
+            return True
+        return self.is_idempotent(method) and status_code in self.status_codes
+
+    def backoff(self, retry_number: int, retry_after: Optional[float] = None) -> float:
+        """The number of seconds to wait before the given retry (starting at `1`)."""
+        if retry_after is not None and self.respect_retry_after:
+            return min(retry_after, self.retry_after_max)
+
+        delay = min(self.backoff_max, self.backoff_factor * (2 ** (retry_number - 1)))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+class CachePolicy(BaseModel):
+    """Caching of Classic API and Pro API ``GET`` responses.
+
+    A cached response is returned without a request until its TTL expires. After that, a
+    response that had an ``ETag`` or ``Last-Modified`` header is revalidated with a conditional
+    request: a ``304 Not Modified`` response renews the cached response instead of downloading it
+    again. A ``POST``, ``PUT``, ``PATCH`` or ``DELETE`` request removes the cached responses of the
+    same resource in both APIs (e.g. a request to ``JSSResource/packages/id/1`` removes the cached
+    responses of ``JSSResource/packages`` and ``api/v1/packages``).
+
+    :param ttl: The number of seconds a response is used without revalidation (defaults to `60`).
+    :type ttl: float
+
+    :param path_ttls: TTLs for specific paths. Keys are ``fnmatch`` patterns matched against the
+        URL path without the leading ``/`` (e.g. ``JSSResource/categories*`` or
+        ``api/v1/packages*``). The first matching pattern is used. A TTL of `0` disables caching
+        for the matching paths.
+    :type path_ttls: Dict[str, float]
+
+    :param max_entries: The most responses kept in memory. The least recently used responses are
+        removed first (defaults to `256`).
+    :type max_entries: int
+
+    :param max_bytes: The most response body bytes kept in memory (defaults to 64 MiB).
+    :type max_bytes: int
+
+    :param directory: A directory to also persist cached responses in so they are reused by
+        later processes. Responses are stored separately for each server and credentials identity
+        (see :attr:`~jamf_pro_sdk.clients.auth.CredentialsProvider.identity`). Files are only
+        readable by the current user.
+    :type directory: str | Path
+    """
+
+    ttl: float = Field(default=60, ge=0)
+    path_ttls: Dict[str, float] = {}
+    max_entries: int = Field(default=256, ge=1)
+    max_bytes: int = Field(default=64 * 1024 * 1024, ge=0)
+    directory: Optional[Union[str, Path]] = None
+
+    def ttl_for(self, path: str) -> float:
+        """The TTL for a URL path."""
+        path = path.lstrip("/")
+        for pattern, ttl in self.path_ttls.items():
+            if fnmatch.fnmatchcase(path, pattern):
+                return ttl
+        return self.ttl
+
+
 class SessionConfig(BaseModel):
     """Jamf Pro client session configuration.
 
@@ -25,10 +167,57 @@ class SessionConfig(BaseModel):
     :param max_retries: HTTP request retries (defaults to `0`).
     :type max_retries: int
 
+    :param retry_policy: Retry failed Classic API, Pro API, and JCDS2 requests with the given
+        :class:`RetryPolicy` (defaults to no SDK retries). This is separate from ``max_retries``.
+    :type retry_policy: RetryPolicy
+
+    :param rate_limit: The maximum sustained number of requests per second the client will send to
+        the Classic API and Pro API (defaults to no limit).
+    :type rate_limit: float
+
+    :param rate_limit_burst: The number of requests that may be sent at once under a ``rate_limit``
+        after a period of no activity (defaults to ``rate_limit`` rounded up).
+    :type rate_limit_burst: int
+
+    :param rate_limit_file: A path to a file that stores the ``rate_limit`` state. Every client
+        and process on the host using the same file shares one rate limit. Only supported on macOS
+        and Linux.
+    :type rate_limit_file: str | Path
+
+    :param response_cache: Cache Classic API and Pro API ``GET`` responses with the given
+        :class:`CachePolicy` (defaults to no caching). Not supported by
+        :class:`~jamf_pro_sdk.clients.aio.AsyncJamfProClient`.
+    :type response_cache: CachePolicy
+
+    :param coalesce_requests: Send identical Classic API and Pro API ``GET`` requests that are in
+        flight at the same time (e.g. from threads of a concurrent operation) once, and share the
+        response between the callers (defaults to `False`). Not supported by
+        :class:`~jamf_pro_sdk.clients.aio.AsyncJamfProClient`.
+    :type coalesce_requests: bool
+
     :param max_concurrency: The maximum number of HTTP connections the client will create when
         making concurrent requests (defaults to `5`).
     :type max_concurrency: int
 
+    :param max_in_flight_factor: Bounds the number of operations
+        :meth:`~jamf_pro_sdk.clients.JamfProClient.concurrent_api_requests` will have submitted but
+        not yet returned to a multiple of the concurrency (defaults to `2`). Arguments are only read
+        from the iterable as space in this window frees up.
+    :type max_in_flight_factor: int
+
+    :param adaptive_concurrency: Let the client adjust the number of concurrent operations between
+        `1` and ``max_concurrency`` based on response latency and throttling (``429`` and ``503``
+        responses, or ``Retry-After`` headers) from Jamf Pro (defaults to `False`). The current value
+        is available from ``JamfProClient.concurrency_limiter.limit``. Not supported by
+        :class:`~jamf_pro_sdk.clients.aio.AsyncJamfProClient`.
+    :type adaptive_concurrency: bool
+
+    :param json_backend: How JSON response bodies are decoded and parsed into models (defaults to
+        `stdlib`). ``pydantic`` passes raw response bytes directly to pydantic-core's native parser
+        and validates models in a single step. ``orjson`` decodes with orjson and requires the
+        ``orjson`` extra dependency.
+    :type json_backend: str
+
     :param return_exceptions: Global setting that controls returning exceptions when
         :meth:`~jamf_pro_sdk.clients.JamfProClient.concurrent_operations` is invoked.  Setting this
         to ``True`` will return the exception object if an error is encountered by the ``handler``.
@@ -53,7 +242,16 @@ class SessionConfig(BaseModel):
 
     timeout: Optional[int] = None
     max_retries: int = 0
+    retry_policy: Optional[RetryPolicy] = None
+    rate_limit: Optional[float] = Field(default=None, gt=0)
+    rate_limit_burst: Optional[int] = Field(default=None, ge=1)
+    rate_limit_file: Optional[Union[str, Path]] = None
+    response_cache: Optional[CachePolicy] = None
+    coalesce_requests: bool = False
     max_concurrency: int = 5
+    max_in_flight_factor: int = Field(default=2, ge=1)
+    adaptive_concurrency: bool = False
+    json_backend: JsonBackends = JsonBackends.stdlib
     return_exceptions: bool = True
     user_agent: str = DEFAULT_USER_AGENT
     verify: bool = True
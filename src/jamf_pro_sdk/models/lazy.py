@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import functools
+from typing import Annotated, Any, Dict, Generic, Optional, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+T = TypeVar("T", bound=BaseModel)
+
+
+@functools.lru_cache(maxsize=None)
+def _field_adapter(model: Type[BaseModel], name: str) -> TypeAdapter:
+    field = model.model_fields[name]
+    if field.metadata:
+        return TypeAdapter(Annotated[(field.annotation, *field.metadata)])
+    return TypeAdapter(field.annotation)
+
+
+class LazyModel(Generic[T]):
+    """A lightweight proxy for a Pydantic model that holds the raw response data and validates
+    each field the first time it is accessed.
+
+    Reading a few fields of a large record (e.g. a computer inventory record with all sections)
+    only pays the validation cost of those fields. Field validation uses the field's type and
+    constraints; validators defined on the model only run when the full model is created with
+    :meth:`validate`. Attributes that are not fields, such as ``model_dump()``, are read from the
+    fully validated model.
+
+    .. note::
+
+        A proxy is not an instance of the model class. Call :meth:`validate` where a real model
+        instance is required.
+
+    :param model: The Pydantic model the data represents.
+    :type model: Type[BaseModel]
+
+    :param data: The raw data for the model.
+    :type data: dict
+    """
+
+    __slots__ = ("_model", "_raw", "_values", "_instance")
+
+    def __init__(self, model: Type[T], data: Dict[str, Any]):
+        self._model = model
+        self._raw = data
+        self._values: Dict[str, Any] = {}
+        self._instance: Optional[T] = None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names that are not slots; private names are never model fields
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        if self._instance is not None:
+            return getattr(self._instance, name)
+
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+
+        field = self._model.model_fields.get(name)
+        if field is None:
+            return getattr(self.validate(), name)
+
+        key = field.alias or name
+        if key in self._raw:
+            value = _field_adapter(self._model, name).validate_python(self._raw[key])
+        else:
+            value = field.get_default(call_default_factory=True)
+
+        self._values[name] = value
+        return value
+
+    def __repr__(self):
+        return f"LazyModel[{self._model.__name__}]({self._raw!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyModel):
+            return self._model is other._model and self._raw == other._raw
+        return NotImplemented
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """The unvalidated data."""
+        return self._raw
+
+    def validate(self) -> T:
+        """Validate all of the data and return the model instance. The result is cached.
+
+        :return: The model instance.
+        :rtype: BaseModel
+        """
+        if self._instance is None:
+            self._instance = self._model.model_validate(self._raw)
+        return self._instance
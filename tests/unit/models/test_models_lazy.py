@@ -0,0 +1,38 @@
+import pytest
+from pydantic import ValidationError
+from src.jamf_pro_sdk.models.lazy import LazyModel
+from src.jamf_pro_sdk.models.pro.computers import Computer, ComputerGeneral
+
+COMPUTER_JSON = {
+    "id": "1",
+    "udid": "a311b7c8-75ee-48cf-9b1b-a8598f013366",
+    "general": {"name": "Backancient", "lastIpAddress": "10.0.0.1"},
+    "hardware": {"processorCount": "not a number"},
+}
+
+
+def test_lazy_model_validates_fields_on_access():
+    computer = LazyModel(Computer, COMPUTER_JSON)
+
+    assert computer.id == "1"
+    assert isinstance(computer.general, ComputerGeneral)
+    assert computer.general.name == "Backancient"
+    assert computer.general is computer.general
+    # Fields missing from the data use the model's defaults
+    assert computer.storage is None
+    assert computer.userAndLocation is not None
+
+    # The invalid section is only validated when it is accessed
+    with pytest.raises(ValidationError):
+        computer.hardware
+
+
+def test_lazy_model_full_validation():
+    computer = LazyModel(Computer, {"id": "1", "general": {"name": "Backancient"}})
+    assert computer.raw["id"] == "1"
+    assert computer.model_dump(exclude_none=True)["general"]["name"] == "Backancient"
+    assert computer.validate() == Computer.model_validate(computer.raw)
+    assert computer.validate() is computer.validate()
+
+    with pytest.raises(ValidationError):
+        LazyModel(Computer, COMPUTER_JSON).validate()
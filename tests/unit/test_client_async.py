@@ -0,0 +1,137 @@
+import asyncio
+
+import httpx
+import pytest
+from src.jamf_pro_sdk.clients.aio import AsyncJamfProClient
+from src.jamf_pro_sdk.models.client import RetryPolicy, SessionConfig
+
+from tests.unit.utils import StaticCredentialsProvider
+
+
+def computers_inventory(request: httpx.Request) -> httpx.Response:
+    assert request.headers["Authorization"] == "Bearer abc123"
+    page = int(request.url.params["page"])
+    page_size = int(request.url.params["page-size"])
+    ids = range(page * page_size, min((page + 1) * page_size, 25))
+    return httpx.Response(
+        200, json={"totalCount": 25, "results": [{"id": str(i), "udid": str(i)} for i in ids]}
+    )
+
+
+def create_client(handler) -> AsyncJamfProClient:
+    client = AsyncJamfProClient(
+        server="jamf.example.org",
+        credentials=StaticCredentialsProvider(),
+        session_config=SessionConfig(max_concurrency=3),
+    )
+    client.async_session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_async_paginated_request():
+    async def run():
+        async with create_client(computers_inventory) as client:
+            return await client.pro_api.get_computer_inventory_v1(page_size=10)
+
+    computers = asyncio.run(run())
+    assert [c.id for c in computers] == [str(i) for i in range(25)]
+
+
+def test_async_stream_records():
+    async def run():
+        async with create_client(computers_inventory) as client:
+            records = await client.pro_api.get_computer_inventory_v1(
+                page_size=10, stream_records=True
+            )
+            return [c.id async for c in records]
+
+    assert asyncio.run(run()) == [str(i) for i in range(25)]
+
+
+def test_async_failed_page_is_raised():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params["page"] == "1":
+            return httpx.Response(500, json={"httpStatus": 500, "errors": []})
+        return computers_inventory(request)
+
+    async def run():
+        async with create_client(handler) as client:
+            records = await client.pro_api.get_computer_inventory_v1(
+                page_size=10, stream_records=True
+            )
+            return [c.id async for c in records]
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(run())
+
+
+def test_async_concurrent_requests():
+    def category(request: httpx.Request) -> httpx.Response:
+        category_id = int(request.url.path.rsplit("/", 1)[-1])
+        return httpx.Response(
+            200, json={"category": {"id": category_id, "name": f"Category {category_id}"}}
+        )
+
+    async def run():
+        async with create_client(category) as client:
+            return [
+                c.id
+                async for c in client.concurrent_api_requests(
+                    client.classic_api.get_category_by_id, range(1, 11)
+                )
+            ]
+
+    assert asyncio.run(run()) == list(range(1, 11))
+
+
+def test_async_session_config_policies(caplog):
+    attempts = []
+
+    def category(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        if len(attempts) == 1:
+            return httpx.Response(503, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"category": {"id": 1, "name": "Apps"}})
+
+    client = AsyncJamfProClient(
+        server="jamf.example.org",
+        credentials=StaticCredentialsProvider(),
+        session_config=SessionConfig(
+            retry_policy=RetryPolicy(backoff_factor=0, jitter=False),
+            rate_limit=100,
+            adaptive_concurrency=True,
+        ),
+    )
+    assert "'adaptive_concurrency' option is not supported" in caplog.text
+    client.async_session = httpx.AsyncClient(transport=httpx.MockTransport(category))
+
+    acquired = []
+    client.rate_limiter.acquire = lambda: acquired.append(1)
+
+    async def run():
+        async with client:
+            return await client.classic_api.get_category_by_id(1)
+
+    assert asyncio.run(run()).name == "Apps"
+    assert len(attempts) == 2
+    assert len(acquired) == 2
+
+
+def test_async_shared_operation_payload():
+    requests = []
+
+    def computer(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(201, text="<computer><id>7</id></computer>")
+
+    async def run():
+        async with create_client(computer) as client:
+            return await client.classic_api.set_computer_managed_by_id(
+                7, management_user="jamf", management_password="secret"
+            )
+
+    assert asyncio.run(run()) is None
+    assert requests[0].method == "PUT"
+    assert requests[0].url.path == "/JSSResource/computers/id/7"
+    assert b"<management_username>jamf</management_username>" in requests[0].content
+    assert b"<management_password>secret</management_password>" in requests[0].content
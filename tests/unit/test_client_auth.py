@@ -0,0 +1,380 @@
+import asyncio
+import gc
+import time
+from datetime import datetime, timedelta, timezone
+from threading import Event, Lock
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+import requests
+from src.jamf_pro_sdk.clients import JamfProClient
+from src.jamf_pro_sdk.clients.aio import AsyncJamfProClient
+from src.jamf_pro_sdk.clients.auth import (
+    ApiClientCredentialsProvider,
+    CredentialsProvider,
+    PooledCredentialsProvider,
+    UserCredentialsProvider,
+)
+from src.jamf_pro_sdk.clients.token_cache import TokenCache
+from src.jamf_pro_sdk.models.client import AccessToken
+
+from tests.unit.utils import MockAdapter
+
+
+class CountingCredentialsProvider(CredentialsProvider):
+    def __init__(self, lifetime: timedelta):
+        super().__init__()
+        self.lifetime = lifetime
+        self.requests = 0
+        self.attach_client(MagicMock())
+
+    def _request_access_token(self) -> AccessToken:
+        self.requests += 1
+        return AccessToken(
+            type="oauth",
+            token=f"token-{self.requests}",
+            expires=datetime.now(timezone.utc) + self.lifetime,
+        )
+
+
+class FailingLock:
+    def __enter__(self):
+        raise AssertionError("The lock should not be acquired")
+
+    def __exit__(self, *args):
+        pass
+
+
+def test_cached_token_returned_without_lock():
+    provider = CountingCredentialsProvider(lifetime=timedelta(minutes=20))
+    token = provider.get_access_token()
+
+    provider._global_lock = FailingLock()
+    assert provider.get_access_token() is token
+    assert provider.get_access_token(thread_lock=FailingLock()) is token
+    assert provider.requests == 1
+
+
+def test_token_near_expiry_takes_lock_and_refreshes():
+    # Within the fast path margin of the refresh TTL the lock is taken; past the TTL a new token
+    # is requested
+    provider = CountingCredentialsProvider(lifetime=timedelta(seconds=2))
+    first = provider.get_access_token()
+    assert provider._get_cached_access_token() is None
+
+    second = provider.get_access_token(thread_lock=Lock())
+    assert second.token != first.token
+    assert provider.requests == 2
+
+
+def test_cached_token_is_not_used_before_first_request():
+    provider = CountingCredentialsProvider(lifetime=timedelta(minutes=20))
+    assert provider._get_cached_access_token() is None
+
+
+def test_api_client_background_refresh():
+    client = JamfProClient(
+        server="jamf.example.org",
+        credentials=ApiClientCredentialsProvider(
+            "client_id", "client_secret", background_refresh=True, refresh_fraction=0.1
+        ),
+    )
+    token_requests = []
+
+    def handler(request):
+        if request.path_url == "/api/v1/oauth/token":
+            token_requests.append(request)
+            return (
+                200,
+                {"access_token": f"token-{len(token_requests)}", "expires_in": 1, "scope": ""},
+                {},
+            )
+        return 200, {"categories": []}, {}
+
+    client.session.mount("https://", MockAdapter(handler))
+    credentials = client._credentials
+    try:
+        assert credentials.get_access_token().token == "token-1"
+        deadline = time.monotonic() + 5
+        while len(token_requests) < 3 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert len(token_requests) >= 3
+        assert credentials._access_token.token != "token-1"
+    finally:
+        credentials.stop_background_refresh(timeout=5)
+
+    requests_made = len(token_requests)
+    time.sleep(0.3)
+    assert len(token_requests) == requests_made
+
+
+def test_background_refresh_does_not_hold_lock_during_request():
+    client = JamfProClient(
+        server="jamf.example.org",
+        credentials=ApiClientCredentialsProvider(
+            "client_id", "client_secret", background_refresh=True, refresh_fraction=0.001
+        ),
+    )
+    refresh_started, release_refresh = Event(), Event()
+    token_requests = []
+
+    def handler(request):
+        token_requests.append(request)
+        if len(token_requests) == 2:
+            refresh_started.set()
+            release_refresh.wait(5)
+        return (
+            200,
+            {"access_token": f"token-{len(token_requests)}", "expires_in": 1200, "scope": ""},
+            {},
+        )
+
+    client.session.mount("https://", MockAdapter(handler))
+    credentials = client._credentials
+    try:
+        assert credentials.get_access_token().token == "token-1"
+        assert refresh_started.wait(5)
+        assert credentials._global_lock.acquire(blocking=False)
+        credentials._global_lock.release()
+        release_refresh.set()
+        deadline = time.monotonic() + 5
+        while credentials._access_token.token == "token-1" and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert credentials._access_token.token == "token-2"
+    finally:
+        release_refresh.set()
+        credentials.stop_background_refresh(timeout=5)
+
+
+def background_refresh_client(expires_in: int) -> JamfProClient:
+    client = JamfProClient(
+        server="jamf.example.org",
+        credentials=ApiClientCredentialsProvider(
+            "client_id", "client_secret", background_refresh=True
+        ),
+    )
+    client.session.mount(
+        "https://",
+        MockAdapter(
+            lambda r: (200, {"access_token": "abc", "expires_in": expires_in, "scope": ""}, {})
+        ),
+    )
+    return client
+
+
+def test_background_refresh_delay_for_cached_token():
+    credentials = ApiClientCredentialsProvider("client_id", "client_secret")
+    # A token loaded from the token cache was not issued to this provider
+    credentials._access_token = AccessToken(
+        type="oauth", token="cached", expires=datetime.now(timezone.utc) + timedelta(minutes=20)
+    )
+    assert 14 * 60 < credentials._background_refresh_delay() <= 15 * 60
+
+    credentials._access_token_issued = (
+        "cached",
+        datetime.now(timezone.utc) - timedelta(minutes=10),
+    )
+    # Issued 10 minutes ago with a 30 minute lifetime: refreshed 22.5 minutes after it was issued
+    assert 12 * 60 < credentials._background_refresh_delay() <= 12.5 * 60
+
+
+def test_background_refresh_stops_when_client_closed():
+    with background_refresh_client(expires_in=1200) as client:
+        client.get_access_token()
+        refresh_thread = client._credentials._refresh_thread
+        assert refresh_thread.is_alive()
+    refresh_thread.join(timeout=5)
+    assert not refresh_thread.is_alive()
+
+
+def test_background_refresh_stops_when_provider_collected():
+    client = background_refresh_client(expires_in=1200)
+    client.get_access_token()
+    refresh_thread = client._credentials._refresh_thread
+    del client
+    gc.collect()
+    refresh_thread.join(timeout=5)
+    assert not refresh_thread.is_alive()
+
+
+def test_refresh_fraction_must_be_a_fraction():
+    with pytest.raises(ValueError):
+        ApiClientCredentialsProvider("client_id", "client_secret", refresh_fraction=1.5)
+
+
+def test_token_cache_round_trip(tmp_path):
+    cache = TokenCache(tmp_path, iterations=1)
+    token = AccessToken(
+        type="user", token="abc123", expires=datetime.now(timezone.utc) + timedelta(minutes=20)
+    )
+    cache.save("https://jamf.example.org", "oscar", "secret", token)
+
+    token_files = list(tmp_path.iterdir())
+    assert len(token_files) == 1
+    assert token_files[0].stat().st_mode & 0o777 == 0o600
+    assert b"abc123" not in token_files[0].read_bytes()
+
+    assert cache.load("https://jamf.example.org", "oscar", "secret") == token
+    assert cache.load("https://jamf.example.org", "oscar", "wrong") is None
+    assert cache.load("https://other.example.org", "oscar", "secret") is None
+
+    cache.clear("https://jamf.example.org", "oscar")
+    assert cache.load("https://jamf.example.org", "oscar", "secret") is None
+
+
+def test_token_cache_shared_between_clients(tmp_path):
+    cache = TokenCache(tmp_path, iterations=1)
+    token_requests = []
+
+    def handler(request):
+        token_requests.append(request)
+        return 200, {"token": "abc123", "expires": "2099-01-01T00:00:00Z"}, {}
+
+    def new_client(password):
+        client = JamfProClient(
+            server="jamf.example.org",
+            credentials=UserCredentialsProvider("oscar", password, token_cache=cache),
+        )
+        client.session.mount("https://", MockAdapter(handler))
+        return client
+
+    assert new_client("secret")._credentials.get_access_token().token == "abc123"
+    assert new_client("secret")._credentials.get_access_token().token == "abc123"
+    assert len(token_requests) == 1
+
+    new_client("changed")._credentials.get_access_token()
+    assert len(token_requests) == 2
+
+
+def test_token_cache_reuses_salt(tmp_path):
+    cache = TokenCache(tmp_path, iterations=1)
+    for i in range(3):
+        token = AccessToken(
+            type="user", token=f"abc{i}", expires=datetime.now(timezone.utc) + timedelta(minutes=20)
+        )
+        cache.save("https://jamf.example.org", "oscar", "secret", token)
+        assert cache.load("https://jamf.example.org", "oscar", "secret") == token
+
+    # Every save of the file used the same salt, so the key was only derived once
+    assert len(cache._keys) == 1
+
+    for i in range(100):
+        cache.save("https://jamf.example.org", f"user{i}", "secret", token)
+    assert len(cache._keys) <= 32
+
+
+def test_token_cache_skipped_without_credentials(tmp_path, caplog):
+    provider = CountingCredentialsProvider(timedelta(minutes=20))
+    provider.token_cache = TokenCache(tmp_path, iterations=1)
+    provider.attach_client(MagicMock(base_server_url="https://jamf.example.org:443"))
+    assert "the token cache will not be used" in caplog.text
+
+    assert provider.get_access_token().token == "token-1"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_rejected_cached_token_is_cleared(tmp_path):
+    cache = TokenCache(tmp_path, iterations=1)
+    cache.save(
+        "https://jamf.example.org:443",
+        "oscar",
+        "secret",
+        AccessToken(type="user", token="revoked", expires="2099-01-01T00:00:00Z"),
+    )
+
+    def handler(request):
+        if request.url.endswith("/api/v1/auth/token"):
+            return 200, {"token": "abc123", "expires": "2099-01-01T00:00:00Z"}, {}
+        if request.headers["Authorization"] == "Bearer revoked":
+            return 401, None, {}
+        return 200, {"categories": []}, {}
+
+    client = JamfProClient(
+        server="jamf.example.org",
+        credentials=UserCredentialsProvider("oscar", "secret", token_cache=cache),
+    )
+    client.session.mount("https://", MockAdapter(handler))
+
+    with pytest.raises(requests.HTTPError):
+        client.classic_api_request("get", "categories")
+    assert cache.load("https://jamf.example.org:443", "oscar", "secret") is None
+
+    client.classic_api_request("get", "categories")
+    assert cache.load("https://jamf.example.org:443", "oscar", "secret").token == "abc123"
+
+
+class NamedCredentialsProvider(CredentialsProvider):
+    def __init__(self, name: str):
+        super().__init__()
+        self.name = name
+
+    def _request_access_token(self) -> AccessToken:
+        return AccessToken(
+            type="oauth",
+            token=self.name,
+            expires=datetime.now(timezone.utc) + timedelta(minutes=20),
+        )
+
+
+def pooled_client(strategy, throttled_tokens=()):
+    client = JamfProClient(
+        server="jamf.example.org",
+        credentials=PooledCredentialsProvider(
+            [NamedCredentialsProvider(name) for name in ("a", "b", "c")], strategy=strategy
+        ),
+    )
+    adapter = MockAdapter(
+        lambda r: (
+            429 if r.headers["Authorization"].split()[1] in throttled_tokens else 200,
+            {"categories": []},
+            {},
+        )
+    )
+    client.session.mount("https://", adapter)
+    return client, adapter
+
+
+def used_tokens(adapter):
+    return [r.headers["Authorization"].split()[1] for r in adapter.requests]
+
+
+def test_pooled_credentials_round_robin():
+    client, adapter = pooled_client("round_robin")
+    for _ in range(6):
+        client.classic_api_request("get", "categories")
+    assert used_tokens(adapter) == ["a", "b", "c", "a", "b", "c"]
+
+
+def test_pooled_credentials_least_recently_throttled():
+    client, adapter = pooled_client("least_recently_throttled", throttled_tokens=("a",))
+    with pytest.raises(requests.HTTPError):
+        client.classic_api_request("get", "categories")
+
+    for _ in range(4):
+        client.classic_api_request("get", "categories")
+    assert used_tokens(adapter) == ["a", "b", "c", "b", "c"]
+
+
+def test_pooled_credentials_async_selects_once_per_request():
+    used = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        used.append(request.headers["Authorization"].split()[1])
+        return httpx.Response(200, json={"categories": []})
+
+    client = AsyncJamfProClient(
+        server="jamf.example.org",
+        credentials=PooledCredentialsProvider(
+            [NamedCredentialsProvider(name) for name in ("a", "b", "c")]
+        ),
+    )
+    client.async_session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def run():
+        async with client:
+            for _ in range(6):
+                await client.classic_api_request("get", "categories")
+
+    asyncio.run(run())
+    assert used == ["a", "b", "c", "a", "b", "c"]
@@ -0,0 +1,167 @@
+import json
+import time
+from urllib.parse import urlparse
+
+import pytest
+from src.jamf_pro_sdk.clients import JamfProClient
+from src.jamf_pro_sdk.models.client import CachePolicy, SessionConfig
+
+from tests.unit.utils import MockAdapter, StaticCredentialsProvider
+
+CATEGORIES = {"categories": [{"id": 1, "name": "Apps"}]}
+
+
+def server(request):
+    path = urlparse(request.url).path
+    if path == "/JSSResource/categories":
+        if request.headers.get("If-None-Match") == '"v1"':
+            return 304, None, {"ETag": '"v1"'}
+        return 200, CATEGORIES, {"ETag": '"v1"', "Content-Type": "application/json"}
+    elif path.startswith("/JSSResource/categories/id/"):
+        return 201, b"<category><id>1</id></category>", {}
+    return 200, {"path": path}, {"Content-Type": "application/json"}
+
+
+def make_client(policy: CachePolicy, identity: str = "static"):
+    client = JamfProClient(
+        server="jamf.example.org",
+        credentials=StaticCredentialsProvider(identity),
+        session_config=SessionConfig(response_cache=policy),
+    )
+    adapter = MockAdapter(server)
+    client.session.mount("https://", adapter)
+    return client, adapter
+
+
+def test_cache_fresh_responses():
+    client, adapter = make_client(CachePolicy(ttl=60))
+    first = client.classic_api.list_all_categories()
+    assert client.classic_api.list_all_categories() == first
+    assert len(adapter.requests) == 1
+
+
+def test_cache_revalidates_stale_responses():
+    client, adapter = make_client(CachePolicy(ttl=0.05))
+    client.classic_api_request("get", "categories")
+    time.sleep(0.1)
+
+    response = client.classic_api_request("get", "categories")
+    assert adapter.requests[-1].headers["If-None-Match"] == '"v1"'
+    assert response.status_code == 200
+    assert response.json() == CATEGORIES
+
+    # The 304 response renewed the cached response
+    client.classic_api_request("get", "categories")
+    assert len(adapter.requests) == 2
+
+
+def test_cache_path_ttls_and_query_params():
+    client, adapter = make_client(CachePolicy(ttl=60, path_ttls={"api/v1/computers-*": 0}))
+    for _ in range(2):
+        client.pro_api_request("get", "v1/packages", query_params={"page": "0"})
+        client.pro_api_request("get", "v1/packages", query_params={"page": "1"})
+        client.pro_api_request("get", "v1/computers-inventory")
+    assert len(adapter.requests) == 4
+
+
+def test_cache_invalidated_by_writes():
+    client, adapter = make_client(CachePolicy(ttl=60))
+    client.classic_api_request("get", "categories")
+    client.pro_api_request("get", "v1/packages")
+
+    client.classic_api_request("put", "categories/id/1", data="<category/>")
+    client.classic_api_request("get", "categories")
+    client.pro_api_request("get", "v1/packages")
+    assert [r.method for r in adapter.requests] == ["GET", "GET", "PUT", "GET"]
+
+
+def test_cache_invalidated_across_apis():
+    client, adapter = make_client(CachePolicy(ttl=60))
+    client.pro_api_request("get", "v1/packages")
+    client.pro_api_request("get", "v1/computers-inventory")
+    client.pro_api_request("get", "v1/categories")
+
+    client.classic_api_request("post", "packages/id/0", data="<package/>")
+    client.classic_api_request("delete", "computers/id/1")
+    for path in ["v1/packages", "v1/computers-inventory", "v1/categories"]:
+        client.pro_api_request("get", path)
+    assert [urlparse(r.url).path for r in adapter.requests[-2:]] == [
+        "/api/v1/packages",
+        "/api/v1/computers-inventory",
+    ]
+
+
+def test_cache_lru_bound():
+    client, adapter = make_client(CachePolicy(ttl=60, max_entries=2))
+    for path in ["v1/a", "v1/b", "v1/a", "v1/c", "v1/a", "v1/b"]:
+        client.pro_api_request("get", path)
+    # "b" was the least recently used entry when "c" was added
+    assert [urlparse(r.url).path for r in adapter.requests] == [
+        "/api/v1/a",
+        "/api/v1/b",
+        "/api/v1/c",
+        "/api/v1/b",
+    ]
+
+
+@pytest.mark.parametrize("write", [False, True])
+def test_cache_directory(tmp_path, write):
+    policy = CachePolicy(ttl=60, directory=tmp_path)
+    client, _ = make_client(policy)
+    client.classic_api.list_all_categories()
+    if write:
+        client.classic_api_request("put", "categories/id/1", data="<category/>")
+
+    client, adapter = make_client(policy)
+    client.classic_api.list_all_categories()
+    assert len(adapter.requests) == (1 if write else 0)
+
+
+def test_cache_directory_per_identity(tmp_path):
+    policy = CachePolicy(ttl=60, directory=tmp_path)
+    make_client(policy, identity="auditor")[0].classic_api.list_all_categories()
+
+    client, adapter = make_client(policy, identity="admin")
+    client.classic_api.list_all_categories()
+    assert len(adapter.requests) == 1
+
+    # A write by one identity removes the persisted responses of every identity
+    client.classic_api_request("put", "categories/id/1", data="<category/>")
+    client, adapter = make_client(policy, identity="auditor")
+    client.classic_api.list_all_categories()
+    assert len(adapter.requests) == 1
+
+
+@pytest.mark.parametrize(
+    "corruption",
+    [
+        lambda data: data.pop("content"),
+        lambda data: data.update(headers=["ETag"]),
+        lambda data: data.update(content="not base64!"),
+        lambda data: data.update(stored_at=None),
+    ],
+)
+def test_cache_directory_corrupt_entry(tmp_path, corruption):
+    policy = CachePolicy(ttl=60, directory=tmp_path)
+    make_client(policy)[0].classic_api.list_all_categories()
+
+    (entry_path,) = tmp_path.rglob("*.json")
+    data = json.loads(entry_path.read_text())
+    corruption(data)
+    entry_path.write_text(json.dumps(data))
+
+    # A corrupt entry is a miss and is replaced by the new response
+    client, adapter = make_client(policy)
+    assert client.classic_api.list_all_categories()[0].name == "Apps"
+    assert len(adapter.requests) == 1
+    assert json.loads(entry_path.read_text())["content"]
+
+
+def test_cache_directory_failed_write(tmp_path, monkeypatch):
+    def fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("src.jamf_pro_sdk.clients.cache.os.replace", fail)
+    client, _ = make_client(CachePolicy(ttl=60, directory=tmp_path))
+    client.classic_api.list_all_categories()
+    assert [p for p in tmp_path.rglob("*") if p.is_file()] == []
@@ -0,0 +1,83 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from src.jamf_pro_sdk.clients import JamfProClient
+from src.jamf_pro_sdk.clients.concurrency import RequestCoalescer
+from src.jamf_pro_sdk.models.client import SessionConfig
+
+from tests.unit.utils import MockAdapter, StaticCredentialsProvider
+
+
+@pytest.fixture
+def release():
+    return threading.Event()
+
+
+@pytest.fixture
+def client(release):
+    def handler(request):
+        release.wait(5)
+        return 200, {"category": {"id": 1, "name": "Apps"}}, {}
+
+    client = JamfProClient(
+        server="jamf.example.org",
+        credentials=StaticCredentialsProvider(),
+        session_config=SessionConfig(coalesce_requests=True, max_concurrency=10),
+    )
+    client.session.mount("https://", MockAdapter(handler))
+    return client
+
+
+def test_identical_gets_are_coalesced(client, release):
+    adapter = client.session.get_adapter("https://jamf.example.org")
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = [
+            executor.submit(client.classic_api.get_category_by_id, 1 if i < 4 else 2)
+            for i in range(6)
+        ]
+        time.sleep(0.2)
+        release.set()
+        categories = [f.result() for f in futures]
+
+    assert all(c.name == "Apps" for c in categories)
+    assert sorted(r.url.rsplit("/", 1)[1] for r in adapter.requests) == ["1", "2"]
+    assert client.request_coalescer.in_flight == 0
+
+
+def test_writes_are_not_coalesced(client, release):
+    release.set()
+    adapter = client.session.get_adapter("https://jamf.example.org")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(
+            executor.map(
+                lambda _: client.classic_api_request("put", "categories/id/1", data="<category/>"),
+                range(3),
+            )
+        )
+    assert len(adapter.requests) == 3
+
+
+def test_coalescer_shares_exceptions():
+    coalescer = RequestCoalescer()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def send():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        raise ConnectionError("failed")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(coalescer.call, "key", send)
+        started.wait(5)
+        follower = executor.submit(coalescer.call, "key", send)
+        time.sleep(0.1)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(ConnectionError):
+                future.result()
+
+    assert len(calls) == 1
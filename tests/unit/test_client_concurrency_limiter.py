@@ -0,0 +1,96 @@
+import time
+
+from src.jamf_pro_sdk.clients import JamfProClient
+from src.jamf_pro_sdk.clients.concurrency import AdaptiveConcurrencyLimiter
+from src.jamf_pro_sdk.helpers import parse_retry_after
+from src.jamf_pro_sdk.models.client import RetryPolicy, SessionConfig
+
+from tests.unit.utils import MockAdapter, StaticCredentialsProvider
+
+
+def complete_round(limiter: AdaptiveConcurrencyLimiter):
+    started = [limiter.acquire() for _ in range(limiter.limit)]
+    for i in started:
+        limiter.release(i)
+
+
+def test_limiter_additive_increase():
+    # Latencies here are only timing noise: do not let them hold the limit
+    limiter = AdaptiveConcurrencyLimiter(max_limit=4, initial_limit=1, latency_tolerance=1e9)
+    for expected in (2, 3, 4, 4):
+        complete_round(limiter)
+        assert limiter.limit == expected
+    assert limiter.in_flight == 0
+
+
+def test_limiter_multiplicative_decrease_once_per_round():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=8)
+    started = [limiter.acquire() for _ in range(8)]
+
+    # Every operation already running is throttled, but the limit only halves once
+    for i in started:
+        limiter.release(i, throttled=True)
+    assert limiter.limit == 4
+
+    limiter.release(limiter.acquire(), throttled=True)
+    assert limiter.limit == 2
+
+
+def test_limiter_holds_for_retry_after():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=2, initial_limit=2)
+    limiter.release(limiter.acquire(), retry_after=0.2)
+
+    start = time.monotonic()
+    limiter.release(limiter.acquire())
+    assert time.monotonic() - start >= 0.15
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+def test_limiter_does_not_sample_failed_operations():
+    client = JamfProClient(
+        server="jamf.example.org",
+        credentials=StaticCredentialsProvider(),
+        session_config=SessionConfig(max_concurrency=4, adaptive_concurrency=True),
+    )
+
+    def handler(i):
+        raise ValueError(i)
+
+    results = list(client.concurrent_api_requests(handler, range(8), return_exceptions=True))
+    assert all(isinstance(r, ValueError) for r in results)
+    assert client.concurrency_limiter.p95_latency is None
+    assert client.concurrency_limiter.in_flight == 0
+
+
+def test_limiter_observes_retried_attempts():
+    client = JamfProClient(
+        server="jamf.example.org",
+        credentials=StaticCredentialsProvider(),
+        session_config=SessionConfig(
+            max_concurrency=8,
+            adaptive_concurrency=True,
+            retry_policy=RetryPolicy(backoff_factor=0, jitter=False, budget_min_retries=100),
+        ),
+    )
+    throttled = set()
+
+    def handler(request):
+        # The first request for every other category is throttled and succeeds when retried
+        category_id = int(request.url.rsplit("/", 1)[1])
+        if category_id % 2 == 0 and category_id not in throttled:
+            throttled.add(category_id)
+            return 429, None, {"Retry-After": "0"}
+        return 200, {"category": {"id": category_id, "name": "Apps"}}, {}
+
+    client.session.mount("https://", MockAdapter(handler))
+    results = list(client.concurrent_api_requests(client.classic_api.get_category_by_id, range(16)))
+
+    assert all(c.name == "Apps" for c in results)
+    assert client.concurrency_limiter.limit < 4
+    assert client.concurrency_limiter.in_flight == 0
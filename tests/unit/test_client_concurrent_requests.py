@@ -0,0 +1,79 @@
+import threading
+
+import pytest
+from src.jamf_pro_sdk.clients import JamfProClient
+from src.jamf_pro_sdk.clients.auth import ApiClientCredentialsProvider
+from src.jamf_pro_sdk.models.client import SessionConfig
+
+
+@pytest.fixture
+def client():
+    return JamfProClient(
+        server="jamf.example.org",
+        credentials=ApiClientCredentialsProvider("client_id", "client_secret"),
+        session_config=SessionConfig(max_concurrency=4),
+    )
+
+
+def test_concurrent_requests_ordered(client):
+    results = client.concurrent_api_requests(lambda i: i * 2, range(20))
+    assert list(results) == [i * 2 for i in range(20)]
+
+
+def test_concurrent_requests_unpacks_dict_arguments(client):
+    results = client.concurrent_api_requests(
+        lambda a, b: a + b, [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+    )
+    assert list(results) == [3, 7]
+
+
+def test_concurrent_requests_streams_before_all_complete(client):
+    release = threading.Event()
+
+    def handler(i):
+        if i == 1:
+            assert release.wait(timeout=5)
+        return i
+
+    results = client.concurrent_api_requests(handler, [0, 1], ordered=False)
+
+    # The first result is yielded while the second operation is still blocked
+    assert next(results) == 0
+    release.set()
+    assert list(results) == [1]
+
+
+def test_concurrent_requests_exceptions(client):
+    def handler(i):
+        if i % 2:
+            raise ValueError(i)
+        return i
+
+    results = list(client.concurrent_api_requests(handler, range(4), return_exceptions=True))
+    assert results[0] == 0 and results[2] == 2
+    assert isinstance(results[1], ValueError) and isinstance(results[3], ValueError)
+
+    results = list(client.concurrent_api_requests(handler, range(4), return_exceptions=False))
+    assert results == [0, 2]
+
+
+def test_concurrent_requests_bounded_in_flight(client):
+    # max_concurrency (4) * max_in_flight_factor (2)
+    max_in_flight = 8
+    consumed = []
+
+    def arguments():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    results = client.concurrent_api_requests(lambda i: i, arguments())
+    assert next(results) == 0
+    assert len(consumed) <= max_in_flight + 1
+
+    assert list(results) == list(range(1, 100))
+
+
+def test_concurrent_requests_rejects_empty_window(client):
+    with pytest.raises(ValueError):
+        list(client.concurrent_api_requests(lambda i: i, range(4), max_in_flight=0))
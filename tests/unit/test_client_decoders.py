@@ -0,0 +1,67 @@
+import json
+
+import pytest
+from src.jamf_pro_sdk.clients import JamfProClient
+from src.jamf_pro_sdk.clients.decoders import JsonDecoder
+from src.jamf_pro_sdk.models.classic.categories import ClassicCategoriesItem, ClassicCategory
+from src.jamf_pro_sdk.models.client import SessionConfig
+from src.jamf_pro_sdk.models.pro.computers import Computer
+
+from tests.unit.utils import MockAdapter, StaticCredentialsProvider
+
+BACKENDS = ["stdlib", "pydantic", "orjson"]
+
+PAGE = json.dumps(
+    {"totalCount": 2, "results": [{"id": "1", "udid": "a"}, {"id": "2", "udid": "b"}]}
+).encode()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_decoder_validate(backend):
+    decoder = JsonDecoder(backend)
+
+    category = decoder.validate(
+        ClassicCategory, b'{"category": {"id": 1, "name": "Test", "priority": 9}}', root="category"
+    )
+    assert category == ClassicCategory(id=1, name="Test", priority=9)
+
+    categories = decoder.validate_list(
+        ClassicCategoriesItem, b'{"categories": [{"id": 1, "name": "Test"}]}', root="categories"
+    )
+    assert categories == [ClassicCategoriesItem(id=1, name="Test")]
+
+    # Only the root member is parsed as the model
+    category = decoder.validate(
+        ClassicCategory, b'{"size": 1, "category": {"id": 1, "name": "Test"}}', root="category"
+    )
+    assert category == ClassicCategory(id=1, name="Test")
+    categories = decoder.validate_list(
+        ClassicCategoriesItem, b'{"size": 1, "categories": [{"id": 1}]}', root="categories"
+    )
+    assert categories == [ClassicCategoriesItem(id=1)]
+
+    total_count, results = decoder.validate_page(Computer, PAGE)
+    assert total_count == 2
+    assert [c.id for c in results] == ["1", "2"]
+    assert decoder.validate_page(None, PAGE)[1][0] == {"id": "1", "udid": "a"}
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_client_json_backend(backend):
+    client = JamfProClient(
+        server="jamf.example.org",
+        credentials=StaticCredentialsProvider(),
+        session_config=SessionConfig(json_backend=backend),
+    )
+    client.session.mount(
+        "https://",
+        MockAdapter(lambda r: (200, {"category": {"id": 1, "name": "Test", "priority": 9}}, {})),
+    )
+
+    assert client.classic_api.get_category_by_id(1).name == "Test"
+    results = client.concurrent_api_requests(
+        lambda i: client.classic_api_request("get", f"categories/id/{i}"),
+        [1, 2],
+        return_model=ClassicCategory,
+    )
+    assert [c.priority for c in results] == [9, 9]
@@ -0,0 +1,88 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from src.jamf_pro_sdk.clients import JamfProClient, jcds2
+from src.jamf_pro_sdk.clients.jcds2 import FileUpload, JCDS2FileExistsError
+
+from tests.unit.utils import MockAdapter, StaticCredentialsProvider, package_record
+
+PACKAGES = [
+    package_record("1", "Tool", "tool.pkg"),
+    package_record("2", "My App", 'My "App" 1.0.pkg'),
+    package_record("3", "Tool Beta", "tool.pkg.beta"),
+]
+
+
+@pytest.fixture
+def client():
+    def handler(request):
+        params = {k: v[0] for k, v in parse_qs(urlparse(request.url).query).items()}
+        # Match the quoted fileName value as a prefix to simulate a wildcard match
+        value = params["filter"].split("==", 1)[1][1:-1].replace('\\"', '"')
+        results = [p for p in PACKAGES if p["fileName"].startswith(value)]
+        return 200, {"totalCount": len(results), "results": results}, {}
+
+    client = JamfProClient(server="jamf.example.org", credentials=StaticCredentialsProvider())
+    client.session.mount("https://", MockAdapter(handler))
+    return client
+
+
+def test_find_package_by_file_name(client):
+    adapter = client.session.get_adapter("https://jamf.example.org")
+
+    assert client.jcds2.find_package_by_file_name("tool.pkg").id == "1"
+    assert client.jcds2.find_package_by_file_name('My "App" 1.0.pkg').packageName == "My App"
+    assert client.jcds2.find_package_by_file_name("tool") is None
+
+    assert len(adapter.requests) == 3
+    assert all(urlparse(r.url).path == "/api/v1/packages" for r in adapter.requests)
+    query = parse_qs(urlparse(adapter.requests[1].url).query)
+    assert query["filter"] == ['fileName=="My \\"App\\" 1.0.pkg"']
+
+
+def test_upload_file_exists(client, tmp_path):
+    pytest.importorskip("boto3")
+    path = tmp_path / "tool.pkg"
+    path.write_bytes(b"pkg")
+    with pytest.raises(JCDS2FileExistsError, match=r"package \(1\) 'Tool'"):
+        client.jcds2.upload_file(path)
+
+
+@pytest.fixture
+def file_upload(tmp_path, monkeypatch):
+    monkeypatch.setattr(jcds2, "CHUNK_SIZE", 10)
+    path = tmp_path / "app.pkg"
+    path.write_bytes(bytes(range(25)))
+    return FileUpload(path)
+
+
+def test_chunk_reader(file_upload):
+    assert file_upload.total_chunks == 3
+    with pytest.raises(RuntimeError):
+        file_upload.chunk_reader(0)
+
+    with file_upload:
+        with file_upload.chunk_reader(2) as reader:
+            assert len(reader) == 5
+            assert reader.read(3) == bytes([20, 21, 22])
+            assert reader.tell() == 3
+            assert reader.read() == bytes([23, 24])
+            assert reader.read() == b""
+            assert reader.seek(-2, io.SEEK_END) == 3
+            assert reader.read() == bytes([23, 24])
+            reader.seek(0)
+            assert reader.read() == bytes(range(20, 25))
+        assert reader.closed
+
+        with pytest.raises(ValueError):
+            file_upload.chunk_reader(3)
+
+        # Readers over the same mapping are independent
+        def read(chunk_number):
+            with file_upload.chunk_reader(chunk_number) as reader:
+                return reader.read()
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            assert b"".join(executor.map(read, [0, 1, 2])) == bytes(range(25))
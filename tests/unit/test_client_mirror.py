@@ -0,0 +1,132 @@
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from src.jamf_pro_sdk.clients import JamfProClient
+from src.jamf_pro_sdk.clients.mirror import InventoryMirror
+from src.jamf_pro_sdk.models.client import SessionConfig
+
+from tests.unit.utils import MockAdapter, StaticCredentialsProvider, package_record
+
+
+def page(results, params):
+    page, page_size = int(params["page"]), int(params["page-size"])
+    return {
+        "totalCount": len(results),
+        "results": results[page * page_size : (page + 1) * page_size],
+    }
+
+
+class JamfPro:
+    """A fake Jamf Pro server with a few records of every mirrored type."""
+
+    def __init__(self):
+        self.computers = [
+            {
+                "id": str(i),
+                "udid": f"udid-{i}",
+                "general": {
+                    "name": f"Mac {i}",
+                    "managementId": f"mgmt-{i}",
+                    "reportDate": f"2024-01-0{i}T00:00:00Z",
+                    "lastContactTime": f"2024-02-0{i}T12:00:00+02:00",
+                },
+                "hardware": {"serialNumber": f"C0{i}"},
+            }
+            for i in range(1, 5)
+        ]
+        self.mobile_devices = [
+            {
+                "mobileDeviceId": "7",
+                "general": {"displayName": "iPad", "udid": "udid-7"},
+                "hardware": {"serialNumber": "DMP7"},
+            }
+        ]
+        self.packages = [
+            package_record("1", "Tool", "tool.pkg"),
+            package_record("2", "App", "app.pkg"),
+        ]
+        self.groups = {1: [1, 2], 2: [2]}
+
+    def __call__(self, request):
+        url = urlparse(request.url)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        if url.path == "/api/v1/computers-inventory":
+            return 200, page(self.computers, params), {}
+        elif url.path == "/api/v2/mobile-devices/detail":
+            return 200, page(self.mobile_devices, params), {}
+        elif url.path == "/api/v1/packages":
+            return 200, page(self.packages, params), {}
+        elif url.path == "/JSSResource/computergroups":
+            groups = [{"id": i, "name": f"Group {i}", "is_smart": False} for i in self.groups]
+            return 200, {"computer_groups": groups}, {}
+        elif url.path.startswith("/JSSResource/computergroups/id/"):
+            group_id = int(url.path.rsplit("/", 1)[1])
+            group = {
+                "id": group_id,
+                "name": f"Group {group_id}",
+                "computers": [{"id": i} for i in self.groups[group_id]],
+            }
+            return 200, {"computer_group": group}, {}
+        return 404, None, {}
+
+
+@pytest.fixture
+def jamf_pro():
+    return JamfPro()
+
+
+@pytest.fixture
+def mirror(jamf_pro, tmp_path):
+    client = JamfProClient(
+        server="jamf.example.org",
+        credentials=StaticCredentialsProvider(),
+        session_config=SessionConfig(max_concurrency=2),
+    )
+    client.session.mount("https://", MockAdapter(jamf_pro))
+    with InventoryMirror(client, tmp_path / "inventory.db") as mirror:
+        yield mirror
+
+
+def test_refresh_and_query(mirror):
+    results = mirror.refresh()
+    assert {k: v.total for k, v in results.items()} == {
+        "computers": 4,
+        "mobile_devices": 1,
+        "packages": 2,
+        "computer_groups": 2,
+    }
+
+    assert mirror.get_computer(2).general.name == "Mac 2"
+    assert [c.id for c in mirror.find_computers(serial_number="C03")] == ["3"]
+    assert [c.id for c in mirror.find_computers(management_id="mgmt-4")] == ["4"]
+
+    # Timestamps are compared in UTC: Mac 2 last checked in at 10:00 UTC
+    since = datetime(2024, 2, 2, 10, 0, tzinfo=timezone.utc)
+    assert [c.id for c in mirror.find_computers(last_contact_time__gte=since)] == ["2", "3", "4"]
+    assert [c.id for c in mirror.find_computers(order_by="-report_date")] == ["4", "3", "2", "1"]
+
+    assert mirror.find_mobile_devices(udid="udid-7")[0].hardware.serialNumber == "DMP7"
+    assert [p.id for p in mirror.find_packages(file_name__like="%.pkg", order_by="file_name")] == [
+        "2",
+        "1",
+    ]
+    assert [g.name for g in mirror.find_computer_groups(name="Group 2")] == ["Group 2"]
+    assert mirror.computer_group_ids(2) == [1, 2]
+
+    with pytest.raises(ValueError):
+        mirror.find_computers(hostname="Mac 1")
+
+
+def test_refresh_is_incremental(mirror, jamf_pro, tmp_path):
+    mirror.refresh()
+    jamf_pro.packages.pop()
+    del jamf_pro.groups[2]
+
+    results = mirror.refresh()
+    assert (results["packages"].removed, results["packages"].total) == (1, 1)
+    assert results["computer_groups"].total == 1
+
+    with InventoryMirror(mirror.client, tmp_path / "inventory.db") as reopened:
+        assert reopened.computers.watermark == datetime(2024, 1, 4, tzinfo=timezone.utc)
+        assert len(reopened.find_computers()) == 4
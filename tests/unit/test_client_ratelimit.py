@@ -0,0 +1,57 @@
+import time
+
+import pytest
+from src.jamf_pro_sdk.clients import JamfProClient
+from src.jamf_pro_sdk.clients.ratelimit import (
+    FileTokenBucketRateLimiter,
+    TokenBucketRateLimiter,
+)
+from src.jamf_pro_sdk.models.client import SessionConfig
+
+from tests.unit.utils import StaticCredentialsProvider
+
+
+def timed_acquires(limiters, count: int) -> float:
+    start = time.monotonic()
+    for i in range(count):
+        limiters[i % len(limiters)].acquire()
+    return time.monotonic() - start
+
+
+def test_token_bucket_burst_then_rate():
+    limiter = TokenBucketRateLimiter(rate=20, burst=5)
+    assert timed_acquires([limiter], 5) < 0.05
+    # The bucket is empty: 4 more requests at 20/s
+    assert timed_acquires([limiter], 4) >= 0.15
+
+
+def test_file_token_bucket_shared_between_limiters(tmp_path):
+    path = tmp_path / "ratelimit.json"
+    limiters = [FileTokenBucketRateLimiter(path, rate=20, burst=2) for _ in range(2)]
+    assert timed_acquires(limiters, 2) < 0.05
+    assert timed_acquires(limiters, 4) >= 0.15
+
+
+def test_file_token_bucket_unsupported_platform(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.jamf_pro_sdk.clients.ratelimit.FCNTL_IS_AVAILABLE", False)
+    with pytest.raises(RuntimeError, match="not supported on this platform"):
+        FileTokenBucketRateLimiter(tmp_path / "ratelimit.json", rate=10)
+
+
+def test_client_rate_limiter_from_session_config(tmp_path):
+    client = JamfProClient(
+        server="jamf.example.org",
+        credentials=StaticCredentialsProvider(),
+        session_config=SessionConfig(rate_limit=10),
+    )
+    assert isinstance(client.rate_limiter, TokenBucketRateLimiter)
+    assert client.rate_limiter.burst == 10
+
+    client = JamfProClient(
+        server="jamf.example.org",
+        credentials=StaticCredentialsProvider(),
+        session_config=SessionConfig(
+            rate_limit=10, rate_limit_burst=1, rate_limit_file=tmp_path / "limit"
+        ),
+    )
+    assert isinstance(client.rate_limiter, FileTokenBucketRateLimiter)
@@ -0,0 +1,78 @@
+import pytest
+import requests
+from src.jamf_pro_sdk.clients import JamfProClient
+from src.jamf_pro_sdk.clients.retry import RetryHandler
+from src.jamf_pro_sdk.models.client import RetryPolicy, SessionConfig
+
+from tests.unit.utils import MockAdapter, StaticCredentialsProvider, mock_response
+
+NO_BACKOFF = {"backoff_factor": 0, "jitter": False}
+
+
+def responses(*status_codes, headers=None):
+    iterator = iter(status_codes)
+    return lambda: mock_response(next(iterator), headers=headers)
+
+
+def test_retry_idempotent_until_success():
+    handler = RetryHandler(RetryPolicy(**NO_BACKOFF))
+    assert handler.call(responses(503, 502, 200), method="get").status_code == 200
+
+
+def test_retry_gives_up_after_max_retries():
+    handler = RetryHandler(RetryPolicy(max_retries=2, **NO_BACKOFF))
+    assert handler.call(responses(500, 500, 500, 200), method="get").status_code == 500
+
+
+def test_retry_non_idempotent_methods():
+    handler = RetryHandler(RetryPolicy(**NO_BACKOFF))
+    assert handler.call(responses(500, 200), method="post").status_code == 500
+    assert handler.call(responses(429, 200), method="post").status_code == 200
+
+
+def test_retry_exceptions():
+    handler = RetryHandler(RetryPolicy(**NO_BACKOFF))
+    attempts = []
+
+    def operation():
+        attempts.append(1)
+        raise requests.ConnectionError()
+
+    with pytest.raises(requests.ConnectionError):
+        handler.call(operation, method="post")
+    assert len(attempts) == 1
+
+    with pytest.raises(requests.ConnectionError):
+        handler.call(operation, method="get")
+    assert len(attempts) == 1 + 4
+
+
+def test_retry_after():
+    policy = RetryPolicy(retry_after_max=10, **NO_BACKOFF)
+    assert policy.backoff(1, retry_after=5) == 5
+
+    handler = RetryHandler(policy)
+    resp = handler.call(responses(503, 200, headers={"Retry-After": "60"}), method="get")
+    assert resp.status_code == 503
+
+
+def test_retry_budget():
+    handler = RetryHandler(RetryPolicy(budget_min_retries=2, budget_ratio=0, **NO_BACKOFF))
+    assert handler.call(responses(503, 503, 200), method="get").status_code == 200
+    # The budget is spent
+    assert handler.call(responses(503, 200), method="get").status_code == 503
+
+
+def test_client_request_retries_with_new_token():
+    client = JamfProClient(
+        server="jamf.example.org",
+        credentials=StaticCredentialsProvider(),
+        session_config=SessionConfig(retry_policy=RetryPolicy(**NO_BACKOFF)),
+    )
+    status_codes = iter([504, 200])
+    adapter = MockAdapter(lambda r: (next(status_codes), {"categories": []}, {}))
+    client.session.mount("https://", adapter)
+
+    assert client.classic_api.list_all_categories() == []
+    assert len(adapter.requests) == 2
+    assert all(r.headers["Authorization"] == "Bearer abc123" for r in adapter.requests)
@@ -0,0 +1,128 @@
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from src.jamf_pro_sdk.clients import JamfProClient
+from src.jamf_pro_sdk.clients.sync import ComputerInventorySync, JsonSnapshotStore
+from src.jamf_pro_sdk.models.client import SessionConfig
+
+from tests.unit.utils import MockAdapter, StaticCredentialsProvider
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class Inventory:
+    """A fake computer inventory endpoint supporting ``id`` sorting, and ``id>`` and
+    ``general.reportDate>=`` filters.
+    """
+
+    def __init__(self, count: int):
+        self.computers = {str(i): START + timedelta(hours=i) for i in range(count)}
+        self.requests = []
+        self.after_request: Optional[Callable[[], None]] = None
+
+    def __call__(self, request):
+        params = {k: v[0] for k, v in parse_qs(urlparse(request.url).query).items()}
+        self.requests.append(params)
+        assert params["sort"] == "id:asc"
+
+        records = sorted(self.computers.items(), key=lambda i: int(i[0]))
+        for expression in params.get("filter", "").strip("()").split(");"):
+            if expression.startswith("general.reportDate>="):
+                since = datetime.fromisoformat(expression.split(">=")[1].replace("Z", "+00:00"))
+                records = [i for i in records if i[1] >= since]
+            elif expression.startswith("id>"):
+                records = [i for i in records if int(i[0]) > int(expression[3:])]
+
+        page, page_size = int(params["page"]), int(params["page-size"])
+        response = {
+            "totalCount": len(records),
+            "results": [
+                {"id": i, "general": {"name": f"Mac {i}", "reportDate": d.isoformat()}}
+                for i, d in records[page * page_size : (page + 1) * page_size]
+            ],
+        }
+        if self.after_request:
+            self.after_request()
+        return 200, response, {}
+
+
+@pytest.fixture
+def inventory():
+    return Inventory(count=12)
+
+
+@pytest.fixture
+def client(inventory):
+    client = JamfProClient(
+        server="jamf.example.org",
+        credentials=StaticCredentialsProvider(),
+        session_config=SessionConfig(max_concurrency=2),
+    )
+    client.session.mount("https://", MockAdapter(inventory))
+    return client
+
+
+def test_incremental_sync(client, inventory, tmp_path):
+    path = tmp_path / "computers.json"
+    sync = ComputerInventorySync(client, JsonSnapshotStore(path), overlap=timedelta(0))
+
+    result = sync.sync()
+    assert (result.updated, result.total) == (12, 12)
+    assert result.watermark == START + timedelta(hours=11)
+    assert "filter" not in inventory.requests[0]
+
+    inventory.computers["3"] = START + timedelta(hours=20)
+    inventory.computers["12"] = START + timedelta(hours=21)
+
+    # A new run loads the snapshot from disk and only requests newer records
+    store = JsonSnapshotStore(path)
+    result = ComputerInventorySync(client, store, overlap=timedelta(0)).sync()
+    assert inventory.requests[-1]["filter"] == "general.reportDate>=2024-01-01T11:00:00Z"
+    assert (result.updated, result.total) == (3, 13)
+    assert result.watermark == START + timedelta(hours=21)
+    assert store.get("3")["general"]["reportDate"] == "2024-01-01T20:00:00Z"
+
+
+def test_sync_prune(client, inventory, tmp_path):
+    store = JsonSnapshotStore(tmp_path / "computers.json")
+    ComputerInventorySync(client, store).sync()
+
+    del inventory.computers["5"]
+    result = ComputerInventorySync(client, store).sync(prune=True)
+    assert (result.removed, result.total) == (1, 11)
+    assert store.get("5") is None
+
+
+def test_sync_invalid_watermark_field(client, tmp_path):
+    with pytest.raises(ValueError):
+        ComputerInventorySync(
+            client, JsonSnapshotStore(tmp_path / "c.json"), watermark_field="general.name"
+        )
+
+
+def test_sync_records_changing_during_sync(client, inventory, tmp_path):
+    def submit_inventory():
+        # A computer on the first page submits inventory while the sync is paging
+        inventory.computers["0"] = START + timedelta(hours=30)
+        inventory.after_request = None
+
+    inventory.after_request = submit_inventory
+    sync = ComputerInventorySync(
+        client, JsonSnapshotStore(tmp_path / "computers.json"), page_size=4
+    )
+    result = sync.sync()
+    assert (result.updated, result.total) == (12, 12)
+    # Records are paged by ID, so the change does not shift the pages
+    assert all("id>" in r["filter"] for r in inventory.requests[1:])
+
+    # The change is picked up by the next sync
+    sync.sync()
+    assert sync.store.get("0")["general"]["reportDate"] == "2024-01-02T06:00:00Z"
+
+
+def test_sync_watermark_not_after_start(client, inventory, tmp_path):
+    inventory.computers["3"] = datetime(2100, 1, 1, tzinfo=timezone.utc)
+    result = ComputerInventorySync(client, JsonSnapshotStore(tmp_path / "computers.json")).sync()
+    assert result.watermark <= datetime.now(timezone.utc)
@@ -0,0 +1,49 @@
+import itertools
+
+import pytest
+from src.jamf_pro_sdk.clients.pro_api.pagination import Page, Paginator, plan_pages
+
+
+def pages_with_results(total_count, page_size, start_page, end_page):
+    """Find the pages holding results by placing every result on its page."""
+    pages = {i // page_size for i in range(total_count)}
+    return sorted(p for p in pages if p >= start_page and (end_page is None or p <= end_page))
+
+
+def test_plan_pages_matches_results():
+    for args in itertools.product(range(0, 24), range(1, 8), range(0, 6), [None, *range(0, 6)]):
+        assert list(plan_pages(*args)) == pages_with_results(*args), args
+
+
+def test_plan_pages_large_values():
+    assert plan_pages(100_001, 2000) == range(0, 51)
+    assert plan_pages(100_000, 2000, start_page=10, end_page=10) == range(10, 11)
+
+
+def test_plan_pages_invalid_page_size():
+    with pytest.raises(ValueError):
+        plan_pages(10, 0)
+
+
+@pytest.mark.parametrize(
+    "start_page,end_page,expected",
+    [
+        (0, None, [1, 2, 3, 4]),
+        (0, 0, []),
+        (2, 3, [3]),
+        (3, None, [4]),
+        (4, None, []),
+        (1, 10, [2, 3, 4]),
+    ],
+)
+def test_paginator_remaining_pages(start_page, end_page, expected):
+    paginator = Paginator(
+        api_client=None,
+        resource_path="v1/computers-inventory",
+        return_model=None,
+        start_page=start_page,
+        end_page=end_page,
+        page_size=10,
+    )
+    first_page = Page(page=start_page, page_count=10, total_count=45, results=[None] * 10)
+    assert list(paginator._remaining_pages(first_page)) == expected
@@ -0,0 +1,306 @@
+import operator
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+from src.jamf_pro_sdk.clients import JamfProClient
+from src.jamf_pro_sdk.clients.decoders import JsonDecoder
+from src.jamf_pro_sdk.clients.pro_api.pagination import (
+    KeysetPaginator,
+    Paginator,
+    PartitionedPaginator,
+)
+from src.jamf_pro_sdk.models.client import SessionConfig
+from src.jamf_pro_sdk.models.lazy import LazyModel
+from src.jamf_pro_sdk.models.pro.computers import Computer
+
+from tests.unit.utils import MockAdapter, StaticCredentialsProvider
+
+TOTAL_COUNT = 25
+
+
+def query_params(request) -> dict:
+    return {k: v[0] for k, v in parse_qs(urlparse(request.url).query).items()}
+
+
+def computers_inventory(request, total_count=TOTAL_COUNT):
+    params = query_params(request)
+    page, page_size = int(params["page"]), int(params["page-size"])
+    ids = range(page * page_size, min((page + 1) * page_size, total_count))
+    return (
+        200,
+        {"totalCount": total_count, "results": [{"id": str(i), "udid": str(i)} for i in ids]},
+        {},
+    )
+
+
+@pytest.fixture
+def client():
+    client = JamfProClient(
+        server="jamf.example.org",
+        credentials=StaticCredentialsProvider(),
+        session_config=SessionConfig(max_concurrency=3),
+    )
+    client.session.mount("https://", MockAdapter(computers_inventory))
+    return client
+
+
+def test_get_all_pages(client):
+    computers = client.pro_api.get_computer_inventory_v1(page_size=10)
+    assert [c.id for c in computers] == [str(i) for i in range(TOTAL_COUNT)]
+
+
+def test_stream_records(client):
+    records = client.pro_api.get_computer_inventory_v1(page_size=4, stream_records=True)
+    first = next(records)
+    assert isinstance(first, Computer)
+    assert [first.id] + [c.id for c in records] == [str(i) for i in range(TOTAL_COUNT)]
+
+
+@pytest.mark.parametrize("stream_records", [False, True])
+def test_failed_page_is_raised(client, stream_records):
+    def handler(request):
+        if query_params(request)["page"] == "2":
+            return 500, {"httpStatus": 500, "errors": []}, {}
+        return computers_inventory(request)
+
+    client.session.mount("https://", MockAdapter(handler))
+    with pytest.raises(requests.HTTPError):
+        list(client.pro_api.get_computer_inventory_v1(page_size=4, stream_records=stream_records))
+
+
+def test_prefetch_bounds_pages_ahead(client):
+    page_ahead_requested = threading.Event()
+
+    def handler(request):
+        if query_params(request)["page"] == "2":
+            page_ahead_requested.set()
+        return computers_inventory(request)
+
+    adapter = MockAdapter(handler)
+    client.session.mount("https://", adapter)
+    paginator = Paginator(
+        api_client=client.pro_api,
+        resource_path="v1/computers-inventory",
+        return_model=Computer,
+        page_size=2,
+        prefetch=2,
+    )
+    pages = paginator()
+    assert [next(pages).page, next(pages).page] == [0, 1]
+    # No more pages are submitted while the generator is suspended: once the page ahead has been
+    # requested the count is final
+    assert page_ahead_requested.wait(timeout=5)
+    # The first page, the page being consumed, and one page ahead
+    assert len(adapter.requests) == 3
+
+    assert [p.page for p in pages] == list(range(2, 13))
+    pages.close()
+
+
+@pytest.mark.parametrize("prefetch", [0, -1])
+def test_prefetch_must_be_positive(client, prefetch):
+    with pytest.raises(ValueError):
+        Paginator(client.pro_api, "v1/computers-inventory", Computer, prefetch=prefetch)
+
+
+def test_lazy_validation(client):
+    computers = client.pro_api.get_computer_inventory_v1(page_size=10, lazy_validation=True)
+    assert all(isinstance(c, LazyModel) for c in computers)
+    assert [c.id for c in computers] == [str(i) for i in range(TOTAL_COUNT)]
+
+
+@pytest.mark.parametrize("backend", ["pydantic", "orjson"])
+def test_json_backends(client, backend):
+    client.pro_api.json_decoder = JsonDecoder(backend)
+    computers = client.pro_api.get_computer_inventory_v1(page_size=10)
+    assert [c.id for c in computers] == [str(i) for i in range(TOTAL_COUNT)]
+
+
+def test_process_pool_validation(client):
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        computers = client.pro_api.get_computer_inventory_v1(
+            page_size=10, validation_executor=executor
+        )
+    assert all(isinstance(c, Computer) for c in computers)
+    assert [c.id for c in computers] == [str(i) for i in range(TOTAL_COUNT)]
+
+
+@pytest.mark.parametrize(
+    "max_page_bytes, page_sizes", [(8 * 1024 * 1024, {"100", "1050"}), (9000, None)]
+)
+def test_auto_page_size(client, max_page_bytes, page_sizes):
+    adapter = MockAdapter(lambda r: computers_inventory(r, total_count=1050))
+    client.session.mount("https://", adapter)
+    paginator = Paginator(
+        api_client=client.pro_api,
+        resource_path="v1/computers-inventory",
+        return_model=Computer,
+        page_size="auto",
+        max_page_bytes=max_page_bytes,
+    )
+
+    assert [c.id for c in paginator(return_generator=False)] == [str(i) for i in range(1050)]
+
+    requested_sizes = {query_params(r)["page-size"] for r in adapter.requests}
+    if page_sizes:
+        assert requested_sizes == page_sizes
+    else:
+        assert "100" in requested_sizes and len(requested_sizes) == 2
+        assert 100 < max(int(i) for i in requested_sizes) < 1050
+
+
+def test_auto_page_size_stays_within_budget(client):
+    adapter = MockAdapter(lambda r: computers_inventory(r, total_count=250))
+    client.session.mount("https://", adapter)
+    paginator = Paginator(
+        api_client=client.pro_api,
+        resource_path="v1/computers-inventory",
+        return_model=Computer,
+        page_size="auto",
+        max_page_bytes=1000,
+    )
+
+    pages = list(paginator())
+    assert [p.page for p in pages] == list(range(len(pages)))
+    assert [c.id for p in pages for c in p.results] == [str(i) for i in range(250)]
+
+    page_size = max(int(query_params(r)["page-size"]) for r in adapter.requests[1:])
+    assert page_size < 100
+    # Requests resume from the page holding the first result not returned by the first page
+    assert min(int(query_params(r)["page"]) for r in adapter.requests[1:]) == 100 // page_size
+
+    # Streaming releases each page's results once they have been yielded
+    assert [c.id for c in paginator.records()] == [str(i) for i in range(250)]
+
+
+def test_auto_page_size_ignores_token_wait():
+    class SlowCredentialsProvider(StaticCredentialsProvider):
+        def _request_access_token(self):
+            time.sleep(0.2)
+            return super()._request_access_token()
+
+    client = JamfProClient(server="jamf.example.org", credentials=SlowCredentialsProvider())
+    adapter = MockAdapter(lambda r: computers_inventory(r, total_count=1050))
+    client.session.mount("https://", adapter)
+    paginator = Paginator(
+        api_client=client.pro_api,
+        resource_path="v1/computers-inventory",
+        return_model=Computer,
+        page_size="auto",
+        max_page_seconds=1,
+    )
+
+    assert len(paginator(return_generator=False)) == 1050
+    # Counting the token request would allow 500 results per page within the time budget
+    assert {query_params(r)["page-size"] for r in adapter.requests} == {"100", "1050"}
+
+
+def test_auto_page_size_rejects_page_range(client):
+    with pytest.raises(ValueError):
+        Paginator(client.pro_api, "v1/computers-inventory", Computer, end_page=2, page_size="auto")
+
+
+ID_OPERATORS = {">=": operator.ge, ">": operator.gt, "<": operator.lt}
+
+
+def partitioned_inventory(request, ids):
+    params = query_params(request)
+    page, page_size = int(params["page"]), int(params["page-size"])
+    matched = sorted(ids, reverse=params.get("sort") == "id:desc")
+    for op, value in re.findall(r"id(>=|<|>)(\d+)", params.get("filter", "")):
+        matched = [i for i in matched if ID_OPERATORS[op](i, int(value))]
+    return (
+        200,
+        {
+            "totalCount": len(matched),
+            "results": [
+                {"id": str(i), "udid": str(i)}
+                for i in matched[page * page_size : (page + 1) * page_size]
+            ],
+        },
+        {},
+    )
+
+
+def test_partitioned_paginator(client):
+    ids = list(range(1, 200, 3)) + list(range(1000, 1010))
+    adapter = MockAdapter(lambda request: partitioned_inventory(request, ids))
+    client.session.mount("https://", adapter)
+    paginator = PartitionedPaginator(
+        api_client=client.pro_api,
+        resource_path="v1/computers-inventory",
+        return_model=Computer,
+        partitions=4,
+        page_size=5,
+    )
+
+    pages = list(paginator())
+    assert [p.page for p in pages] == list(range(len(pages)))
+    assert [c.id for p in pages for c in p.results] == [str(i) for i in ids]
+    assert paginator(return_generator=False) == [c for p in pages for c in p.results]
+
+    page_requests = [
+        query_params(r) for r in adapter.requests if query_params(r)["page-size"] != "1"
+    ]
+    assert max(int(p["page"]) for p in page_requests) < len(ids) // 5
+    assert {p["filter"] for p in page_requests} == {
+        "id>=1;id<253",
+        "id>=253;id<505",
+        "id>=505;id<757",
+        "id>=757;id<1010",
+    }
+
+
+def test_partitioned_paginator_empty(client):
+    client.session.mount(
+        "https://", MockAdapter(lambda request: partitioned_inventory(request, []))
+    )
+    paginator = PartitionedPaginator(
+        api_client=client.pro_api, resource_path="v1/computers-inventory", return_model=Computer
+    )
+    assert paginator(return_generator=False) == []
+
+
+def test_keyset_paginator_with_changing_collection(client):
+    ids = list(range(1, 31))
+
+    def handler(request):
+        response = partitioned_inventory(request, ids)
+        # Each request deletes an early record and a record ahead of the scan, and creates one
+        ids.remove(ids[0])
+        if 20 in ids:
+            ids.remove(20)
+        ids.append(ids[-1] + 1)
+        return response
+
+    client.session.mount("https://", MockAdapter(handler))
+    paginator = KeysetPaginator(
+        api_client=client.pro_api,
+        resource_path="v1/computers-inventory",
+        return_model=Computer,
+        page_size=10,
+    )
+    pages = list(paginator())
+
+    returned = [int(c.id) for p in pages for c in p.results]
+    assert returned == sorted(set(returned))
+    assert 20 not in returned
+    assert set(range(1, 31)) - {20} <= set(returned)
+    assert [p.page for p in pages] == list(range(len(pages)))
+
+
+def test_keyset_paginator_stream_records(client):
+    ids = list(range(1, 26))
+    client.session.mount("https://", MockAdapter(lambda r: partitioned_inventory(r, ids)))
+    paginator = KeysetPaginator(
+        api_client=client.pro_api,
+        resource_path="v1/computers-inventory",
+        return_model=Computer,
+        page_size=10,
+    )
+    assert [int(c.id) for c in paginator(stream_records=True)] == ids
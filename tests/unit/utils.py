@@ -1,2 +1,95 @@
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, List, Optional
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from src.jamf_pro_sdk.clients.auth import CredentialsProvider
+from src.jamf_pro_sdk.models.client import AccessToken
+from src.jamf_pro_sdk.models.pro.packages import Package
+
+
 def remove_whitespaces_newlines(string: str):
     return "".join([i.strip() for i in string.split("\n")])
+
+
+class StaticCredentialsProvider(CredentialsProvider):
+    """Returns a fixed access token without making a request."""
+
+    def __init__(self, identity: str = "static"):
+        super().__init__()
+        self._identity = identity
+
+    def _request_access_token(self) -> AccessToken:
+        return AccessToken(
+            type="oauth",
+            token="abc123",
+            expires=datetime.now(timezone.utc) + timedelta(minutes=20),
+        )
+
+
+class MockAdapter(BaseAdapter):
+    """A ``requests`` transport adapter that returns responses from a handler function that
+    accepts the ``PreparedRequest`` and returns a ``(status_code, body, headers)`` tuple.
+    """
+
+    def __init__(self, handler: Callable[[PreparedRequest], tuple]):
+        super().__init__()
+        self.handler = handler
+        self.requests: List[PreparedRequest] = []
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        self.requests.append(request)
+        status_code, body, headers = self.handler(request)
+        return mock_response(status_code, body, headers, request)
+
+    def close(self):
+        pass
+
+
+def mock_response(
+    status_code: int, body: Any = None, headers: Optional[dict] = None, request=None
+) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = (
+        body if isinstance(body, bytes) else json.dumps(body).encode() if body is not None else b""
+    )
+    response.headers.update(headers or {})
+    response.request = request
+    response.url = request.url if request else ""
+    return response
+
+
+def package_record(package_id: str, name: str, file_name: str) -> dict:
+    """A Pro API package record with the required fields set."""
+    package = {
+        "id": package_id,
+        "packageName": name,
+        "fileName": file_name,
+        "categoryId": "-1",
+        "priority": 10,
+        "cloudTransferStatus": "READY",
+    }
+    package.update(
+        dict.fromkeys(
+            [
+                "fillUserTemplate",
+                "indexed",
+                "fillExistingUsers",
+                "swu",
+                "rebootRequired",
+                "selfHealNotify",
+                "osInstall",
+                "suppressUpdates",
+                "ignoreConflicts",
+                "suppressFromDock",
+                "suppressEula",
+                "suppressRegistration",
+            ],
+            False,
+        )
+    )
+    # The remaining fields are nullable but required
+    package.update(dict.fromkeys(Package.model_fields.keys() - package.keys()))
+    return package